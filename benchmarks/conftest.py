@@ -0,0 +1,76 @@
+"""
+Fixtures for the framework overhead benchmarks
+
+Every benchmark runs against the local stand-in site with fixed latencies, so
+differences between runs come from the framework (driver setup, waits, page
+objects), not from the real site or the network.
+"""
+import pytest
+from utils.benchmark import Benchmark
+from utils.driver_manager import DriverManager
+from utils.durations import base_nodeid
+from utils.stand_in_server import StandInServer
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from config.config import Config
+
+@pytest.fixture(scope="session")
+def stand_in_site():
+    """Session-scoped stand-in site, with page-object URLs pointed at it"""
+    server = StandInServer(port=0).start()
+    urls = {
+        (Config, 'BASE_URL'): server.url,
+        (LoginPage, 'LOGIN_URL'): f"{server.url}login",
+        (DashboardPage, 'DASHBOARD_URL'): f"{server.url}dashboard",
+        (DashboardPage, 'HOME_URL'): server.url,
+    }
+    original = {key: getattr(*key) for key in urls}
+    for (owner, name), url in urls.items():
+        setattr(owner, name, url)
+    
+    yield server
+    
+    for (owner, name), url in original.items():
+        setattr(owner, name, url)
+    server.stop()
+
+def _manager(config):
+    return DriverManager(backend=config.getoption("--driver-backend"),
+                         remote_url=config.getoption("--remote-url"))
+
+@pytest.fixture(scope="session")
+def bench_driver(request, stand_in_site):
+    """Session-scoped warm browser; benchmarks are skipped when none can start"""
+    manager = _manager(request.config)
+    try:
+        driver = manager.get_driver()
+    except Exception as e:
+        pytest.skip(f"Browser unavailable for benchmarks: {e.__class__.__name__}: {e}")
+    yield driver
+    manager.quit_driver()
+
+@pytest.fixture
+def startup_manager(request, bench_driver):
+    """Fresh driver manager for driver startup benchmarks"""
+    manager = _manager(request.config)
+    yield manager
+    manager.drain_pool()
+    manager.quit_driver()
+
+@pytest.fixture
+def logged_in(bench_driver):
+    """Warm browser logged in to the stand-in site and on the dashboard"""
+    dashboard = DashboardPage(bench_driver)
+    dashboard.navigate_to_dashboard()
+    if "login" in bench_driver.current_url:
+        assert LoginPage(bench_driver).login(fast=True), "Stand-in login failed"
+        dashboard.navigate_to_dashboard()
+    return bench_driver
+
+@pytest.fixture
+def benchmark(request):
+    """Benchmark timer; its statistics are reported and compared to the baseline"""
+    bench = Benchmark(base_nodeid(request.node.nodeid),
+                      rounds=request.config.getoption("--benchmark-rounds"))
+    request.node.benchmark = bench
+    return bench
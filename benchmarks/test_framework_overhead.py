@@ -0,0 +1,88 @@
+"""
+Framework overhead benchmarks against the local stand-in site
+
+Run with ``pytest benchmarks``; compare against ``benchmarks/baseline.json``
+and refresh it with ``--benchmark-save-baseline``.
+"""
+import os
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from utils.driver_manager import DriverManager
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+
+pytestmark = pytest.mark.benchmark
+
+# Browser startup is slow; a few rounds are enough to see a regression
+STARTUP_ROUNDS = 3
+
+class TestDriverStartup:
+    """DriverManager.get_driver with and without a warm pooled browser"""
+    
+    def test_get_driver_cold(self, benchmark, startup_manager):
+        """New browser process per call"""
+        benchmark(startup_manager.get_driver, teardown=startup_manager.quit_driver,
+                  rounds=STARTUP_ROUNDS)
+    
+    def test_get_driver_warm(self, benchmark, startup_manager):
+        """Browser taken from the pool (reset between rounds, not timed)"""
+        startup_manager.get_driver()
+        startup_manager.release_driver()
+        benchmark(startup_manager.get_driver, teardown=startup_manager.release_driver)
+
+class TestElementLookup:
+    """BasePage.find_element on the stand-in dashboard"""
+    
+    def test_find_element_hit(self, benchmark, logged_in):
+        """Element already in the DOM"""
+        page = BasePage(logged_in)
+        benchmark(page.find_element, DashboardPage.PAGE_TITLE)
+    
+    def test_find_element_rendered_late(self, benchmark, logged_in, stand_in_site):
+        """Element rendered client-side after a fixed delay (wait overhead on top of it)"""
+        page = DashboardPage(logged_in)
+        benchmark(page.find_element, DashboardPage.CARDS,
+                  setup=lambda: page.navigate_to(DashboardPage.DASHBOARD_URL))
+    
+    def test_find_element_miss(self, benchmark, logged_in):
+        """Missing element with a one second budget (shows implicit/explicit wait stacking)"""
+        page = BasePage(logged_in)
+        
+        def miss():
+            with pytest.raises(TimeoutException):
+                page.find_element((By.ID, "does-not-exist"), timeout=1)
+        
+        benchmark(miss, rounds=STARTUP_ROUNDS)
+
+class TestPageObjects:
+    """End-to-end page-object operations"""
+    
+    def test_login(self, benchmark, bench_driver):
+        """LoginPage.login from a logged-out browser, typing the credentials"""
+        login_page = LoginPage(bench_driver)
+        result = benchmark(login_page.login, setup=bench_driver.delete_all_cookies)
+        assert result, "Stand-in login failed"
+    
+    def test_login_fast(self, benchmark, bench_driver):
+        """LoginPage.login filling the form in one script"""
+        login_page = LoginPage(bench_driver)
+        result = benchmark(login_page.login, fast=True, setup=bench_driver.delete_all_cookies)
+        assert result, "Stand-in login failed"
+    
+    def test_dashboard_verify_page_loaded(self, benchmark, logged_in):
+        """DashboardPage.verify_page_loaded on a freshly loaded dashboard"""
+        dashboard = DashboardPage(logged_in)
+        result = benchmark(dashboard.verify_page_loaded, setup=dashboard.navigate_to_dashboard)
+        assert result
+    
+    def test_screenshot(self, benchmark, bench_driver):
+        """DriverManager.take_screenshot to disk"""
+        manager = DriverManager()
+        manager.driver = bench_driver
+        paths = []
+        benchmark(lambda: paths.append(manager.take_screenshot("benchmark")))
+        for path in paths:
+            if path and os.path.exists(path):
+                os.remove(path)
@@ -21,17 +21,128 @@ class Config:
     BROWSER = os.getenv('BROWSER', 'chrome').lower()
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     
+    # Driver backend settings (local or remote Selenium Grid / W3C endpoint)
+    DRIVER_BACKEND = os.getenv('DRIVER_BACKEND', 'local').lower()
+    REMOTE_URL = os.getenv('REMOTE_URL', 'http://localhost:4444')
+    # browser: new browser per test; context: one browser, a CDP browser context per test
+    DRIVER_ISOLATION = os.getenv('DRIVER_ISOLATION', 'browser').lower()
+    LOCAL_HUB_PORT = int(os.getenv('LOCAL_HUB_PORT', '4444'))
+    LOCAL_HUB_MAX_SESSIONS = int(os.getenv('LOCAL_HUB_MAX_SESSIONS', '4'))
+    # Async client (many sessions from one event loop over one connection pool)
+    ASYNC_CONCURRENCY = int(os.getenv('ASYNC_CONCURRENCY', '10'))
+    ASYNC_MAX_CONNECTIONS = int(os.getenv('ASYNC_MAX_CONNECTIONS', '50'))
+    ASYNC_REQUEST_TIMEOUT = float(os.getenv('ASYNC_REQUEST_TIMEOUT', '120'))
+    
     # Wait times
     IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '10'))
     EXPLICIT_WAIT = int(os.getenv('EXPLICIT_WAIT', '20'))
+    MAX_WAIT_SCALE = float(os.getenv('MAX_WAIT_SCALE', '2.0'))
+    # polling: WebDriverWait over HTTP; observer: in-page MutationObserver, one round trip
+    WAIT_BACKEND = os.getenv('WAIT_BACKEND', 'polling').lower()
+    
+    # Health gate settings (target probe before any browser starts)
+    HEALTH_GATE = os.getenv('HEALTH_GATE', 'abort').lower()
+    HEALTH_CHECK_TIMEOUT = float(os.getenv('HEALTH_CHECK_TIMEOUT', '5'))
+    HEALTH_CHECK_SAMPLES = int(os.getenv('HEALTH_CHECK_SAMPLES', '3'))
+    HEALTH_MAX_LATENCY = float(os.getenv('HEALTH_MAX_LATENCY', '4'))
+    HEALTH_WAIT_MULTIPLIER = float(os.getenv('HEALTH_WAIT_MULTIPLIER', '15'))
+    
+    # Retry settings (action-level retries, then test reruns on a warm driver)
+    ACTION_RETRIES = int(os.getenv('ACTION_RETRIES', '2'))
+    ACTION_RETRY_DELAY = float(os.getenv('ACTION_RETRY_DELAY', '0.25'))
+    TEST_RERUNS = int(os.getenv('TEST_RERUNS', '1'))
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))
+    
+    # Flakiness tracking (tests above threshold are run last or quarantined)
+    FLAKY_POLICY = os.getenv('FLAKY_POLICY', 'last').lower()
+    FLAKY_THRESHOLD = float(os.getenv('FLAKY_THRESHOLD', '0.2'))
+    FLAKY_MIN_RUNS = int(os.getenv('FLAKY_MIN_RUNS', '5'))
+    
+    # Locator health index (match counts, timings, fallback promotion)
+    LOCATOR_PROFILING = os.getenv('LOCATOR_PROFILING', 'false').lower() == 'true'
+    LOCATOR_DEAD_MIN_LOOKUPS = int(os.getenv('LOCATOR_DEAD_MIN_LOOKUPS', '5'))
+    
+    # Scheduling (duration-aware ordering and sharding; only applied with xdist or --shard)
+    TEST_SCHEDULE = os.getenv('TEST_SCHEDULE', 'duration').lower()
+    DEFAULT_TEST_DURATION = float(os.getenv('DEFAULT_TEST_DURATION', '10'))
+    
+    # Incremental runs (skip tests whose inputs are unchanged since a recent pass)
+    INCREMENTAL = os.getenv('INCREMENTAL', 'false').lower() == 'true'
+    INCREMENTAL_MAX_AGE_HOURS = float(os.getenv('INCREMENTAL_MAX_AGE_HOURS', '24'))
+    
+    # WebDriver command metrics (per-test round trips, 0 budget = unlimited)
+    COMMAND_METRICS = os.getenv('COMMAND_METRICS', 'true').lower() == 'true'
+    COMMAND_BUDGET = int(os.getenv('COMMAND_BUDGET', '0'))
+    
+    # Framework overhead benchmarks (against the local stand-in site)
+    STAND_IN_PORT = int(os.getenv('STAND_IN_PORT', '8765'))
+    BENCHMARK_ROUNDS = int(os.getenv('BENCHMARK_ROUNDS', '10'))
+    BENCHMARK_WARMUP = int(os.getenv('BENCHMARK_WARMUP', '1'))
+    BENCHMARK_TOLERANCE = float(os.getenv('BENCHMARK_TOLERANCE', '0.2'))
+    
+    # Latency / fault-injection proxy (JSON scenario; empty = tests talk to the target directly)
+    FAULT_SCENARIO = os.getenv('FAULT_SCENARIO', '')
+    FAULT_PROXY_PORT = int(os.getenv('FAULT_PROXY_PORT', '8766'))
+    
+    # Synthetic monitoring (python -m utils.monitor)
+    MONITOR_INTERVAL = float(os.getenv('MONITOR_INTERVAL', '300'))
+    MONITOR_JITTER = float(os.getenv('MONITOR_JITTER', '0.1'))
+    MONITOR_PORT = int(os.getenv('MONITOR_PORT', '9108'))
+    
+    # Browser memory watchdog (samples reused browsers between tests, recycles bloated ones)
+    MEMORY_WATCHDOG = os.getenv('MEMORY_WATCHDOG', 'true').lower() == 'true'
+    MEMORY_MAX_RSS_MB = float(os.getenv('MEMORY_MAX_RSS_MB', '1500'))
+    MEMORY_MAX_HEAP_MB = float(os.getenv('MEMORY_MAX_HEAP_MB', '512'))
+    MEMORY_MAX_GROWTH = float(os.getenv('MEMORY_MAX_GROWTH', '3.0'))
+    MEMORY_LEAK_SLOPE_MB = float(os.getenv('MEMORY_LEAK_SLOPE_MB', '5'))
+    MEMORY_LEAK_WINDOW = int(os.getenv('MEMORY_LEAK_WINDOW', '8'))
+    
+    # Failure-only screencast (CDP frames in a ring buffer, encoded when a test fails)
+    SCREENCAST = os.getenv('SCREENCAST', 'false').lower() == 'true'
+    SCREENCAST_SECONDS = float(os.getenv('SCREENCAST_SECONDS', '10'))
+    SCREENCAST_MAX_SIZE = int(os.getenv('SCREENCAST_MAX_SIZE', '640'))
+    SCREENCAST_QUALITY = int(os.getenv('SCREENCAST_QUALITY', '40'))
+    SCREENCAST_MAX_FRAMES = int(os.getenv('SCREENCAST_MAX_FRAMES', '200'))
+    
+    # Network trace (CDP Network events per test, HAR kept on failure or budget breach)
+    NETWORK_TRACE = os.getenv('NETWORK_TRACE', 'false').lower() == 'true'
+    NETWORK_BUDGET_KB = float(os.getenv('NETWORK_BUDGET_KB', '0'))
+    NETWORK_SLOW_REQUEST_MS = float(os.getenv('NETWORK_SLOW_REQUEST_MS', '0'))
+    
+    # Network condition profile for every test (slow-3g, fast-4g, offline, ...; empty = unthrottled)
+    NETWORK_PROFILE = os.getenv('NETWORK_PROFILE', '')
+    
+    # Seconds conftest + test modules may take to import (collection start-up budget)
+    IMPORT_TIME_BUDGET = float(os.getenv('IMPORT_TIME_BUDGET', '0.15'))
     
     # Test settings
     SCREENSHOTS_ON_FAILURE = os.getenv('SCREENSHOTS_ON_FAILURE', 'true').lower() == 'true'
     REPORT_FORMAT = os.getenv('REPORT_FORMAT', 'html')
+    # Tests per page of the static HTML report (python -m utils.report_builder)
+    REPORT_PAGE_SIZE = int(os.getenv('REPORT_PAGE_SIZE', '100'))
+    # Environment label stored with each run in the history (e.g. staging, production)
+    RUN_ENVIRONMENT = os.getenv('RUN_ENVIRONMENT', '')
     
     # Paths
     SCREENSHOTS_PATH = os.path.join(os.getcwd(), 'reports', 'screenshots')
+    SCREENCASTS_PATH = os.path.join(os.getcwd(), 'reports', 'screencasts')
+    HAR_PATH = os.path.join(os.getcwd(), 'reports', 'har')
     REPORTS_PATH = os.path.join(os.getcwd(), 'reports')
+    LOCATOR_HEALTH_PATH = os.getenv('LOCATOR_HEALTH_PATH', os.path.join(REPORTS_PATH, 'locator_health.json'))
+    FLAKINESS_DB_PATH = os.getenv('FLAKINESS_DB_PATH', os.path.join(REPORTS_PATH, 'flakiness.json'))
+    DURATIONS_PATH = os.getenv('DURATIONS_PATH', os.path.join(REPORTS_PATH, 'durations.json'))
+    SHARD_MANIFEST_PATH = os.getenv('SHARD_MANIFEST_PATH', os.path.join(REPORTS_PATH, 'shard_manifest.json'))
+    BENCHMARK_RESULTS_PATH = os.getenv('BENCHMARK_RESULTS_PATH', os.path.join(REPORTS_PATH, 'benchmark.json'))
+    BENCHMARK_BASELINE_PATH = os.getenv('BENCHMARK_BASELINE_PATH', os.path.join(os.getcwd(), 'benchmarks', 'baseline.json'))
+    INCREMENTAL_PATH = os.getenv('INCREMENTAL_PATH', os.path.join(REPORTS_PATH, 'incremental.json'))
+    NETWORK_REPORT_PATH = os.getenv('NETWORK_REPORT_PATH', os.path.join(REPORTS_PATH, 'network.json'))
+    NETWORK_PROFILE_TIMINGS_PATH = os.getenv('NETWORK_PROFILE_TIMINGS_PATH', os.path.join(REPORTS_PATH, 'network_profiles.json'))
+    MEMORY_REPORT_PATH = os.getenv('MEMORY_REPORT_PATH', os.path.join(REPORTS_PATH, 'memory.json'))
+    # Streamed per-test results (empty = no stream)
+    RESULTS_JSONL_PATH = os.getenv('RESULTS_JSONL_PATH', os.path.join(REPORTS_PATH, 'results.jsonl'))
+    STATIC_REPORT_PATH = os.getenv('STATIC_REPORT_PATH', os.path.join(REPORTS_PATH, 'site'))
+    # SQLite history of all runs, ingested from the results stream (empty = no history)
+    RUN_HISTORY_PATH = os.getenv('RUN_HISTORY_PATH', os.path.join(REPORTS_PATH, 'history.db'))
     
     @classmethod
     def create_directories(cls):
@@ -3,8 +3,29 @@ Pytest configuration and fixtures for MathsTeam regression testing
 """
 import pytest
 import os
+import sqlite3
 from datetime import datetime
 from utils.driver_manager import DriverManager
+from utils.health_check import HealthCheck
+from utils.flaky_db import FlakinessDB
+from utils.retry import (RERUN_CATEGORIES, classify_failure, drain_locator_stats,
+                         rerun_exception_names)
+from utils.locator_health import LocatorHealthIndex
+from utils.command_metrics import RECORDER, CommandReport
+from utils.durations import DurationStore, base_nodeid
+from utils.shared_session import ReadonlySession
+from utils.incremental import IncrementalStore, InputFingerprinter, ResponseFingerprints, site_urls
+from utils.benchmark import BenchmarkReport
+from utils.memory_watchdog import MemoryReport
+from utils.screencast import Screencast
+from utils.result_sink import ResultSink
+from utils.run_history import RunHistory
+from utils.network_trace import NetworkReport, budget_breach, summarize, write_har
+from utils.network_profiles import (BASELINE, PAGE_TIMING_SCRIPT, NetworkProfile,
+                                    ProfileTimings, get_profile)
+from utils.scheduler import (assign_shards, build_units, group_name, lpt_order,
+                             parse_shard, shared_scope_node, write_manifest)
+from pages.base_page import BasePage
 from config.config import Config
 
 def pytest_configure(config):
@@ -12,27 +33,202 @@ def pytest_configure(config):
     Config.create_directories()
 
 @pytest.fixture(scope="session")
-def driver_manager():
+def local_hub(request):
+    """Session-scoped local stand-in hub, started only with --local-hub"""
+    if not request.config.getoption("--local-hub"):
+        yield None
+        return
+    
+    from utils.local_hub import LocalHub
+    hub = LocalHub(port=0).start()
+    yield hub
+    hub.stop()
+
+@pytest.fixture(scope="session")
+def driver_manager(request, local_hub):
     """Session-scoped driver manager fixture"""
-    manager = DriverManager()
+    backend = request.config.getoption("--driver-backend")
+    remote_url = request.config.getoption("--remote-url")
+    
+    if local_hub:
+        backend, remote_url = 'remote', local_hub.url
+    
+    manager = DriverManager(backend=backend, remote_url=remote_url)
     yield manager
-    # Cleanup is handled by individual test fixtures
+    # Cleanup is handled by individual test fixtures; only warm drivers remain
+    manager.drain_pool()
+    manager.quit_context_host()
+
+@pytest.fixture(scope="class")
+def readonly_session(request, driver_manager):
+    """Class-scoped driver shared by the class's tests marked readonly_session"""
+    session = ReadonlySession(driver_manager, request.config.getoption("--base-url"))
+    yield session
+    session.close()
+    if session.reused or session.recycled:
+        print(f"\nreadonly_session {request.node.nodeid}: driver reused {session.reused}x, "
+              f"recycled {len(session.recycled)}x")
+
+def _sample_memory(request, driver_manager, driver_instance):
+    """Sample the memory of a browser that outlives the test (read by the watchdog when releasing it)"""
+    if not Config.MEMORY_WATCHDOG:
+        return
+    try:
+        sample, verdict = driver_manager.watchdog.check(driver_instance)
+    except Exception as e:
+        print(f"Warning: Could not sample browser memory: {e}")
+        return
+    request.node.browser_memory = dict(sample.as_dict(), verdict=verdict)
+
+def _record_artifact(request, kind, path):
+    """Attach a file written for the test to its result record"""
+    if path:
+        request.node.artifacts = (getattr(request.node, "artifacts", None) or []) + [
+            {"kind": kind, "path": path}]
+
+def _start_screencast(request, driver_instance):
+    """Buffer the test's last seconds of screen (with --screencast, local Chrome/Edge)"""
+    if not request.config.getoption("--screencast") or not Screencast.supported(driver_instance):
+        return None
+    try:
+        return Screencast(driver_instance).start()
+    except Exception as e:
+        print(f"Warning: Could not start screencast: {e}")
+        return None
+
+def _finish_screencast(request, screencast, failed):
+    """Stop the screencast and encode its buffer only if the test failed"""
+    if screencast is None:
+        return
+    screencast.stop()
+    if failed:
+        path = screencast.save(f"FAILED_{pytest.current_test_name}")
+        if path:
+            print(f"Screencast of the failure: {path}")
+            _record_artifact(request, "screencast", path)
+    screencast.discard()
+
+def _finish_network_trace(request, recorder, failed):
+    """Summarize the test's requests; keep a HAR file on failure or network budget breach"""
+    if recorder is None:
+        return
+    try:
+        entries = recorder.entries()
+    except Exception as e:
+        print(f"Warning: Could not read network trace: {e}")
+        return
+    request.node.network_resources = summarize(entries)
+    breach = budget_breach(entries)
+    if breach:
+        print(f"Network budget exceeded in {request.node.name}: {breach}")
+    if failed or breach:
+        prefix = "FAILED" if failed else "BUDGET"
+        path = write_har(entries, f"{prefix}_{pytest.current_test_name}")
+        print(f"Network trace: {path}")
+        _record_artifact(request, "har", path)
+
+def _network_profile(request):
+    """Network profile of the test: network_profile marker, else --network-profile (None = unthrottled)"""
+    marker = request.node.get_closest_marker("network_profile")
+    name = marker.args[0] if marker is not None and marker.args \
+        else request.config.getoption("--network-profile")
+    if not name or name == BASELINE:
+        return None
+    return get_profile(name)
+
+def _apply_network_profile(request, profile, driver_instance):
+    """Throttle the test's page; returns the wait scale to restore, None if unthrottled"""
+    request.node.network_profile = BASELINE
+    if profile is None:
+        return None
+    if not NetworkProfile.supported(driver_instance):
+        print(f"Warning: Network profile {profile.name} needs local Chrome/Edge, running unthrottled")
+        return None
+    try:
+        profile.apply(driver_instance)
+    except Exception as e:
+        print(f"Warning: Could not apply network profile {profile.name}, running unthrottled: {e}")
+        return None
+    request.node.network_profile = profile.name
+    # Slow connections need proportionally longer waits
+    previous_scale = BasePage.wait_scale
+    BasePage.set_wait_scale(previous_scale * profile.wait_scale)
+    return previous_scale
+
+def _clear_network_profile(request, previous_scale, driver_instance):
+    """Record the page timing under the profile and lift the throttling"""
+    if previous_scale is None:
+        return
+    BasePage.set_wait_scale(previous_scale)
+    try:
+        request.node.page_timing = driver_instance.execute_script(PAGE_TIMING_SCRIPT)
+        NetworkProfile.clear(driver_instance)
+    except Exception as e:
+        print(f"Warning: Could not clear network profile: {e}")
 
 @pytest.fixture(scope="function")
-def driver(driver_manager):
-    """Function-scoped driver fixture - new driver for each test"""
-    driver_instance = driver_manager.get_driver()
+def driver(request, driver_manager):
+    """Function-scoped driver fixture - new driver (or browser context) for each test"""
+    use_context = request.config.getoption("--isolation") == "context"
+    # Resolved first: an unknown profile name must fail before a browser starts
+    profile = _network_profile(request)
+    
+    if request.cls is not None and request.node.get_closest_marker("readonly_session") \
+            and not use_context:
+        # Read-only class: share one browser, reset between tests
+        shared = request.getfixturevalue("readonly_session")
+        driver_instance = shared.acquire()
+        screencast = _start_screencast(request, driver_instance)
+        recorder = driver_manager.network_recorder(driver_instance)
+        throttled = _apply_network_profile(request, profile, driver_instance)
+        yield driver_instance
+        
+        failed = getattr(pytest, "current_test_failed", False)
+        _clear_network_profile(request, throttled, driver_instance)
+        _finish_screencast(request, screencast, failed)
+        _finish_network_trace(request, recorder, failed)
+        _sample_memory(request, driver_manager, driver_instance)
+        if failed and Config.SCREENSHOTS_ON_FAILURE:
+            _record_artifact(request, "screenshot",
+                             driver_manager.take_screenshot(f"FAILED_{pytest.current_test_name}"))
+        reason = shared.release(request.node.nodeid, failed=failed)
+        if reason:
+            print(f"readonly_session: fresh driver after {request.node.name} ({reason})")
+        return
+    
+    if use_context:
+        driver_instance = driver_manager.get_context_driver()
+    else:
+        driver_instance = driver_manager.get_driver()
+    screencast = _start_screencast(request, driver_instance)
+    recorder = driver_manager.network_recorder(driver_instance)
+    throttled = _apply_network_profile(request, profile, driver_instance)
     yield driver_instance
     
+    failed = getattr(pytest, "current_test_failed", False)
+    _clear_network_profile(request, throttled, driver_instance)
+    _finish_screencast(request, screencast, failed)
+    _finish_network_trace(request, recorder, failed)
+    # Transient failure: the browser is kept warm in the pool for the rerun
+    keep_warm = getattr(request.node, "failure_category", None) in RERUN_CATEGORIES
+    if use_context or keep_warm:
+        # A browser quit after this test has no future for the watchdog to judge
+        _sample_memory(request, driver_manager, driver_instance)
+    
     # Take screenshot on test failure
     if hasattr(pytest, "current_test_failed") and pytest.current_test_failed:
         if Config.SCREENSHOTS_ON_FAILURE:
             test_name = pytest.current_test_name
-            driver_manager.take_screenshot(f"FAILED_{test_name}")
+            _record_artifact(request, "screenshot", driver_manager.take_screenshot(f"FAILED_{test_name}"))
     
     # Ensure driver is properly closed
     try:
-        driver_manager.quit_driver()
+        if use_context:
+            driver_manager.release_context()
+        elif keep_warm:
+            driver_manager.release_driver()
+        else:
+            driver_manager.quit_driver()
     except Exception as e:
         print(f"Warning during driver cleanup: {e}")
         # Force cleanup if normal quit fails
@@ -45,6 +241,179 @@ def class_driver(driver_manager):
     yield driver_instance
     driver_manager.quit_driver()
 
+BROWSER_FIXTURES = ("driver", "class_driver")
+
+def pytest_itemcollected(item):
+    """Keep tests sharing a class/module fixture on one xdist worker (--dist loadgroup)"""
+    if not item.config.pluginmanager.hasplugin("xdist") or item.get_closest_marker("xdist_group"):
+        return
+    scope = shared_scope_node(item)
+    if scope:
+        item.add_marker(pytest.mark.xdist_group(name=group_name(scope)))
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Skip unchanged tests, schedule/shard by duration, order flaky tests, gate on health"""
+    _apply_incremental(config, items)
+    _apply_schedule(config, items)
+    _apply_flaky_policy(config, items)
+    _apply_health_gate(config, items)
+
+def _apply_incremental(config, items):
+    """Skip tests whose input fingerprint matches a recent pass (with --incremental)"""
+    if not config.getoption("--incremental") or config.option.collectonly:
+        return
+    
+    # xdist workers use the controller's page fingerprints, so all skip the same tests
+    worker = getattr(config, "workerinput", None)
+    responses = ResponseFingerprints(hashes=worker["incremental_responses"]) \
+        if worker and "incremental_responses" in worker else None
+    fingerprinter = InputFingerprinter(config, responses)
+    store = config.incremental_store
+    skipped = 0
+    for item in items:
+        item.input_fingerprint = fingerprinter.fingerprint(item)
+        passed_at = store.unchanged_since(item.nodeid, item.input_fingerprint)
+        if passed_at:
+            item.add_marker(pytest.mark.skip(reason=f"incremental: unchanged since {passed_at}"))
+            item.incremental_skip = True
+            skipped += 1
+    fingerprinter.responses.close()
+    
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter:
+        reporter.write_line(f"incremental: {skipped} of {len(items)} tests unchanged "
+                            f"(max age {config.getoption('--incremental-max-age'):g}h)")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Fetch the page fingerprints once on the xdist controller for every worker (with --incremental)"""
+    config = node.config
+    if not config.getoption("--incremental") or config.option.collectonly:
+        return
+    if not hasattr(config, "incremental_responses"):
+        responses = ResponseFingerprints()
+        config.incremental_responses = responses.prefetch(site_urls())
+        responses.close()
+    node.workerinput["incremental_responses"] = config.incremental_responses
+
+def _apply_schedule(config, items):
+    """Order tests longest first and keep only this node's shard (with xdist or --shard)"""
+    shard = config.getoption("--shard")
+    worker = getattr(config, "workerinput", None)
+    if config.getoption("--schedule") == "off" or not (shard or worker):
+        return
+    
+    units = build_units(items, config.duration_store)
+    if shard:
+        index, total = parse_shard(shard)
+        shards = assign_shards(units, total)
+        # Every xdist worker computes the same shards; one writes the manifest
+        if worker is None or worker.get("workerid") == "gw0":
+            write_manifest(shards)
+        units = shards[index - 1]["units"]
+    
+    selected = [item for unit in lpt_order(units) for item in unit["items"]]
+    kept = set(selected)
+    deselected = [item for item in items if item not in kept]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+def _apply_flaky_policy(config, items):
+    """Attach rerun markers and move or quarantine known flaky tests"""
+    if config.pluginmanager.hasplugin("rerunfailures") and Config.TEST_RERUNS:
+        rerun_marker = pytest.mark.flaky(reruns=Config.TEST_RERUNS,
+                                         only_rerun=rerun_exception_names())
+        for item in items:
+            if item.get_closest_marker("flaky") is None:
+                item.add_marker(rerun_marker)
+    
+    policy = config.getoption("--flaky-policy")
+    flaky = {item.nodeid for item in items if config.flakiness_db.is_flaky(item.nodeid)}
+    
+    if policy == "off" or not flaky:
+        return
+    
+    if policy == "quarantine":
+        for item in items:
+            if item.nodeid in flaky:
+                item.add_marker(pytest.mark.xfail(reason="quarantined: consistently flaky",
+                                                  strict=False))
+    
+    # Stable sort keeps the original order within each group
+    items.sort(key=lambda item: item.nodeid in flaky)
+
+def _apply_health_gate(config, items):
+    """Probe the target before any browser starts and gate the session on it"""
+    mode = config.getoption("--health-gate")
+    browser_items = [item for item in items
+                     if any(name in item.fixturenames for name in BROWSER_FIXTURES)
+                     and not getattr(item, "incremental_skip", False)]
+    
+    if mode == "off" or config.option.collectonly or not browser_items:
+        return
+    
+    target = getattr(config, "fault_upstream", None) or config.getoption("--base-url")
+    health = HealthCheck(target).run()
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    
+    for line in health.summary():
+        if reporter:
+            reporter.write_line(f"health check: {line}")
+    
+    if health.healthy:
+        # Fast target -> smaller wait budgets, slow target -> larger ones
+        BasePage.set_wait_scale(health.wait_scale())
+        if reporter:
+            reporter.write_line(f"health check: wait scale set to {BasePage.wait_scale:.2f}")
+        return
+    
+    reason = "Target unhealthy: " + "; ".join(health.errors)
+    if mode == "abort":
+        pytest.exit(reason, returncode=pytest.ExitCode.TESTS_FAILED)
+    
+    skip_marker = pytest.mark.skip(reason=reason)
+    for item in browser_items:
+        item.add_marker(skip_marker)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Attribute WebDriver commands issued from here on to this test"""
+    RECORDER.current_test = item.nodeid
+
+def _command_budget(item):
+    """Command budget of a test: command_budget marker, else --command-budget"""
+    marker = item.get_closest_marker("command_budget")
+    if marker is not None and marker.args:
+        return marker.args[0]
+    return item.config.getoption("--command-budget")
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Fail passing tests over their command budget or benchmarks slower than the baseline"""
+    outcome = yield
+    if outcome.excinfo is not None:
+        return
+    
+    budget = _command_budget(item)
+    used = RECORDER.command_count(item.nodeid)
+    if budget and used > budget:
+        # A real failure (not a report rewrite) so reruns see a non-transient error
+        outcome.force_exception(pytest.fail.Exception(
+            f"WebDriver command budget exceeded: {used} commands "
+            f"(budget {budget}) - look for per-element round trips", pytrace=False))
+        return
+    
+    benchmark = getattr(item, "benchmark", None)
+    if benchmark is not None and benchmark.stats and \
+            item.config.getoption("--benchmark-fail-regressions"):
+        ratio = item.config.benchmark_report.regression(base_nodeid(item.nodeid), benchmark.stats)
+        if ratio:
+            outcome.force_exception(pytest.fail.Exception(
+                f"Benchmark regressed: p50 {benchmark.stats['p50'] * 1000:.1f} ms is "
+                f"{ratio:.2f}x the baseline", pytrace=False))
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results for screenshot on failure"""
@@ -54,6 +423,228 @@ def pytest_runtest_makereport(item, call):
     # Store test name and result for screenshot capture
     pytest.current_test_name = item.name
     pytest.current_test_failed = rep.when == "call" and rep.failed
+    
+    # Classify transient Selenium failures for reruns and flakiness tracking
+    if rep.failed and call.excinfo is not None:
+        rep.failure_category = classify_failure(call.excinfo.value)
+        item.failure_category = rep.failure_category
+    elif rep.when == "setup":
+        item.failure_category = None
+    
+    rep.network_profile = getattr(item, "network_profile", None)
+    
+    if rep.when in ("setup", "call") and item.config.getoption("--incremental"):
+        rep.input_fingerprint = getattr(item, "input_fingerprint", None)
+    
+    if rep.when == "call" and getattr(item, "benchmark", None) is not None:
+        rep.benchmark_stats = item.benchmark.stats
+    
+    if rep.when == "teardown":
+        rep.command_stats = RECORDER.pop_test(item.nodeid)
+        rep.browser_memory = getattr(item, "browser_memory", None)
+        rep.network_resources = getattr(item, "network_resources", None)
+        rep.page_timing = getattr(item, "page_timing", None)
+        rep.artifacts = getattr(item, "artifacts", None)
+        rep.markers = sorted({marker.name for marker in item.iter_markers()})
+        # Reruns of the item start with no artifacts of earlier attempts
+        item.artifacts = None
+
+def pytest_runtest_logreport(report):
+    """Record every test attempt in the flakiness database"""
+    config = getattr(pytest, "session_config", None)
+    # With xdist the controller sees every report; skip duplicates on workers
+    if config is None or hasattr(config, "workerinput"):
+        return
+    
+    profile = getattr(report, "network_profile", None)
+    # Throttled runs would skew the durations the scheduler balances on
+    if profile in (None, BASELINE):
+        config.duration_store.record_phase(report.nodeid, report.when, report.duration,
+                                           skipped=report.skipped)
+    
+    if profile and report.when == "call" and report.passed:
+        config.profile_timings.update(profile, base_nodeid(report.nodeid),
+                                      {"duration": round(report.duration, 3)})
+    if profile and report.when == "teardown" and getattr(report, "page_timing", None):
+        config.profile_timings.update(profile, base_nodeid(report.nodeid), report.page_timing)
+    
+    if report.when == "teardown":
+        config.command_report.add(report.nodeid, getattr(report, "command_stats", None))
+        config.memory_report.add(report.nodeid, getattr(report, "browser_memory", None))
+        config.network_report.add(report.nodeid, getattr(report, "network_resources", None))
+    
+    if config.result_sink is not None:
+        config.result_sink.add(report)
+    
+    if report.when == "call" and getattr(report, "benchmark_stats", None):
+        config.benchmark_report.add(base_nodeid(report.nodeid), report.benchmark_stats)
+    
+    if report.when == "call" or (report.when == "setup" and report.outcome != "passed"):
+        if report.outcome in ("passed", "failed", "rerun"):
+            config.flakiness_db.record_test(report.nodeid, report.outcome,
+                                            getattr(report, "failure_category", None))
+        if report.outcome in ("passed", "failed") and hasattr(report, "input_fingerprint"):
+            config.incremental_store.record(report.nodeid, report.outcome,
+                                            report.input_fingerprint)
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist flakiness data, the locator health index, durations and incremental passes"""
+    sink = session.config.result_sink
+    if sink is not None:
+        sink.close(exitstatus)
+        if Config.RUN_HISTORY_PATH:
+            history = RunHistory()
+            try:
+                history.ingest(sink.path)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                print(f"Warning: Could not store the run in the history database: {e}")
+            finally:
+                history.close()
+    
+    db = getattr(session.config, "flakiness_db", None)
+    if db is not None:
+        db.record_locators(drain_locator_stats())
+        try:
+            db.save()
+        except OSError as e:
+            print(f"Warning: Could not save flakiness database: {e}")
+    
+    if BasePage.locator_index is not None:
+        try:
+            BasePage.locator_index.save()
+        except OSError as e:
+            print(f"Warning: Could not save locator health index: {e}")
+    
+    try:
+        session.config.duration_store.save()
+    except OSError as e:
+        print(f"Warning: Could not save test durations: {e}")
+    
+    try:
+        session.config.incremental_store.save()
+    except OSError as e:
+        print(f"Warning: Could not save incremental results: {e}")
+    
+    if not hasattr(session.config, "workerinput"):
+        try:
+            session.config.profile_timings.save()
+        except OSError as e:
+            print(f"Warning: Could not save network profile timings: {e}")
+    
+    network = session.config.network_report
+    if network.tests and not hasattr(session.config, "workerinput"):
+        try:
+            network.save()
+        except OSError as e:
+            print(f"Warning: Could not save network report: {e}")
+    
+    memory = session.config.memory_report
+    if memory.tests and not hasattr(session.config, "workerinput"):
+        try:
+            memory.save()
+        except OSError as e:
+            print(f"Warning: Could not save browser memory samples: {e}")
+    
+    benchmarks = session.config.benchmark_report
+    if benchmarks.results and not hasattr(session.config, "workerinput"):
+        try:
+            benchmarks.save(Config.BENCHMARK_RESULTS_PATH)
+            if session.config.getoption("--benchmark-save-baseline"):
+                benchmarks.save(benchmarks.baseline_path)
+        except OSError as e:
+            print(f"Warning: Could not save benchmark results: {e}")
+
+def pytest_terminal_summary(terminalreporter, config):
+    """List flaky tests, dead locators, the chattiest tests and browser memory"""
+    db = getattr(config, "flakiness_db", None)
+    flaky = db.flaky_tests() if db else []
+    
+    if flaky:
+        terminalreporter.section("flaky tests")
+        for nodeid in flaky:
+            terminalreporter.write_line(f"{db.flake_rate(nodeid):6.1%}  {nodeid}")
+    
+    dead = BasePage.locator_index.dead_locators() if BasePage.locator_index else []
+    if dead:
+        terminalreporter.section("dead locators")
+        for key in dead:
+            terminalreporter.write_line(key)
+    
+    report = getattr(config, "command_report", None)
+    if report and report.tests:
+        terminalreporter.section("chattiest tests (WebDriver commands)")
+        for nodeid, stats in report.chattiest_tests():
+            top = ", ".join(f"{name} x{count}" for name, count in
+                            sorted(stats["by_command"].items(), key=lambda c: -c[1])[:3])
+            terminalreporter.write_line(f"{stats['commands']:6d}  {stats['time']:7.2f}s  "
+                                        f"{stats['bytes'] / 1024:8.1f} KiB  {nodeid}  [{top}]")
+        
+        methods = report.chattiest_methods()
+        if methods:
+            terminalreporter.section("chattiest page-object methods")
+            for method, totals in methods:
+                terminalreporter.write_line(f"{totals['commands']:6d}  {totals['time']:7.2f}s  "
+                                            f"{totals['tests']:4d} tests  {method}")
+        
+        terminalreporter.section("WebDriver command latency")
+        for label, count in report.histogram():
+            if count:
+                terminalreporter.write_line(f"{label:>12}  {count}")
+    
+    proxy = getattr(config, "fault_proxy", None)
+    if proxy is not None and proxy.stats:
+        terminalreporter.section(f"fault proxy ({proxy.upstream})")
+        for name, counters in proxy.stats.items():
+            terminalreporter.write_line(f"{name:<24} " + "  ".join(
+                f"{event} {counters.get(event, 0)}"
+                for event in ("requests", "delayed", "throttled", "dropped", "errors")))
+    
+    timings = getattr(config, "profile_timings", None)
+    profiles = timings.session_profiles() if timings else []
+    if profiles:
+        terminalreporter.section("network profiles")
+        for name in profiles:
+            stats = timings.summary(name)
+            duration, load, slowdown = (
+                "-" if stats[key] is None else f"{stats[key]:.{digits}f}{unit}"
+                for key, digits, unit in (("duration", 2, "s"), ("load_ms", 0, " ms"), ("slowdown", 2, "x")))
+            terminalreporter.write_line(f"{name:<14} {stats['tests']:4d} tests  mean {duration:>8}  "
+                                        f"load {load:>9}  vs unthrottled {slowdown:>6}")
+    
+    network = getattr(config, "network_report", None)
+    if network and network.tests:
+        terminalreporter.section("heaviest resources")
+        for url, totals in network.heaviest():
+            terminalreporter.write_line(f"{totals['max_bytes'] / 1024:9.1f} KiB  "
+                                        f"{totals['requests']:4d} req  {totals['type']:<10} {url}")
+        terminalreporter.section("slowest resources")
+        for url, totals in network.slowest():
+            terminalreporter.write_line(f"{totals['mean_ms']:8.1f} ms  ttfb {totals['mean_wait_ms']:8.1f} ms  "
+                                        f"max {totals['max_ms']:8.1f} ms  {url}")
+    
+    memory = getattr(config, "memory_report", None)
+    if memory and memory.tests:
+        terminalreporter.section("browser memory (MB)")
+        # Firefox exposes no JS heap: rank by process RSS then
+        for nodeid, sample in memory.largest("heap_mb") or memory.largest("rss_mb"):
+            heap, rss = ("-" if sample[key] is None else f"{sample[key]:.1f}"
+                         for key in ("heap_mb", "rss_mb"))
+            terminalreporter.write_line(f"heap {heap:>8}  rss {rss:>8}  {nodeid}")
+        for nodeid, verdict in memory.flagged():
+            terminalreporter.write_line(f"flagged after {nodeid}: {verdict}", yellow=True)
+    
+    benchmarks = getattr(config, "benchmark_report", None)
+    if benchmarks and benchmarks.results:
+        terminalreporter.section("framework benchmarks (ms)")
+        terminalreporter.write_line(f"{'p50':>9} {'p90':>9} {'p95':>9} {'p99':>9} "
+                                    f"{'max':>9} {'rounds':>6}  {'vs base':>8}  benchmark")
+        for name, stats, ratio, regressed in benchmarks.rows():
+            versus = f"{ratio:.2f}x" if ratio else "-"
+            if regressed:
+                versus += "!"
+            terminalreporter.write_line(
+                " ".join(f"{stats[key] * 1000:9.1f}" for key in ("p50", "p90", "p95", "p99", "max"))
+                + f" {stats['rounds']:6d}  {versus:>8}  {name}", red=regressed)
 
 def pytest_addoption(parser):
     """Add custom command line options"""
@@ -75,6 +666,147 @@ def pytest_addoption(parser):
         default=Config.BASE_URL,
         help="Base URL for testing"
     )
+    parser.addoption(
+        "--driver-backend",
+        action="store",
+        default=Config.DRIVER_BACKEND,
+        help="Driver backend to use (local, remote)"
+    )
+    parser.addoption(
+        "--remote-url",
+        action="store",
+        default=Config.REMOTE_URL,
+        help="Selenium Grid / W3C endpoint for the remote backend"
+    )
+    parser.addoption(
+        "--health-gate",
+        action="store",
+        default=Config.HEALTH_GATE,
+        choices=("abort", "skip", "off"),
+        help="What to do when the target fails the pre-session HTTP probe"
+    )
+    parser.addoption(
+        "--flaky-policy",
+        action="store",
+        default=Config.FLAKY_POLICY,
+        choices=("last", "quarantine", "off"),
+        help="How to treat consistently flaky tests (run last, quarantine as xfail, off)"
+    )
+    parser.addoption(
+        "--isolation",
+        action="store",
+        default=Config.DRIVER_ISOLATION,
+        choices=("browser", "context"),
+        help="Per-test isolation: new browser, or new CDP browser context in a shared browser"
+    )
+    parser.addoption(
+        "--wait-backend",
+        action="store",
+        default=Config.WAIT_BACKEND,
+        choices=("polling", "observer"),
+        help="Element wait strategy (WebDriverWait polling or in-page MutationObserver)"
+    )
+    parser.addoption(
+        "--profile-locators",
+        action="store_true",
+        default=Config.LOCATOR_PROFILING,
+        help="Record which alternatives of compound selectors match"
+    )
+    parser.addoption(
+        "--command-budget",
+        action="store",
+        type=int,
+        default=Config.COMMAND_BUDGET,
+        help="Fail tests issuing more WebDriver commands than this (0 = unlimited)"
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        default=Config.TEST_SCHEDULE,
+        choices=("duration", "off"),
+        help="Order tests longest first by historical duration (with xdist or --shard)"
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="Run only shard i of N (e.g. 2/4), balanced by historical durations"
+    )
+    parser.addoption(
+        "--incremental",
+        action="store_true",
+        default=Config.INCREMENTAL,
+        help="Skip tests whose sources, config and server pages are unchanged since they passed"
+    )
+    parser.addoption(
+        "--incremental-max-age",
+        action="store",
+        type=float,
+        default=Config.INCREMENTAL_MAX_AGE_HOURS,
+        help="Re-run tests whose last verified pass is older than this many hours"
+    )
+    parser.addoption(
+        "--benchmark-rounds",
+        action="store",
+        type=int,
+        default=Config.BENCHMARK_ROUNDS,
+        help="Measured rounds per framework benchmark"
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default=Config.BENCHMARK_BASELINE_PATH,
+        help="Baseline JSON the framework benchmarks are compared against"
+    )
+    parser.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        default=False,
+        help="Store this run's benchmark results as the new baseline"
+    )
+    parser.addoption(
+        "--benchmark-fail-regressions",
+        action="store_true",
+        default=False,
+        help="Fail benchmarks whose p50 is slower than the baseline beyond BENCHMARK_TOLERANCE"
+    )
+    parser.addoption(
+        "--screencast",
+        action="store_true",
+        default=Config.SCREENCAST,
+        help="Keep the last seconds of screen per test and save them as an animation on failure"
+    )
+    parser.addoption(
+        "--network-trace",
+        action="store_true",
+        default=Config.NETWORK_TRACE,
+        help="Record each test's requests (CDP Network events); HAR kept on failure or budget breach"
+    )
+    parser.addoption(
+        "--network-profile",
+        action="store",
+        default=Config.NETWORK_PROFILE,
+        help="Network condition profile for every test (slow-3g, fast-3g, slow-4g, fast-4g, "
+             "high-latency, offline); a network_profile marker takes precedence"
+    )
+    parser.addoption(
+        "--fault-scenario",
+        action="store",
+        default=Config.FAULT_SCENARIO or None,
+        help="JSON scenario of latency, bandwidth caps, drops and 5xx to inject through a local proxy"
+    )
+    parser.addoption(
+        "--results-jsonl",
+        action="store",
+        default=Config.RESULTS_JSONL_PATH or None,
+        help="Stream each finished test's result as a JSON line to this file (empty to disable)"
+    )
+    parser.addoption(
+        "--local-hub",
+        action="store_true",
+        default=False,
+        help="Start a local stand-in hub and run through the remote backend"
+    )
 
 @pytest.fixture(scope="session")
 def browser_config(request):
@@ -82,12 +814,76 @@ def browser_config(request):
     return {
         'browser': request.config.getoption("--browser"),
         'headless': request.config.getoption("--headless"),
-        'base_url': request.config.getoption("--base-url")
+        'base_url': request.config.getoption("--base-url"),
+        'driver_backend': request.config.getoption("--driver-backend"),
+        'remote_url': request.config.getoption("--remote-url")
     }
 
+def _start_fault_proxy(config):
+    """Put the fault-injection proxy between the browser and --base-url"""
+    # Imported here: http.client is only needed when a scenario is given
+    from utils.fault_proxy import FaultProxy, Scenario
+    from pages.login_page import LoginPage
+    from pages.dashboard_page import DashboardPage
+    
+    try:
+        scenario = Scenario.load(config.getoption("--fault-scenario"))
+    except (OSError, ValueError, TypeError) as e:
+        raise pytest.UsageError(f"Invalid fault scenario: {e}")
+    
+    upstream = scenario.upstream or config.getoption("--base-url")
+    proxy = FaultProxy(scenario, upstream=upstream, port=0).start()
+    config.fault_proxy = proxy
+    # The health gate keeps probing the real target, not the injected faults
+    config.fault_upstream = upstream
+    config.option.base_url = proxy.url
+    Config.BASE_URL = proxy.url
+    LoginPage.LOGIN_URL = f"{proxy.url}login"
+    DashboardPage.DASHBOARD_URL = f"{proxy.url}dashboard"
+    DashboardPage.HOME_URL = proxy.url
+
+def pytest_unconfigure(config):
+    """Stop the fault-injection proxy"""
+    proxy = getattr(config, "fault_proxy", None)
+    if proxy is not None:
+        proxy.stop()
+
 # Custom markers
 def pytest_configure(config):
-    """Register custom markers"""
+    """Register custom markers and load the flakiness database"""
+    config.flakiness_db = FlakinessDB().load()
+    BasePage.locator_index = LocatorHealthIndex().load()
+    Config.LOCATOR_PROFILING = config.getoption("--profile-locators")
+    Config.WAIT_BACKEND = config.getoption("--wait-backend")
+    config.command_report = CommandReport()
+    config.memory_report = MemoryReport()
+    config.network_report = NetworkReport()
+    Config.NETWORK_TRACE = config.getoption("--network-trace")
+    config.profile_timings = ProfileTimings().load()
+    profile = config.getoption("--network-profile")
+    if profile and profile != BASELINE:
+        try:
+            get_profile(profile)
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    config.duration_store = DurationStore().load()
+    config.benchmark_report = BenchmarkReport(config.getoption("--benchmark-baseline"))
+    config.incremental_store = IncrementalStore(
+        max_age_hours=config.getoption("--incremental-max-age")).load()
+    if config.getoption("--shard"):
+        try:
+            parse_shard(config.getoption("--shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    if config.getoption("--fault-scenario"):
+        _start_fault_proxy(config)
+    config.result_sink = None
+    if config.getoption("--results-jsonl") and not config.option.collectonly \
+            and not hasattr(config, "workerinput"):
+        config.result_sink = ResultSink(config.getoption("--results-jsonl")).open(
+            getattr(config, "fault_upstream", None) or config.getoption("--base-url"))
+    pytest.session_config = config
+    
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -106,6 +902,18 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "navigation: mark test as navigation-related"
     )
+    config.addinivalue_line(
+        "markers", "readonly_session: serve the marked tests of a class from one shared, reset-between-tests driver"
+    )
+    config.addinivalue_line(
+        "markers", "benchmark: framework overhead benchmark against the local stand-in site"
+    )
+    config.addinivalue_line(
+        "markers", "network_profile(name): run the test under a throttled network profile (e.g. slow-3g)"
+    )
+    config.addinivalue_line(
+        "markers", "command_budget(n): fail the test if it issues more than n WebDriver commands"
+    )
 
 # Test data fixtures
 @pytest.fixture
@@ -17,4 +17,8 @@ class Config:
     
     # Test credentials (if needed)
     TEST_USERNAME = os.getenv('TEST_USERNAME', '')
-    TEST_PASSWORD = os.getenv('TEST_PASSWORD', '')
\ No newline at end of file
+    TEST_PASSWORD = os.getenv('TEST_PASSWORD', '')
+    
+    # Test data (records are namespaced per run and worker, removed after each test)
+    TEST_DATA_PREFIX = os.getenv('TEST_DATA_PREFIX', 'AUTO')
+    CLEANUP_HTTP_TIMEOUT = float(os.getenv('CLEANUP_HTTP_TIMEOUT', '10'))
\ No newline at end of file
@@ -0,0 +1 @@
+# Test data factories
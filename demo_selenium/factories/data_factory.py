@@ -0,0 +1,184 @@
+"""
+Parallel-safe test data factory for Kelola Siswa
+
+Every record carries a namespace unique to the run and the xdist worker, so
+CRUD tests never collide when sharded and never depend on "the first row".
+Everything a factory creates is tracked and removed in one bulk teardown:
+over HTTP with the browser's session cookies first, through the UI for
+whatever HTTP could not delete.
+"""
+import itertools
+import os
+import re
+import time
+from urllib.parse import urljoin
+import requests
+from config.config import Config
+
+# Resource URL of a siswa inside an edit/detail/delete link
+RESOURCE_PATTERN = re.compile(r'^(.*?/siswa/\d+)')
+
+CSRF_SCRIPT = """
+    var meta = document.querySelector('meta[name="csrf-token"]');
+    var input = document.querySelector('input[name="_token"]');
+    return meta ? meta.content : (input ? input.value : null);
+"""
+
+
+def run_namespace():
+    """
+    Namespace for this run and worker, e.g. ``gw2-k3f9q``
+
+    Set TEST_RUN_ID to share one run id across machines (CI shards).
+    """
+    worker = os.getenv('PYTEST_XDIST_WORKER', 'main')
+    run_id = os.getenv('TEST_RUN_ID') or _base36(int(time.time() * 1000) + os.getpid())[-5:]
+    return f"{worker}-{run_id}"
+
+
+def _base36(number):
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    encoded = ''
+    while number:
+        number, remainder = divmod(number, 36)
+        encoded = digits[remainder] + encoded
+    return encoded or '0'
+
+
+class SiswaFactory:
+    """Builds unique siswa records, creates them through the UI and cleans them up"""
+
+    def __init__(self, namespace=None):
+        """
+        Args:
+            namespace (str): Record namespace, unique per run and worker if None
+        """
+        self.namespace = namespace or run_namespace()
+        self.created = []
+        self._sequence = itertools.count(1)
+        # Numeric NIS prefix: worker number plus a per-run stamp
+        worker_digits = re.sub(r'\D', '', self.namespace.split('-')[0]) or '0'
+        run_stamp = (int(time.time()) + os.getpid()) % 10 ** 5
+        self._nis_prefix = f"9{int(worker_digits) % 100:02d}{run_stamp:05d}"
+
+    def build(self, **overrides):
+        """
+        Build a unique siswa record without creating it
+
+        Args:
+            **overrides: Field values to use instead of generated ones
+
+        Returns:
+            dict: Record with nama, nis and kelas
+        """
+        seq = next(self._sequence)
+        record = {
+            'nama': f"{Config.TEST_DATA_PREFIX} {self.namespace} {seq:03d}",
+            'nis': f"{self._nis_prefix}{seq:03d}",
+            'kelas': '10 IPA 1',
+        }
+        record.update(overrides)
+        return record
+
+    def create(self, page, fast=True, **overrides):
+        """
+        Create a siswa through the UI and track it for cleanup
+
+        Args:
+            page (KelolaSiswaPage): Page object on the kelola siswa page
+            fast (bool): Fill the form in one script instead of typing it
+            **overrides: Field values to use instead of generated ones
+
+        Returns:
+            dict: The created record (update its fields if the test edits it)
+        """
+        record = self.build(**overrides)
+        # Track first: a half-finished create still gets cleaned up
+        self.created.append(record)
+        page.add_new_siswa(record['nama'], record['nis'], record['kelas'], fast=fast)
+        return record
+
+    def forget(self, record):
+        """Stop tracking a record the test already deleted"""
+        if record in self.created:
+            self.created.remove(record)
+
+    def cleanup(self, page):
+        """
+        Delete every tracked record: HTTP in bulk, UI for the rest
+
+        Args:
+            page (KelolaSiswaPage): Page object on a logged-in driver
+        """
+        if not self.created:
+            return
+
+        try:
+            remaining = self._delete_over_http(page)
+        except Exception as e:
+            print(f"Warning: HTTP cleanup failed, falling back to UI: {e}")
+            remaining = list(self.created)
+
+        for record in remaining:
+            try:
+                page.open_kelola_siswa_page()
+                page.delete_siswa(record['nama'])
+            except Exception as e:
+                print(f"Warning: Could not delete test siswa {record['nama']}: {e}")
+
+        self.created = []
+
+    def _delete_over_http(self, page):
+        """
+        Delete tracked records with the app's own delete endpoint
+
+        Reads the whole table once, maps each record to its resource URL via the
+        row's action links and sends a (method-spoofed) DELETE per record over
+        one pooled HTTP session carrying the browser's cookies.
+
+        Returns:
+            list: Records that could not be deleted over HTTP
+        """
+        page.open_kelola_siswa_page()
+        table = page.read_siswa_table()
+        token = page.driver.execute_script(CSRF_SCRIPT)
+        page_url = page.driver.current_url
+
+        session = requests.Session()
+        for cookie in page.driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], path=cookie.get('path', '/'))
+        session.headers.update({'Referer': page_url, 'X-Requested-With': 'XMLHttpRequest'})
+        if token:
+            session.headers['X-CSRF-TOKEN'] = token
+
+        remaining = []
+        for record in self.created:
+            url = self._resource_url(table, record, page_url)
+            if url is None or token is None:
+                remaining.append(record)
+                continue
+            try:
+                response = session.post(url, data={'_method': 'DELETE', '_token': token},
+                                        timeout=Config.CLEANUP_HTTP_TIMEOUT,
+                                        allow_redirects=False)
+                if response.status_code >= 400:
+                    remaining.append(record)
+            except requests.RequestException:
+                remaining.append(record)
+
+        return remaining
+
+    @staticmethod
+    def _resource_url(table, record, page_url):
+        """Resource URL of a record's row, from its action links, or None"""
+        if table.empty:
+            return None
+
+        cells = table.drop(columns='actions').astype(str)
+        rows = table[cells.apply(lambda row: (row == record['nama']).any(), axis=1)]
+        for actions in rows['actions']:
+            for action in actions:
+                match = RESOURCE_PATTERN.match(urljoin(page_url, action.get('href') or ''))
+                if match:
+                    return match.group(1)
+        return None
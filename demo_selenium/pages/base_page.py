@@ -5,6 +5,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from config.config import Config
+from pages.text_locator import TextLocator
+from pages import form_fill, table_reader
+
+# Expected conditions for plain (By, value) locators, keyed by element state
+CONDITIONS = {
+    'present': EC.presence_of_element_located,
+    'visible': EC.visibility_of_element_located,
+    'clickable': EC.element_to_be_clickable,
+}
 
 
 class BasePage:
@@ -15,6 +24,12 @@ class BasePage:
         self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
         self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
     
+    def _condition(self, locator, state):
+        """Wait condition for a (By, value) tuple or a TextLocator"""
+        if isinstance(locator, TextLocator):
+            return locator.condition(state)
+        return CONDITIONS[state](locator)
+    
     def open(self, url):
         """Open a URL"""
         self.driver.get(url)
@@ -22,17 +37,19 @@ class BasePage:
     def find_element(self, locator):
         """Find an element with explicit wait"""
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self.wait.until(self._condition(locator, 'present'))
         except TimeoutException:
             raise TimeoutException(f"Element not found: {locator}")
     
     def find_elements(self, locator):
         """Find multiple elements"""
+        if isinstance(locator, TextLocator):
+            return locator.find_all(self.driver)
         return self.driver.find_elements(*locator)
     
     def click(self, locator):
         """Click an element"""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+        element = self.wait.until(self._condition(locator, 'clickable'))
         element.click()
     
     def type_text(self, locator, text):
@@ -41,6 +58,24 @@ class BasePage:
         element.clear()
         element.send_keys(text)
     
+    def fill_form(self, mapping):
+        """
+        Fill several fields in one script and return their validation state
+        
+        Skips keystroke simulation; use type_text where typing matters.
+        """
+        if not mapping:
+            raise ValueError("fill_form needs at least one field to fill")
+        self.find_element(next(iter(mapping)))
+        return form_fill.fill_form(self.driver, mapping)
+    
+    def read_table(self, locator, follow_pagination=True):
+        """Read a whole table (following pagination) into a pandas DataFrame"""
+        self.find_element(locator)
+        next_css = table_reader.NEXT_CSS if follow_pagination else None
+        return table_reader.read_table(self.driver, locator, next_css=next_css,
+                                       timeout=Config.EXPLICIT_WAIT)
+    
     def get_text(self, locator):
         """Get text from an element"""
         element = self.find_element(locator)
@@ -49,7 +84,7 @@ class BasePage:
     def is_element_visible(self, locator):
         """Check if element is visible"""
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            self.wait.until(self._condition(locator, 'visible'))
             return True
         except TimeoutException:
             return False
@@ -2,23 +2,47 @@
 Kelola Siswa Page Object Model
 """
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
 from pages.base_page import BasePage
+from pages.text_locator import TextLocator, NAVIGATION_SCOPE
 from config.config import Config
 import time
 
+# Arguments: rowText, labelPattern; clicks the matching control in the row containing rowText
+ROW_ACTION_SCRIPT = """
+    var rowText = arguments[0], pattern = new RegExp(arguments[1], 'i');
+    var rows = document.querySelectorAll('table tr');
+    for (var i = 0; i < rows.length; i++) {
+        var cells = rows[i].cells, inRow = false;
+        for (var c = 0; c < cells.length; c++) {
+            if ((cells[c].textContent || '').trim() === rowText) { inRow = true; break; }
+        }
+        if (!inRow) { continue; }
+        var controls = rows[i].querySelectorAll('a, button');
+        for (var j = 0; j < controls.length; j++) {
+            var el = controls[j];
+            var label = (el.textContent || '') + ' ' + (el.getAttribute('title') || '') + ' ' +
+                        (el.getAttribute('aria-label') || '');
+            if (pattern.test(label)) { el.click(); return true; }
+        }
+    }
+    return false;
+"""
+
 
 class KelolaSiswaPage(BasePage):
     """Kelola Siswa page object"""
     
     # Locators - Menu Navigation
-    MENU_SISWA = (By.XPATH, "//a[contains(text(), 'Siswa') or contains(@href, 'siswa')]")
+    MENU_SISWA = TextLocator.bilingual('student', tags=('a',), scope=NAVIGATION_SCOPE,
+                                       extra_css="a[href*='siswa']")
     
-    # Locators - Buttons
-    ADD_SISWA_BUTTON = (By.XPATH, "//button[contains(text(), 'Tambah') or contains(text(), 'Add')]")
-    EDIT_SISWA_BUTTON = (By.XPATH, "//button[contains(text(), 'Edit') or @title='Edit']")
-    DELETE_SISWA_BUTTON = (By.XPATH, "//button[contains(text(), 'Hapus') or contains(text(), 'Delete')]")
-    SAVE_BUTTON = (By.XPATH, "//button[@type='submit' or contains(text(), 'Simpan') or contains(text(), 'Save')]")
-    CONFIRM_DELETE_BUTTON = (By.XPATH, "//button[contains(text(), 'Ya') or contains(text(), 'Confirm')]")
+    # Locators - Buttons (label includes title/aria-label, so title='Edit' matches too)
+    ADD_SISWA_BUTTON = TextLocator.bilingual('add', tags=('button',))
+    EDIT_SISWA_BUTTON = TextLocator.bilingual('edit', tags=('button',))
+    DELETE_SISWA_BUTTON = TextLocator.bilingual('delete', tags=('button',))
+    SAVE_BUTTON = TextLocator.bilingual('save', tags=('button',), extra_css="button[type='submit']")
+    CONFIRM_DELETE_BUTTON = TextLocator.bilingual('confirm', tags=('button',))
     
     # Locators - Form Fields
     NAMA_INPUT = (By.ID, "nama")
@@ -50,8 +74,14 @@ class KelolaSiswaPage(BasePage):
         self.click(self.ADD_SISWA_BUTTON)
         time.sleep(0.5)
     
-    def fill_siswa_form(self, nama, nis, kelas):
-        """Fill siswa form"""
+    def fill_siswa_form(self, nama, nis, kelas, fast=False):
+        """Fill siswa form (fast: all fields in one script, for data setup)"""
+        if fast:
+            return self.fill_form({
+                self.NAMA_INPUT: nama,
+                self.NIS_INPUT: nis,
+                self.KELAS_INPUT: kelas,
+            })
         self.type_text(self.NAMA_INPUT, nama)
         self.type_text(self.NIS_INPUT, nis)
         self.type_text(self.KELAS_INPUT, kelas)
@@ -61,20 +91,48 @@ class KelolaSiswaPage(BasePage):
         self.click(self.SAVE_BUTTON)
         time.sleep(1)
     
-    def add_new_siswa(self, nama, nis, kelas):
+    def add_new_siswa(self, nama, nis, kelas, fast=False):
         """Complete flow to add new siswa"""
         self.click_add_siswa()
-        self.fill_siswa_form(nama, nis, kelas)
+        self.fill_siswa_form(nama, nis, kelas, fast=fast)
         self.click_save()
     
-    def click_edit_siswa(self):
-        """Click edit button for first siswa in table"""
-        self.click(self.EDIT_SISWA_BUTTON)
+    def add_many_siswa(self, students):
+        """
+        Seed several siswa through the UI using fast form fill
+        
+        Args:
+            students (list): Dicts with nama, nis and kelas keys
+        """
+        for student in students:
+            self.add_new_siswa(student['nama'], student['nis'], student['kelas'], fast=True)
+    
+    def click_row_action(self, nama, button):
+        """
+        Click a button (edit, delete) in the row of a specific siswa
+        
+        Args:
+            nama (str): Exact nama cell text of the row
+            button (TextLocator): Button locator whose labels to match
+        """
+        self.find_element(self.TABLE_SISWA)
+        if not self.driver.execute_script(ROW_ACTION_SCRIPT, nama, button.pattern):
+            raise NoSuchElementException(f"No {button[1]} in row of siswa: {nama}")
+    
+    def click_edit_siswa(self, nama=None):
+        """Click edit button for a siswa (first siswa in table if nama is None)"""
+        if nama is None:
+            self.click(self.EDIT_SISWA_BUTTON)
+        else:
+            self.click_row_action(nama, self.EDIT_SISWA_BUTTON)
         time.sleep(0.5)
     
-    def click_delete_siswa(self):
-        """Click delete button for first siswa"""
-        self.click(self.DELETE_SISWA_BUTTON)
+    def click_delete_siswa(self, nama=None):
+        """Click delete button for a siswa (first siswa in table if nama is None)"""
+        if nama is None:
+            self.click(self.DELETE_SISWA_BUTTON)
+        else:
+            self.click_row_action(nama, self.DELETE_SISWA_BUTTON)
         time.sleep(0.5)
     
     def confirm_delete(self):
@@ -82,10 +140,30 @@ class KelolaSiswaPage(BasePage):
         self.click(self.CONFIRM_DELETE_BUTTON)
         time.sleep(1)
     
+    def delete_siswa(self, nama):
+        """Complete flow to delete a specific siswa"""
+        self.click_delete_siswa(nama)
+        self.confirm_delete()
+    
     def is_table_visible(self):
         """Check if siswa table is visible"""
         return self.is_element_visible(self.TABLE_SISWA)
     
+    def read_siswa_table(self):
+        """Read every siswa row (all pages) into a DataFrame"""
+        return self.read_table(self.TABLE_SISWA)
+    
+    def is_siswa_listed(self, nama, nis=None):
+        """Check if a siswa appears in the table (matching nama, and nis if given)"""
+        table = self.read_siswa_table()
+        if table.empty:
+            return False
+        cells = table.drop(columns='actions').astype(str)
+        matches = cells.apply(lambda row: (row == nama).any(), axis=1)
+        if nis is not None:
+            matches &= cells.apply(lambda row: (row == str(nis)).any(), axis=1)
+        return bool(matches.any())
+    
     def is_success_message_displayed(self):
         """Check if success message is displayed"""
         return self.is_element_visible(self.SUCCESS_MESSAGE)
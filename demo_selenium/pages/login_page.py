@@ -35,10 +35,13 @@ class LoginPage(BasePage):
         """Click login button"""
         self.click(self.LOGIN_BUTTON)
     
-    def login(self, username, password):
-        """Perform complete login"""
-        self.enter_username(username)
-        self.enter_password(password)
+    def login(self, username, password, fast=False):
+        """Perform complete login (fast: fill both fields in one script)"""
+        if fast:
+            self.fill_form({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password})
+        else:
+            self.enter_username(username)
+            self.enter_password(password)
         self.click_login_button()
     
     def is_error_displayed(self):
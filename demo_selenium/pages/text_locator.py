@@ -0,0 +1,159 @@
+"""
+Text-based locators compiled to a single injected CSS query
+
+Replaces ``//a[contains(text(), 'X')] | //button[...]`` XPath unions, which
+scan the whole document, with one ``querySelectorAll`` scoped to a container
+(navbar, sidebar, ...) plus a text filter, executed in a single round trip.
+Matches are cached in the page's ``window`` so the cache lives exactly as long
+as the page load.
+"""
+
+# Built-in EN/ID vocabulary for common link and button labels
+BILINGUAL = {
+    'home': ('Home', 'Beranda'),
+    'profile': ('Profile', 'Profil'),
+    'settings': ('Settings', 'Pengaturan'),
+    'logout': ('Logout', 'Log out', 'Keluar'),
+    'add': ('Add', 'Tambah'),
+    'edit': ('Edit', 'Ubah'),
+    'delete': ('Delete', 'Hapus'),
+    'save': ('Save', 'Simpan'),
+    'confirm': ('Confirm', 'Ya'),
+    'student': ('Student', 'Siswa'),
+}
+
+# Containers that usually hold navigation links
+NAVIGATION_SCOPE = "nav, .navbar, header, aside, .sidebar"
+
+# Arguments: css, scopeCss, extraCss, pattern, state, cacheKey, findAll
+FIND_SCRIPT = """
+    var css = arguments[0], scopeCss = arguments[1], extraCss = arguments[2];
+    var pattern = new RegExp(arguments[3], 'i');
+    var state = arguments[4], key = arguments[5], findAll = arguments[6];
+    var cache = window.__textLocatorCache || (window.__textLocatorCache = {});
+
+    function label(el) {
+        return (el.textContent || '') + ' ' + (el.getAttribute('title') || '') + ' ' +
+               (el.getAttribute('aria-label') || '') + ' ' + (el.value || '');
+    }
+    function ready(el) {
+        if (state === 'present') { return true; }
+        var visible = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) &&
+                      window.getComputedStyle(el).visibility !== 'hidden';
+        return state === 'visible' ? visible : visible && !el.disabled;
+    }
+    function query(selector) {
+        var found = [];
+        var nodes = document.querySelectorAll(selector);
+        for (var i = 0; i < nodes.length; i++) {
+            if (pattern.test(label(nodes[i]))) { found.push(nodes[i]); }
+        }
+        if (extraCss) {
+            var extra = document.querySelectorAll(extraCss);
+            for (var j = 0; j < extra.length; j++) {
+                if (found.indexOf(extra[j]) === -1) { found.push(extra[j]); }
+            }
+        }
+        return found;
+    }
+
+    if (!findAll) {
+        var cached = cache[key];
+        if (cached && cached.isConnected && ready(cached)) { return cached; }
+    }
+
+    var matches = [];
+    if (scopeCss && document.querySelector(scopeCss)) {
+        matches = query(css.split(',').map(function (tag) {
+            return scopeCss.split(',').map(function (scope) {
+                return scope.trim() + ' ' + tag.trim();
+            }).join(', ');
+        }).join(', '));
+    }
+    if (!matches.length) { matches = query(css); }
+
+    if (findAll) { return matches; }
+    for (var k = 0; k < matches.length; k++) {
+        if (ready(matches[k])) { cache[key] = matches[k]; return matches[k]; }
+    }
+    return null;
+"""
+
+
+def _escape_regex(text):
+    """Escape regex metacharacters so labels match literally"""
+    return ''.join('\\' + char if char in r'\^$.|?*+()[]{}' else char for char in text)
+
+
+class TextLocator(tuple):
+    """
+    Locator for elements (links, buttons, ...) whose label matches one of several texts
+
+    Behaves like a ``(by, value)`` tuple for logging and statistics; BasePage
+    resolves it with ``find``/``find_all``/``condition`` instead of
+    ``driver.find_element``.
+    """
+
+    BY = 'text'
+    SCRIPT = FIND_SCRIPT
+
+    def __new__(cls, *texts, tags=('a', 'button'), scope=None, extra_css=None):
+        """
+        Args:
+            *texts (str): Labels to match (case-insensitive, at a word start)
+            tags (tuple): Element tags to consider
+            scope (str): CSS of containers searched first; whole document if none match
+            extra_css (str): CSS of elements that match regardless of label
+        """
+        description = f"{'/'.join(texts)} in {','.join(tags)}"
+        if scope:
+            description += f" within {scope}"
+        if extra_css:
+            description += f" or {extra_css}"
+
+        locator = super().__new__(cls, (cls.BY, description))
+        locator.texts = texts
+        locator.css = ', '.join(tags)
+        locator.scope = scope
+        locator.extra_css = extra_css
+        locator.pattern = r'\b(' + '|'.join(_escape_regex(text) for text in texts) + ')'
+        return locator
+
+    @classmethod
+    def bilingual(cls, word, **kwargs):
+        """
+        Build a locator matching the EN and ID labels of a vocabulary word
+
+        Args:
+            word (str): Key in ``BILINGUAL`` (home, logout, save, ...)
+            **kwargs: Passed to the constructor (tags, scope, extra_css)
+
+        Returns:
+            TextLocator: Locator matching every translation
+        """
+        return cls(*BILINGUAL[word], **kwargs)
+
+    def script_args(self, state, find_all=False):
+        """Arguments for ``FIND_SCRIPT`` (also used by in-page observer waits)"""
+        return [self.css, self.scope, self.extra_css, self.pattern, state, self[1], find_all]
+
+    def _run(self, driver, state, find_all=False):
+        return driver.execute_script(FIND_SCRIPT, *self.script_args(state, find_all))
+
+    def find(self, driver, state='present'):
+        """
+        Return the first matching element in the given state, or None
+
+        Args:
+            driver (WebDriver): Driver to query
+            state (str): present, visible or clickable
+        """
+        return self._run(driver, state)
+
+    def find_all(self, driver):
+        """Return every matching element in document order"""
+        return self._run(driver, 'present', find_all=True) or []
+
+    def condition(self, state):
+        """Wait condition usable with ``WebDriverWait.until``"""
+        return lambda driver: self.find(driver, state) or False
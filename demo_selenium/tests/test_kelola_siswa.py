@@ -9,6 +9,7 @@ from webdriver_manager.chrome import ChromeDriverManager
 from pages.login_page import LoginPage
 from pages.kelola_siswa_page import KelolaSiswaPage
 from config.config import Config
+from factories.data_factory import SiswaFactory
 import time
 
 
@@ -50,6 +51,14 @@ def logged_in_driver(driver):
     return driver
 
 
+@pytest.fixture(scope="function")
+def siswa_factory(logged_in_driver):
+    """Namespaced siswa factory; everything it created is deleted after the test"""
+    factory = SiswaFactory()
+    yield factory
+    factory.cleanup(KelolaSiswaPage(logged_in_driver))
+
+
 def test_access_kelola_siswa_page(logged_in_driver):
     """Test accessing kelola siswa page"""
     kelola_siswa_page = KelolaSiswaPage(logged_in_driver)
@@ -67,64 +76,70 @@ def test_access_kelola_siswa_page(logged_in_driver):
     print(f"\n✅ Successfully accessed Kelola Siswa page: {current_url}")
 
 
-def test_add_siswa(logged_in_driver):
+def test_add_siswa(logged_in_driver, siswa_factory):
     """Test adding a new siswa"""
     kelola_siswa_page = KelolaSiswaPage(logged_in_driver)
     
     # Navigate to kelola siswa page
     kelola_siswa_page.open_kelola_siswa_page()
     
-    # Add new siswa
-    test_nama = "Test Siswa Automation"
-    test_nis = "123456789"
-    test_kelas = "12 IPA 1"
+    # Add new siswa (typed, this test covers the form itself)
+    record = siswa_factory.create(kelola_siswa_page, fast=False, kelas="12 IPA 1")
     
-    kelola_siswa_page.add_new_siswa(test_nama, test_nis, test_kelas)
-    
-    # Verify success message or table update
-    # Note: Adjust this based on actual application behavior
-    print(f"\n✅ Successfully attempted to add siswa: {test_nama}")
+    # Verify the siswa shows up in the table
+    kelola_siswa_page.open_kelola_siswa_page()
+    assert kelola_siswa_page.is_siswa_listed(record['nama'], record['nis']), \
+        f"Siswa {record['nama']} should be listed in the table"
+    print(f"\n✅ Successfully added siswa: {record['nama']}")
 
 
-def test_edit_siswa(logged_in_driver):
+def test_edit_siswa(logged_in_driver, siswa_factory):
     """Test editing an existing siswa"""
     kelola_siswa_page = KelolaSiswaPage(logged_in_driver)
     
-    # Navigate to kelola siswa page
+    # Navigate to kelola siswa page and create the siswa this test edits
+    kelola_siswa_page.open_kelola_siswa_page()
+    record = siswa_factory.create(kelola_siswa_page)
+    
+    # Click edit on our own siswa
     kelola_siswa_page.open_kelola_siswa_page()
+    kelola_siswa_page.click_edit_siswa(record['nama'])
+    
+    # Update siswa information (still namespaced, so cleanup finds it)
+    original_nama = record['nama']
+    updated_nama = siswa_factory.build()['nama']
+    kelola_siswa_page.type_text(kelola_siswa_page.NAMA_INPUT, updated_nama)
+    kelola_siswa_page.click_save()
     
-    # Click edit on first siswa
-    try:
-        kelola_siswa_page.click_edit_siswa()
-        
-        # Update siswa information
-        updated_nama = "Updated Siswa Name"
-        kelola_siswa_page.type_text(kelola_siswa_page.NAMA_INPUT, updated_nama)
-        kelola_siswa_page.click_save()
-        
-        print(f"\n✅ Successfully attempted to edit siswa")
-    except Exception as e:
-        print(f"\n⚠️ Edit test skipped or failed: {str(e)}")
-
-
-def test_delete_siswa(logged_in_driver):
+    # Verify the table shows the new name instead of the old one
+    kelola_siswa_page.open_kelola_siswa_page()
+    assert kelola_siswa_page.is_siswa_listed(updated_nama), \
+        f"Siswa {updated_nama} should be listed after editing"
+    record['nama'] = updated_nama
+    assert not kelola_siswa_page.is_siswa_listed(original_nama), \
+        f"Siswa {original_nama} should no longer be listed after editing"
+
+
+def test_delete_siswa(logged_in_driver, siswa_factory):
     """Test deleting a siswa"""
     kelola_siswa_page = KelolaSiswaPage(logged_in_driver)
     
-    # Navigate to kelola siswa page
+    # Navigate to kelola siswa page and create the siswa this test deletes
     kelola_siswa_page.open_kelola_siswa_page()
+    record = siswa_factory.create(kelola_siswa_page)
     
-    # Click delete on first siswa
-    try:
-        kelola_siswa_page.click_delete_siswa()
-        kelola_siswa_page.confirm_delete()
-        
-        print(f"\n✅ Successfully attempted to delete siswa")
-    except Exception as e:
-        print(f"\n⚠️ Delete test skipped or failed: {str(e)}")
+    # Click delete on our own siswa
+    kelola_siswa_page.open_kelola_siswa_page()
+    kelola_siswa_page.delete_siswa(record['nama'])
+    
+    # Verify the siswa is gone from the table (still tracked until then, so cleanup catches a failed delete)
+    kelola_siswa_page.open_kelola_siswa_page()
+    assert not kelola_siswa_page.is_siswa_listed(record['nama']), \
+        f"Siswa {record['nama']} should no longer be listed after deleting"
+    siswa_factory.forget(record)
 
 
-def test_kelola_siswa_full_flow(logged_in_driver):
+def test_kelola_siswa_full_flow(logged_in_driver, siswa_factory):
     """Test complete CRUD flow for kelola siswa"""
     kelola_siswa_page = KelolaSiswaPage(logged_in_driver)
     
@@ -133,19 +148,14 @@ def test_kelola_siswa_full_flow(logged_in_driver):
     assert kelola_siswa_page.is_table_visible(), "Table should be visible"
     print("\n✅ Step 1: Successfully accessed Kelola Siswa page")
     
-    # Step 2: Add siswa
-    test_nama = "Full Flow Test Siswa"
-    test_nis = "999888777"
-    test_kelas = "10 IPA 2"
+    # Step 2: Add siswa (tracked before submitting, so cleanup removes it even if this fails)
+    record = siswa_factory.create(kelola_siswa_page, kelas="10 IPA 2")
+    print(f"✅ Step 2: Successfully added siswa - {record['nama']}")
     
-    try:
-        kelola_siswa_page.add_new_siswa(test_nama, test_nis, test_kelas)
-        print(f"✅ Step 2: Successfully added siswa - {test_nama}")
-    except Exception as e:
-        print(f"⚠️ Step 2 failed: {str(e)}")
-    
-    # Step 3: Verify siswa was added (check table or success message)
-    time.sleep(1)
+    # Step 3: Verify siswa was added (whole table read in one call per page)
+    kelola_siswa_page.open_kelola_siswa_page()
+    assert kelola_siswa_page.is_siswa_listed(record['nama'], record['nis']), \
+        f"Siswa {record['nama']} should be listed in the table"
     print("✅ Step 3: Verified siswa addition")
     
     print("\n✅ Full flow test completed!")
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+Async base page for sessions driven by ``utils.async_webdriver``
+
+Mirrors the core ``BasePage`` operations as coroutines so one event loop can
+drive many browsers at once (crawls, viewport matrices, credential matrices).
+Waits resolve inside the page with the same MutationObserver script as the
+``observer`` wait backend, so a wait costs one round trip instead of a poll loop.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.config import Config
+from utils.dom_wait import OBSERVE_SCRIPT, SCRIPT_TIMEOUT_MARGIN, DomWait
+from utils.retry import async_retry_action
+from pages.base_page import BasePage
+from pages.text_locator import TextLocator
+
+# Poll interval for locators the in-page observer cannot resolve (link text)
+POLL_INTERVAL = 0.25
+
+
+class AsyncBasePage:
+    """Base class for async page objects working on an ``AsyncSession``"""
+
+    def __init__(self, session):
+        """
+        Args:
+            session (AsyncSession): Session to drive
+        """
+        self.session = session
+        self.timeout = BasePage.scaled_timeout(Config.EXPLICIT_WAIT)
+
+    def _timeout(self, timeout):
+        """Default wait, or the scaled custom timeout (same scale as BasePage)"""
+        return BasePage.scaled_timeout(timeout) if timeout else self.timeout
+
+    async def _wait_for(self, locator, state, timeout=None):
+        """
+        Wait until an element is present, visible or clickable
+
+        Args:
+            locator (tuple): Locator tuple or TextLocator
+            state (str): present, visible or clickable
+            timeout (int): Wait timeout, uses default if None
+
+        Returns:
+            AsyncElement: Matched element
+        """
+        seconds = self._timeout(timeout)
+        if not DomWait.supports(locator):
+            return await self._poll_for(locator, seconds)
+
+        if isinstance(locator, TextLocator):
+            spec = {'textScript': locator.SCRIPT, 'textArgs': locator.script_args(state)}
+        else:
+            spec = {'by': locator[0], 'value': locator[1], 'state': state}
+
+        await self._ensure_script_timeout(seconds)
+        deadline = time.monotonic() + seconds
+        result = None
+        while time.monotonic() < deadline:
+            remaining = deadline - time.monotonic()
+            try:
+                result = await self.session.execute_async_script(
+                    OBSERVE_SCRIPT, dict(spec, timeoutMs=int(remaining * 1000))
+                )
+                break
+            except WebDriverException as e:
+                # Navigation unloaded the observed document; watch the new one
+                if 'unload' not in str(e).lower():
+                    raise
+
+        if isinstance(result, dict) and 'error' in result:
+            raise WebDriverException(f"Element not {state}: {locator} ({result['error']})")
+        if not result:
+            raise TimeoutException(f"Element not {state}: {locator}")
+        return result
+
+    async def _poll_for(self, locator, seconds):
+        """Poll for a locator the in-page observer cannot resolve"""
+        deadline = time.monotonic() + seconds
+        while True:
+            elements = await self.session.find_elements(*locator)
+            if elements:
+                return elements[0]
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Element not found: {locator}")
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def _ensure_script_timeout(self, seconds):
+        """Raise the session's async script timeout once so it outlasts the wait"""
+        needed = seconds + SCRIPT_TIMEOUT_MARGIN
+        if getattr(self.session, '_dom_wait_script_timeout', 0) >= needed:
+            return
+        await self.session.set_timeouts(script=needed)
+        self.session._dom_wait_script_timeout = needed
+
+    async def navigate_to(self, url):
+        """Navigate to a specific URL"""
+        await self.session.get(url)
+
+    async def find_element(self, locator, timeout=None):
+        """
+        Find element with explicit wait
+
+        Args:
+            locator (tuple): Locator tuple (By.ID, 'element_id')
+            timeout (int): Wait timeout, uses default if None
+
+        Returns:
+            AsyncElement: Found element
+        """
+        return await self._wait_for(locator, 'present', timeout)
+
+    async def find_elements(self, locator, timeout=None):
+        """
+        Find multiple elements with explicit wait
+
+        Args:
+            locator (tuple): Locator tuple (By.CLASS_NAME, 'class_name')
+            timeout (int): Wait timeout, uses default if None
+
+        Returns:
+            list: List of AsyncElements
+        """
+        try:
+            await self._wait_for(locator, 'present', timeout)
+        except TimeoutException:
+            return []
+
+        if isinstance(locator, TextLocator):
+            return await self.session.execute_script(locator.SCRIPT,
+                                                     *locator.script_args('present', True))
+        return await self.session.find_elements(*locator)
+
+    async def click_element(self, locator, timeout=None):
+        """
+        Click element with explicit wait for clickability
+
+        Args:
+            locator (tuple): Locator tuple
+            timeout (int): Wait timeout
+        """
+        async def click():
+            element = await self._wait_for(locator, 'clickable', timeout)
+            await element.click()
+
+        await async_retry_action(click, locator)
+
+    async def send_keys_to_element(self, locator, text, clear_first=True, timeout=None):
+        """
+        Send keys to element with explicit wait
+
+        Args:
+            locator (tuple): Locator tuple
+            text (str): Text to send
+            clear_first (bool): Clear field before typing
+            timeout (int): Wait timeout
+        """
+        async def send_keys():
+            element = await self.find_element(locator, timeout)
+            if clear_first:
+                await element.clear()
+            await element.send_keys(text)
+
+        await async_retry_action(send_keys, locator)
+
+    async def get_text(self, locator, timeout=None):
+        """
+        Get text from element
+
+        Args:
+            locator (tuple): Locator tuple
+            timeout (int): Wait timeout
+
+        Returns:
+            str: Element text
+        """
+        async def text():
+            return await (await self.find_element(locator, timeout)).text()
+
+        return await async_retry_action(text, locator)
+
+    async def is_element_visible(self, locator, timeout=5):
+        """
+        Check if element is visible
+
+        Args:
+            locator (tuple): Locator tuple
+            timeout (int): Wait timeout
+
+        Returns:
+            bool: True if visible, False otherwise
+        """
+        try:
+            await self._wait_for(locator, 'visible', timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    async def wait_for_page_to_load(self, timeout=None):
+        """Wait for the page to finish loading (one in-page round trip)"""
+        seconds = self._timeout(timeout)
+        await self._ensure_script_timeout(seconds)
+        ready = await self.session.execute_async_script(
+            OBSERVE_SCRIPT, {'readyState': 'complete', 'timeoutMs': int(seconds * 1000)}
+        )
+        if not ready:
+            raise TimeoutException("Page did not reach readyState 'complete'")
+
+    async def take_snapshot(self, name="snapshot"):
+        """
+        Save a screenshot of the viewport to the screenshots directory
+
+        Args:
+            name (str): Prefix for the screenshot filename
+
+        Returns:
+            str: Path to saved screenshot
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        filepath = os.path.join(Config.SCREENSHOTS_PATH, f"{name}_{timestamp}.png")
+        png = await self.session.screenshot()
+        with open(filepath, 'wb') as f:
+            f.write(png)
+        return filepath
+
+    async def get_page_title(self):
+        """Get page title"""
+        return await self.session.title()
+
+    async def get_current_url(self):
+        """Get current URL"""
+        return await self.session.current_url()
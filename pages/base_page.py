@@ -1,18 +1,202 @@
 """
 Base Page class implementing Page Object Model pattern
 """
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from config.config import Config
+from utils.retry import retry_action, locator_key
+from utils.locator_health import split_alternatives, chain_key
+from utils.dom_wait import DomWait
+from pages.text_locator import TextLocator
+from pages import form_fill, table_reader
+
+# Expected conditions for plain (By, value) locators, keyed by element state.
+# Names only: selenium.webdriver.support pulls in the whole remote WebDriver,
+# so it is imported when the first page object is built, not at collection.
+CONDITIONS = {
+    'present': 'presence_of_element_located',
+    'visible': 'visibility_of_element_located',
+    'clickable': 'element_to_be_clickable',
+}
 
 class BasePage:
     """Base page class with common functionality"""
     
+    # Multiplier applied to every wait budget (set from the session health probe)
+    wait_scale = 1.0
+    
+    # Shared LocatorHealthIndex (set by conftest); None disables instrumentation
+    locator_index = None
+    _profiled_locators = set()
+    
+    # Counts matches of each alternative of a compound selector in one round trip
+    COUNT_ALTERNATIVES_SCRIPT = """
+        return arguments[0].map(function (alt) {
+            try {
+                if (alt[0] === 'xpath') {
+                    return document.evaluate(alt[1], document, null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+                }
+                return document.querySelectorAll(alt[1]).length;
+            } catch (e) {
+                return 0;
+            }
+        });
+    """
+    
     def __init__(self, driver):
+        from selenium.webdriver.support.ui import WebDriverWait
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self.wait = WebDriverWait(driver, self.scaled_timeout(Config.EXPLICIT_WAIT))
+    
+    @classmethod
+    def set_wait_scale(cls, scale):
+        """
+        Scale all wait budgets, e.g. lengthen them when the target is slow
+        
+        Args:
+            scale (float): Multiplier applied to configured timeouts
+        """
+        cls.wait_scale = scale
+    
+    @classmethod
+    def scaled_timeout(cls, timeout):
+        """
+        Apply the wait scale to a timeout
+        
+        Args:
+            timeout (float): Configured timeout in seconds
+        
+        Returns:
+            float: Scaled timeout, never below one second
+        """
+        return max(1.0, timeout * cls.wait_scale)
+    
+    def _get_wait(self, timeout=None):
+        """Return the default wait, or a scaled one-off wait for a custom timeout"""
+        if timeout:
+            from selenium.webdriver.support.ui import WebDriverWait
+            return WebDriverWait(self.driver, self.scaled_timeout(timeout))
+        return self.wait
+    
+    def _wait_for(self, locator, state, timeout=None):
+        """
+        Wait until an element is present, visible or clickable
+        
+        Uses in-page MutationObserver waits when WAIT_BACKEND is 'observer'
+        (one round trip), otherwise WebDriverWait polling.
+        
+        Args:
+            locator (tuple): Locator tuple or TextLocator
+            state (str): present, visible or clickable
+            timeout (int): Wait timeout, uses default if None
+        
+        Returns:
+            WebElement: Matched element
+        """
+        if Config.WAIT_BACKEND == 'observer' and DomWait.supports(locator):
+            seconds = self.scaled_timeout(timeout or Config.EXPLICIT_WAIT)
+            return DomWait(self.driver, seconds).until_element(locator, state)
+        return self._get_wait(timeout).until(self._condition(locator, state))
+    
+    def _condition(self, locator, state):
+        """Wait condition for a (By, value) tuple or a TextLocator"""
+        if isinstance(locator, TextLocator):
+            return locator.condition(state)
+        from selenium.webdriver.support import expected_conditions
+        return getattr(expected_conditions, CONDITIONS[state])(locator)
+    
+    def _find_all_now(self, locator):
+        """Find all matches immediately, without waiting"""
+        if isinstance(locator, TextLocator):
+            return locator.find_all(self.driver)
+        return self.driver.find_elements(*locator)
+    
+    def _record_lookup(self, locator, hit, start, matches=None):
+        """Record a locator resolution in the health index"""
+        if self.locator_index is None:
+            return
+        
+        self.locator_index.record(locator_key(locator), hit, time.perf_counter() - start, matches)
+        
+        if hit and Config.LOCATOR_PROFILING:
+            self._profile_alternatives(locator)
+    
+    def _profile_alternatives(self, locator):
+        """Record which alternatives of a compound selector match, once per page"""
+        alternatives = split_alternatives(locator)
+        if len(alternatives) < 2:
+            return
+        
+        profile_key = (locator, self.driver.current_url)
+        if profile_key in self._profiled_locators:
+            return
+        
+        self._profiled_locators.add(profile_key)
+        try:
+            counts = self.driver.execute_script(self.COUNT_ALTERNATIVES_SCRIPT,
+                                                [list(alt) for alt in alternatives])
+        except Exception as e:
+            print(f"Warning: Could not profile locator {locator}: {e}")
+            return
+        
+        self.locator_index.record_alternatives(
+            locator_key(locator),
+            {locator_key(alt): count for alt, count in zip(alternatives, counts)}
+        )
+    
+    def resolve_locator(self, locators, timeout=None):
+        """
+        Resolve a fallback chain to the first locator that matches
+        
+        Alternatives are tried in the order ranked by the locator health index
+        (not yet judged first, then fastest working) within a single wait,
+        instead of paying a full timeout per failing alternative. Each
+        alternative tried is recorded as a hit or miss with its own probe time.
+        
+        Args:
+            locators (tuple): Locator tuples in declared fallback order
+            timeout (int): Wait timeout, uses default if None
+        
+        Returns:
+            tuple: The locator that matched
+        """
+        ordered = self.locator_index.rank(locators) if self.locator_index else list(locators)
+        # Probe time per alternative, summed over all polls
+        spent = {}
+        # Alternatives tried in the latest poll: up to the winner, or all of them
+        attempts = {}
+        
+        def first_match(driver):
+            attempts.clear()
+            for locator in ordered:
+                key = locator_key(locator)
+                probe = time.perf_counter()
+                found = self._find_all_now(locator)
+                spent[key] = spent.get(key, 0.0) + time.perf_counter() - probe
+                attempts[key] = spent[key]
+                if found:
+                    return locator
+            return False
+        
+        start = time.perf_counter()
+        # Implicit wait would block on every missing alternative
+        self.driver.implicitly_wait(0)
+        try:
+            locator = self._get_wait(timeout).until(first_match)
+        except TimeoutException:
+            if self.locator_index is not None:
+                self.locator_index.record_chain(chain_key(locators), time.perf_counter() - start,
+                                                attempts)
+            raise TimeoutException(f"None of the locators matched: {locators}")
+        finally:
+            self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
+        
+        if self.locator_index is not None:
+            self.locator_index.record_chain(chain_key(locators), time.perf_counter() - start,
+                                            attempts, winner=locator_key(locator))
+        return locator
     
     def navigate_to(self, url):
         """Navigate to a specific URL"""
@@ -29,15 +213,16 @@ class BasePage:
         Returns:
             WebElement: Found element
         """
-        if timeout:
-            wait = WebDriverWait(self.driver, timeout)
-        else:
-            wait = self.wait
+        start = time.perf_counter()
         
         try:
-            return wait.until(EC.presence_of_element_located(locator))
+            element = self._wait_for(locator, 'present', timeout)
         except TimeoutException:
+            self._record_lookup(locator, False, start)
             raise TimeoutException(f"Element not found: {locator}")
+        
+        self._record_lookup(locator, True, start)
+        return element
     
     def find_elements(self, locator, timeout=None):
         """
@@ -50,16 +235,17 @@ class BasePage:
         Returns:
             list: List of WebElements
         """
-        if timeout:
-            wait = WebDriverWait(self.driver, timeout)
-        else:
-            wait = self.wait
+        start = time.perf_counter()
         
         try:
-            wait.until(EC.presence_of_element_located(locator))
-            return self.driver.find_elements(*locator)
+            self._wait_for(locator, 'present', timeout)
+            elements = self._find_all_now(locator)
         except TimeoutException:
+            self._record_lookup(locator, False, start, matches=0)
             return []
+        
+        self._record_lookup(locator, True, start, matches=len(elements))
+        return elements
     
     def click_element(self, locator, timeout=None):
         """
@@ -69,13 +255,17 @@ class BasePage:
             locator (tuple): Locator tuple
             timeout (int): Wait timeout
         """
-        if timeout:
-            wait = WebDriverWait(self.driver, timeout)
-        else:
-            wait = self.wait
+        def click():
+            start = time.perf_counter()
+            try:
+                element = self._wait_for(locator, 'clickable', timeout)
+            except TimeoutException:
+                self._record_lookup(locator, False, start)
+                raise
+            self._record_lookup(locator, True, start)
+            element.click()
         
-        element = wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        retry_action(click, locator)
     
     def send_keys_to_element(self, locator, text, clear_first=True, timeout=None):
         """
@@ -87,10 +277,54 @@ class BasePage:
             clear_first (bool): Clear field before typing
             timeout (int): Wait timeout
         """
-        element = self.find_element(locator, timeout)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def send_keys():
+            element = self.find_element(locator, timeout)
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        
+        retry_action(send_keys, locator)
+    
+    def fill_form(self, mapping, timeout=None):
+        """
+        Fill several fields in one injected script (no keystroke simulation)
+        
+        Fires input/change events so the page's scripts see the new values.
+        Use ``send_keys_to_element`` where keystroke fidelity matters.
+        
+        Args:
+            mapping (dict): Locator tuple -> value
+            timeout (int): Wait timeout for the form to appear
+        
+        Returns:
+            dict: Validation state ``{'valid': bool, 'errors': {locator key: message}}``
+        
+        Raises:
+            ValueError: If mapping is empty
+        """
+        if not mapping:
+            raise ValueError("fill_form needs at least one field to fill")
+        
+        # One wait for the form to render, then a single round trip for all fields
+        self._wait_for(next(iter(mapping)), 'present', timeout)
+        return form_fill.fill_form(self.driver, mapping)
+    
+    def read_table(self, locator, follow_pagination=True, timeout=None):
+        """
+        Read a whole table (all pages) in one script call per page
+        
+        Args:
+            locator (tuple): Locator of the table
+            follow_pagination (bool): Click through "next" until the last page
+            timeout (int): Wait timeout for the table and for each next page
+        
+        Returns:
+            pandas.DataFrame: Cell text per header column plus an ``actions`` column
+        """
+        self._wait_for(locator, 'present', timeout)
+        next_css = table_reader.NEXT_CSS if follow_pagination else None
+        return table_reader.read_table(self.driver, locator, next_css=next_css,
+                                       timeout=self.scaled_timeout(timeout or Config.EXPLICIT_WAIT))
     
     def get_text(self, locator, timeout=None):
         """
@@ -103,8 +337,7 @@ class BasePage:
         Returns:
             str: Element text
         """
-        element = self.find_element(locator, timeout)
-        return element.text
+        return retry_action(lambda: self.find_element(locator, timeout).text, locator)
     
     def get_attribute(self, locator, attribute_name, timeout=None):
         """
@@ -118,8 +351,9 @@ class BasePage:
         Returns:
             str: Attribute value
         """
-        element = self.find_element(locator, timeout)
-        return element.get_attribute(attribute_name)
+        return retry_action(
+            lambda: self.find_element(locator, timeout).get_attribute(attribute_name), locator
+        )
     
     def is_element_visible(self, locator, timeout=5):
         """
@@ -132,12 +366,15 @@ class BasePage:
         Returns:
             bool: True if element is visible
         """
+        start = time.perf_counter()
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
-            return True
+            self._wait_for(locator, 'visible', timeout)
         except TimeoutException:
+            self._record_lookup(locator, False, start)
             return False
+        
+        self._record_lookup(locator, True, start)
+        return True
     
     def is_element_present(self, locator):
         """
@@ -149,11 +386,19 @@ class BasePage:
         Returns:
             bool: True if element is present
         """
+        start = time.perf_counter()
         try:
-            self.driver.find_element(*locator)
-            return True
+            if isinstance(locator, TextLocator):
+                if locator.find(self.driver) is None:
+                    raise NoSuchElementException(f"Element not found: {locator}")
+            else:
+                self.driver.find_element(*locator)
         except NoSuchElementException:
+            self._record_lookup(locator, False, start)
             return False
+        
+        self._record_lookup(locator, True, start)
+        return True
     
     def wait_for_page_to_load(self, timeout=None):
         """
@@ -162,13 +407,31 @@ class BasePage:
         Args:
             timeout (int): Wait timeout
         """
-        if timeout:
-            wait = WebDriverWait(self.driver, timeout)
-        else:
-            wait = self.wait
+        if Config.WAIT_BACKEND == 'observer':
+            seconds = self.scaled_timeout(timeout or Config.EXPLICIT_WAIT)
+            DomWait(self.driver, seconds).until_ready_state('complete')
+            return
         
+        wait = self._get_wait(timeout)
         wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
     
+    def wait_until(self, condition, timeout=None):
+        """
+        Wait for a condition on the page, e.g. a redirect after a form submit
+        
+        Args:
+            condition (callable): Called without arguments until it returns True
+            timeout (int): Wait timeout, uses default if None
+        
+        Returns:
+            bool: True if the condition held within the timeout
+        """
+        try:
+            self._get_wait(timeout).until(lambda driver: condition())
+            return True
+        except TimeoutException:
+            return False
+    
     def scroll_to_element(self, locator):
         """
         Scroll to element
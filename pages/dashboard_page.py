@@ -3,6 +3,7 @@ Dashboard/Home Page Object for MathsTeam website
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from pages.text_locator import TextLocator, NAVIGATION_SCOPE
 from config.config import Config
 
 class DashboardPage(BasePage):
@@ -25,12 +26,12 @@ class DashboardPage(BasePage):
     # User-related elements
     USER_PROFILE = (By.CSS_SELECTOR, ".user-profile, .profile-dropdown, .user-menu")
     USER_NAME = (By.CSS_SELECTOR, ".user-name, .username, .profile-name")
-    LOGOUT_LINK = (By.XPATH, "//a[contains(text(), 'Logout')] | //button[contains(text(), 'Logout')] | //a[contains(text(), 'Keluar')]")
+    LOGOUT_LINK = TextLocator.bilingual('logout', scope=NAVIGATION_SCOPE)
     
     # Common navigation links
-    HOME_LINK = (By.XPATH, "//a[contains(text(), 'Home')] | //a[contains(text(), 'Beranda')]")
-    PROFILE_LINK = (By.XPATH, "//a[contains(text(), 'Profile')] | //a[contains(text(), 'Profil')]")
-    SETTINGS_LINK = (By.XPATH, "//a[contains(text(), 'Settings')] | //a[contains(text(), 'Pengaturan')]")
+    HOME_LINK = TextLocator.bilingual('home', tags=('a',), scope=NAVIGATION_SCOPE)
+    PROFILE_LINK = TextLocator.bilingual('profile', tags=('a',), scope=NAVIGATION_SCOPE)
+    SETTINGS_LINK = TextLocator.bilingual('settings', tags=('a',), scope=NAVIGATION_SCOPE)
     
     # Content sections
     CARDS = (By.CSS_SELECTOR, ".card, .widget, .panel")
@@ -194,6 +195,16 @@ class DashboardPage(BasePage):
         except:
             return False
     
+    def is_logged_out(self):
+        """
+        Check if the browser is where logout leads (login or home page)
+        
+        Returns:
+            bool: True if on the login or home page
+        """
+        current_url = self.get_current_url().lower()
+        return 'login' in current_url or current_url.rstrip('/') == Config.BASE_URL.rstrip('/').lower()
+    
     def is_user_logged_in(self):
         """
         Check if user is logged in by looking for user-specific elements
@@ -0,0 +1,90 @@
+"""
+Fill a whole form in one injected script
+
+``send_keys`` simulates every keystroke over its own protocol traffic; for
+data-setup flows where keystroke fidelity doesn't matter, setting every field
+value in the page and dispatching ``input``/``change`` events is one round
+trip for the whole form. Values go through the native value setter so
+frameworks that track inputs (React, Vue, Livewire) notice the change.
+"""
+from selenium.common.exceptions import NoSuchElementException
+
+# Arguments: fields [{by, value, text}]; returns {missing, errors, valid}
+FILL_SCRIPT = """
+    var fields = arguments[0];
+    var result = {missing: [], errors: {}, valid: true};
+    var forms = [];
+
+    function locate(by, value) {
+        switch (by) {
+            case 'id': return document.getElementById(value);
+            case 'name': return document.getElementsByName(value)[0] || null;
+            case 'class name': return document.getElementsByClassName(value)[0] || null;
+            case 'tag name': return document.getElementsByTagName(value)[0] || null;
+            case 'css selector': return document.querySelector(value);
+            case 'xpath':
+                return document.evaluate(value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return null;
+    }
+    function setValue(el, text) {
+        var type = (el.type || '').toLowerCase();
+        if (type === 'checkbox' || type === 'radio') {
+            el.checked = text === true || text === 'true' || text === 'on' || text === '1';
+            return;
+        }
+        var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype :
+                    el instanceof HTMLSelectElement ? HTMLSelectElement.prototype :
+                    HTMLInputElement.prototype;
+        var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        setter.call(el, text);
+    }
+
+    fields.forEach(function (field) {
+        var key = field.by + '=' + field.value;
+        var el = locate(field.by, field.value);
+        if (!el) { result.missing.push(key); return; }
+
+        el.focus();
+        setValue(el, field.text);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+
+        if (el.willValidate && !el.checkValidity()) {
+            result.errors[key] = el.validationMessage;
+        }
+        if (el.form && forms.indexOf(el.form) === -1) { forms.push(el.form); }
+    });
+
+    forms.forEach(function (form) {
+        if (!form.checkValidity()) { result.valid = false; }
+    });
+    result.valid = result.valid && !result.missing.length && !Object.keys(result.errors).length;
+    return result;
+"""
+
+
+def fill_form(driver, mapping):
+    """
+    Set every field of a form in one round trip
+
+    Args:
+        driver (WebDriver): Driver to use
+        mapping (dict): Locator tuple (By.ID, 'nama') -> value; booleans
+            check/uncheck checkboxes and radios
+
+    Returns:
+        dict: Validation state ``{'valid': bool, 'errors': {locator key: message}}``
+
+    Raises:
+        NoSuchElementException: If any field could not be located
+    """
+    fields = [{'by': by, 'value': value, 'text': text if isinstance(text, bool) else str(text)}
+              for (by, value), text in mapping.items()]
+    result = driver.execute_script(FILL_SCRIPT, fields)
+
+    if result['missing']:
+        raise NoSuchElementException(f"Form fields not found: {', '.join(result['missing'])}")
+    return {'valid': result['valid'], 'errors': result['errors']}
@@ -3,6 +3,7 @@ Login Page Object for MathsTeam website
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from pages.text_locator import TextLocator, NAVIGATION_SCOPE
 from config.config import Config
 
 class LoginPage(BasePage):
@@ -22,6 +23,11 @@ class LoginPage(BasePage):
     LOGIN_BUTTON_ALT = (By.CSS_SELECTOR, "input[type='submit']")
     LOGIN_BUTTON_ALT2 = (By.CSS_SELECTOR, ".btn-login")
     
+    # Fallback chains (ranked at runtime by the locator health index)
+    EMAIL_INPUTS = (EMAIL_INPUT, EMAIL_INPUT_ALT)
+    PASSWORD_INPUTS = (PASSWORD_INPUT, PASSWORD_INPUT_ALT)
+    LOGIN_BUTTONS = (LOGIN_BUTTON, LOGIN_BUTTON_ALT, LOGIN_BUTTON_ALT2)
+    
     # Error and success elements
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-danger, .error-message, .invalid-feedback")
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".alert-success, .success-message")
@@ -29,7 +35,7 @@ class LoginPage(BasePage):
     # Dashboard elements (to verify successful login)
     DASHBOARD_HEADER = (By.CSS_SELECTOR, "h1, .dashboard-title")
     USER_PROFILE = (By.CSS_SELECTOR, ".user-profile, .profile-dropdown")
-    LOGOUT_BUTTON = (By.XPATH, "//a[contains(text(), 'Logout')] | //button[contains(text(), 'Logout')]")
+    LOGOUT_BUTTON = TextLocator.bilingual('logout', scope=NAVIGATION_SCOPE)
     
     def __init__(self, driver):
         super().__init__(driver)
@@ -46,11 +52,7 @@ class LoginPage(BasePage):
         Args:
             email (str): Email address to enter
         """
-        try:
-            self.send_keys_to_element(self.EMAIL_INPUT, email)
-        except:
-            # Try alternative locator
-            self.send_keys_to_element(self.EMAIL_INPUT_ALT, email)
+        self.send_keys_to_element(self.resolve_locator(self.EMAIL_INPUTS), email)
     
     def enter_password(self, password):
         """
@@ -59,29 +61,20 @@ class LoginPage(BasePage):
         Args:
             password (str): Password to enter
         """
-        try:
-            self.send_keys_to_element(self.PASSWORD_INPUT, password)
-        except:
-            # Try alternative locator
-            self.send_keys_to_element(self.PASSWORD_INPUT_ALT, password)
+        self.send_keys_to_element(self.resolve_locator(self.PASSWORD_INPUTS), password)
     
     def click_login_button(self):
         """Click the login button"""
-        try:
-            self.click_element(self.LOGIN_BUTTON)
-        except:
-            try:
-                self.click_element(self.LOGIN_BUTTON_ALT)
-            except:
-                self.click_element(self.LOGIN_BUTTON_ALT2)
+        self.click_element(self.resolve_locator(self.LOGIN_BUTTONS))
     
-    def login(self, email=None, password=None):
+    def login(self, email=None, password=None, fast=False):
         """
         Perform complete login process
         
         Args:
             email (str): Email address (uses config default if None)
             password (str): Password (uses config default if None)
+            fast (bool): Fill both fields in one script instead of typing them
         
         Returns:
             bool: True if login appears successful
@@ -92,8 +85,14 @@ class LoginPage(BasePage):
             password = Config.LOGIN_PASSWORD
         
         self.navigate_to_login()
-        self.enter_email(email)
-        self.enter_password(password)
+        if fast:
+            self.fill_form({
+                self.resolve_locator(self.EMAIL_INPUTS): email,
+                self.resolve_locator(self.PASSWORD_INPUTS): password,
+            })
+        else:
+            self.enter_email(email)
+            self.enter_password(password)
         self.click_login_button()
         
         # Wait for page to load after login attempt
@@ -171,19 +170,8 @@ class LoginPage(BasePage):
     
     def clear_login_fields(self):
         """Clear both email and password fields"""
-        try:
-            email_field = self.find_element(self.EMAIL_INPUT)
-            email_field.clear()
-        except:
-            email_field = self.find_element(self.EMAIL_INPUT_ALT)
-            email_field.clear()
-        
-        try:
-            password_field = self.find_element(self.PASSWORD_INPUT)
-            password_field.clear()
-        except:
-            password_field = self.find_element(self.PASSWORD_INPUT_ALT)
-            password_field.clear()
+        self.find_element(self.resolve_locator(self.EMAIL_INPUTS)).clear()
+        self.find_element(self.resolve_locator(self.PASSWORD_INPUTS)).clear()
     
     def verify_page_loaded(self):
         """
@@ -0,0 +1,94 @@
+"""
+Smoke flows shared by the smoke tests and the synthetic monitor
+
+Each flow drives the page objects through one user journey and asserts its
+outcome, so ``test_valid_login`` and the monitor's ``valid_login`` check run
+the same steps and fail on the same conditions. Setup that only one caller
+needs (a fresh driver per test, cookie cleanup on the monitor's warm
+browser) stays with the caller.
+"""
+from config.config import Config
+from pages.base_page import BasePage
+from pages.dashboard_page import DashboardPage
+from pages.login_page import LoginPage
+
+# Seconds to wait for the redirect after submitting login or clicking logout
+REDIRECT_TIMEOUT = 5
+
+
+def website_accessibility(driver):
+    """
+    Load the home page and check it has a title
+
+    Returns:
+        str: Page title
+    """
+    page = BasePage(driver)
+    page.navigate_to(Config.BASE_URL)
+    page.wait_for_page_to_load()
+    title = page.get_page_title()
+    assert title, "Page title should not be empty"
+    return title
+
+
+def valid_login(driver, email=None, password=None):
+    """
+    Log in through the login form and check the redirect away from it
+
+    Args:
+        email (str): Email address (uses config default if None)
+        password (str): Password (uses config default if None)
+    """
+    login_page = LoginPage(driver)
+    login_page.navigate_to_login()
+    assert login_page.is_on_login_page(), "Should be on login page"
+
+    assert login_page.login(email, password), "Login should be successful"
+    assert login_page.wait_until(lambda: not login_page.is_on_login_page(), REDIRECT_TIMEOUT), \
+        "Should be redirected away from login page"
+
+    dashboard = DashboardPage(driver)
+    if dashboard.is_on_dashboard():
+        assert dashboard.verify_page_loaded(), "Dashboard should load properly"
+
+
+def logout_functionality(driver):
+    """
+    Log out through the navigation's logout control
+
+    Returns:
+        bool: True if logged out, False if the page has no logout control
+
+    Raises:
+        AssertionError: If logout did not lead to the login or home page
+    """
+    dashboard = DashboardPage(driver)
+    if not dashboard.logout():
+        return False
+    assert dashboard.wait_until(dashboard.is_logged_out, REDIRECT_TIMEOUT), \
+        f"Not logged out, still on {dashboard.get_current_url()}"
+    return True
+
+
+def dashboard_accessibility_after_login(driver, email=None, password=None, relogin=False):
+    """
+    Open the dashboard of a logged-in session and check it loaded
+
+    Args:
+        email (str): Email address for relogin (uses config default if None)
+        password (str): Password for relogin (uses config default if None)
+        relogin (bool): Log in again if the session was sent to the login page
+            (first use or an expired session) instead of failing
+    """
+    dashboard = DashboardPage(driver)
+    login_page = LoginPage(driver)
+    dashboard.navigate_to_dashboard()
+    if relogin and login_page.is_on_login_page():
+        assert login_page.login(email, password), "Login should be successful"
+        dashboard.navigate_to_dashboard()
+
+    if dashboard.is_on_dashboard():
+        assert dashboard.verify_page_loaded(), "Dashboard should load with basic elements"
+    else:
+        # If not explicitly on dashboard, at least verify we're not on login page
+        assert not login_page.is_on_login_page(), "Should not be on login page after successful login"
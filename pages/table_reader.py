@@ -0,0 +1,168 @@
+"""
+Read a whole HTML table in one injected script per page
+
+Serializes headers, cell text and per-row action links (edit/delete buttons,
+detail links) in a single ``execute_script`` call instead of one WebElement
+read per cell, follows the table's pagination and returns a pandas DataFrame.
+"""
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+# Pagination controls searched for the "next page" link
+NEXT_CSS = ".pagination a, .pagination button, .dataTables_paginate a, a[rel='next']"
+
+# Labels of "next page" controls (EN/ID and arrow glyphs)
+NEXT_PATTERN = r"^\s*(next|selanjutnya|berikutnya|»|›|>)\s*$"
+
+# Arguments: by, value, nextCss (null: current page only), nextPattern
+# Returns {headers, rows: [{cells, actions: [{text, href}]}], next: element|null} or null
+READ_SCRIPT = """
+    var by = arguments[0], value = arguments[1], nextCss = arguments[2];
+    var nextPattern = new RegExp(arguments[3], 'i');
+
+    function locate() {
+        switch (by) {
+            case 'id': return document.getElementById(value);
+            case 'name': return document.getElementsByName(value)[0] || null;
+            case 'class name': return document.getElementsByClassName(value)[0] || null;
+            case 'tag name': return document.getElementsByTagName(value)[0] || null;
+            case 'css selector': return document.querySelector(value);
+            case 'xpath':
+                return document.evaluate(value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return null;
+    }
+    function text(el) {
+        return (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim();
+    }
+    function label(el) {
+        return text(el) || el.getAttribute('title') || el.getAttribute('aria-label') || '';
+    }
+    function disabled(el) {
+        return el.disabled || el.getAttribute('aria-disabled') === 'true' ||
+               !!el.closest('.disabled');
+    }
+
+    var table = locate();
+    if (!table) { return null; }
+    if (table.tagName !== 'TABLE') { table = table.querySelector('table'); }
+    if (!table) { return null; }
+
+    var headers = [];
+    if (table.tHead && table.tHead.rows.length) {
+        var headRow = table.tHead.rows[table.tHead.rows.length - 1];
+        headers = Array.prototype.map.call(headRow.cells, text);
+    }
+
+    var rows = [];
+    var bodies = table.tBodies.length ? table.tBodies : [table];
+    Array.prototype.forEach.call(bodies, function (body) {
+        Array.prototype.forEach.call(body.rows, function (row) {
+            if (table.tHead && row.parentNode === table.tHead) { return; }
+            var cells = Array.prototype.map.call(row.cells, text);
+            var allHeaders = row.cells.length &&
+                Array.prototype.every.call(row.cells, function (c) { return c.tagName === 'TH'; });
+            if (!headers.length && allHeaders) { headers = cells; return; }
+            // Placeholder rows such as "No data available" span the whole table
+            if (row.cells.length === 1 && row.cells[0].colSpan > 1) { return; }
+
+            var actions = Array.prototype.map.call(row.querySelectorAll('a, button'), function (el) {
+                return {text: label(el), href: el.getAttribute('href')};
+            });
+            rows.push({cells: cells, actions: actions});
+        });
+    });
+
+    var next = null;
+    // No selector means pagination is not followed (querySelectorAll('') throws)
+    var controls = nextCss ? document.querySelectorAll(nextCss) : [];
+    for (var i = 0; i < controls.length; i++) {
+        var control = controls[i];
+        var isNext = control.getAttribute('rel') === 'next' ||
+                     nextPattern.test(label(control)) ||
+                     /\\bnext\\b/i.test(control.className + ' ' + control.parentNode.className);
+        if (isNext && !disabled(control)) { next = control; break; }
+    }
+
+    return {headers: headers, rows: rows, next: next};
+"""
+
+
+def _read_page(driver, locator, next_css):
+    return driver.execute_script(READ_SCRIPT, locator[0], locator[1], next_css, NEXT_PATTERN)
+
+
+def _signature(page):
+    """Identity of a page of rows, to detect that pagination moved on"""
+    return tuple(tuple(row['cells']) for row in page['rows'])
+
+
+def _column_names(headers, width):
+    """Unique column names; blank or duplicate headers become column_<n>"""
+    names = []
+    for index in range(width):
+        name = headers[index] if index < len(headers) else ''
+        if not name or name in names:
+            name = f"column_{index}"
+        names.append(name)
+    return names
+
+
+def read_table(driver, locator, next_css=NEXT_CSS, max_pages=50, timeout=10):
+    """
+    Read every row of a (paginated) table into a DataFrame
+
+    Args:
+        driver (WebDriver): Driver to use
+        locator (tuple): Locator of the table (or of an element containing it)
+        next_css (str): CSS of pagination controls to search for "next"; None
+            reads only the current page
+        max_pages (int): Safety cap on the number of pages followed
+        timeout (float): Seconds to wait for the next page to render
+
+    Returns:
+        pandas.DataFrame: One row per table row, one column per header, plus an
+        ``actions`` column holding the row's links/buttons as {text, href} dicts
+
+    Raises:
+        NoSuchElementException: If the table is not on the page
+    """
+    import pandas as pd
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    page = _read_page(driver, locator, next_css)
+    if page is None:
+        raise NoSuchElementException(f"Table not found: {locator}")
+
+    headers = page['headers']
+    rows = list(page['rows'])
+    pages_read = 1
+
+    while page['next'] is not None and pages_read < max_pages:
+        previous = _signature(page)
+        driver.execute_script("arguments[0].click();", page['next'])
+
+        def next_page(driver):
+            candidate = _read_page(driver, locator, next_css)
+            return candidate if candidate and _signature(candidate) != previous else False
+
+        # Works for both full reloads and in-place (AJAX) pagination
+        page = WebDriverWait(driver, timeout, ignored_exceptions=(
+            JavascriptException, StaleElementReferenceException,
+        )).until(next_page)
+        rows.extend(page['rows'])
+        pages_read += 1
+
+    width = max([len(headers)] + [len(row['cells']) for row in rows])
+    columns = _column_names(headers, width)
+    records = []
+    for row in rows:
+        record = dict(zip(columns, row['cells'] + [''] * (width - len(row['cells']))))
+        record['actions'] = row['actions']
+        records.append(record)
+
+    return pd.DataFrame(records, columns=columns + ['actions'])
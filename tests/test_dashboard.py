@@ -5,6 +5,7 @@ import pytest
 import time
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
+from pages import smoke_flows
 from config.config import Config
 
 class TestDashboard:
@@ -42,18 +43,8 @@ class TestDashboard:
         2. Verify we can access dashboard
         3. Verify basic dashboard elements are present
         """
-        # Try to navigate to dashboard
-        self.dashboard_page.navigate_to_dashboard()
-        
-        # Verify we're on dashboard or home page
-        is_on_dashboard = self.dashboard_page.is_on_dashboard()
-        
-        if is_on_dashboard:
-            # Verify page loaded properly
-            assert self.dashboard_page.verify_page_loaded(), "Dashboard should load with basic elements"
-        else:
-            # If not explicitly on dashboard, at least verify we're not on login page
-            assert not self.login_page.is_on_login_page(), "Should not be on login page after successful login"
+        # Same steps as the synthetic monitor's check, without its relogin
+        smoke_flows.dashboard_accessibility_after_login(self.driver)
     
     @pytest.mark.regression
     @pytest.mark.dashboard
@@ -244,24 +235,9 @@ class TestDashboard:
         """
         Test logout functionality if available
         """
-        # Try to logout
-        logout_success = self.dashboard_page.logout()
-        
-        if logout_success:
-            print("Logout functionality found and executed")
-            time.sleep(2)  # Wait for redirect
-            
-            # Should be redirected to login page or home page
-            current_url = self.dashboard_page.get_current_url()
-            is_logged_out = (
-                'login' in current_url.lower() or
-                current_url.rstrip('/') == Config.BASE_URL.rstrip('/')
-            )
-            
-            if is_logged_out:
-                print("Successfully logged out")
-            else:
-                print(f"After logout, current URL: {current_url}")
+        # Logout and wait for the redirect to the login or home page (shared with the monitor)
+        if smoke_flows.logout_functionality(self.driver):
+            print("Successfully logged out")
         else:
             print("Logout functionality not found or not accessible")
             # This is not necessarily a failure - some sites handle logout differently
@@ -0,0 +1,18 @@
+"""
+demo_selenium keeps its own copies of the shared page helpers; they must not drift
+"""
+import os
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules demo_selenium/pages copies from pages/
+SHARED_MODULES = ('text_locator.py', 'form_fill.py', 'table_reader.py')
+
+@pytest.mark.parametrize('module', SHARED_MODULES)
+def test_demo_copy_matches_main_suite(module):
+    with open(os.path.join(ROOT, 'pages', module), encoding='utf-8') as f:
+        original = f.read()
+    with open(os.path.join(ROOT, 'demo_selenium', 'pages', module), encoding='utf-8') as f:
+        copy = f.read()
+    assert copy == original, f"demo_selenium/pages/{module} differs from pages/{module}; copy it again"
@@ -0,0 +1,147 @@
+"""
+Fault-injection proxy: rule matching, origin/cookie rewriting and upstream forwarding
+"""
+import http.client
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils.fault_proxy import FaultProxy, FaultRule, Scenario, _plain_http_cookie, _rewrite_origin
+
+class Upstream(BaseHTTPRequestHandler):
+    """Keep-alive upstream that counts its connections; /bad answers a garbage status line"""
+    
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+    
+    def do_GET(self):
+        if self.path == '/bad':
+            self.wfile.write(b"garbage\r\n\r\n")
+            self.close_connection = True
+            return
+        origin = f"http://{self.headers['Host']}"
+        body = f'<a href="{origin}/next">next</a>'.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        if self.path == '/redirect':
+            self.send_header('Location', f"{origin}/dashboard")
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def upstream():
+    """Local upstream server; yields its handler class (connection counter and url)"""
+    handler = type('CountingUpstream', (Upstream,), {'connections': 0})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    handler.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield handler
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def proxy(upstream):
+    """Fault proxy in front of the local upstream, without faults"""
+    fault_proxy = FaultProxy(Scenario([]), upstream=upstream.url, port=0).start()
+    yield fault_proxy
+    fault_proxy.stop()
+
+def _get(connection, path):
+    connection.request('GET', path)
+    response = connection.getresponse()
+    return response.status, dict(response.getheaders()), response.read()
+
+class TestFaultRules:
+    """Which rule applies to a request"""
+    
+    def test_rule_matches_path_glob_and_method(self):
+        rule = FaultRule(path='/login*', methods=['post'])
+        assert rule.matches('POST', '/login')
+        assert rule.matches('POST', '/login/submit')
+        assert not rule.matches('GET', '/login')
+        assert not rule.matches('POST', '/dashboard')
+    
+    def test_rule_without_methods_matches_every_method(self):
+        rule = FaultRule(path='*.js')
+        assert rule.matches('GET', '/static/app.js')
+        assert rule.matches('HEAD', '/app.js')
+        assert not rule.matches('GET', '/app.css')
+    
+    def test_first_matching_rule_wins(self):
+        scenario = Scenario([FaultRule(path='/dashboard', name='dashboard'),
+                             FaultRule(path='*', name='everything')])
+        assert scenario.rule_for('GET', '/dashboard').name == 'dashboard'
+        assert scenario.rule_for('GET', '/login').name == 'everything'
+        assert Scenario([FaultRule(path='/x')]).rule_for('GET', '/y') is None
+    
+    def test_unknown_rule_keys_are_rejected(self):
+        """A typo must not silently disable a fault"""
+        with pytest.raises(ValueError, match="latency"):
+            FaultRule.from_dict({'path': '*', 'latency': 100})
+
+class TestRewriting:
+    """Keeping the browser on the proxy origin"""
+    
+    def test_plain_and_json_escaped_origins_are_rewritten(self):
+        data = b'<a href="https://site.test/a"> {"url": "https:\\/\\/site.test\\/b"}'
+        assert _rewrite_origin(data, "https://site.test", "http://127.0.0.1:8766") == \
+            b'<a href="http://127.0.0.1:8766/a"> {"url": "http:\\/\\/127.0.0.1:8766\\/b"}'
+    
+    def test_https_cookie_made_acceptable_over_http(self):
+        cookie = "session=abc; Path=/; Domain=site.test; Secure; HttpOnly; SameSite=None"
+        assert _plain_http_cookie(cookie) == "session=abc; Path=/; HttpOnly; SameSite=Lax"
+    
+    def test_other_samesite_values_are_kept(self):
+        assert _plain_http_cookie("a=1; Secure; SameSite=Strict") == "a=1; SameSite=Strict"
+
+class TestForwarding:
+    """Requests through the proxy to a local upstream"""
+    
+    def test_upstream_connection_is_reused(self, proxy, upstream):
+        """One browser connection keeps one upstream connection alive"""
+        connection = http.client.HTTPConnection('127.0.0.1', proxy.port, timeout=10)
+        try:
+            statuses = [_get(connection, '/page')[0] for _ in range(5)]
+        finally:
+            connection.close()
+        assert statuses == [200] * 5
+        assert upstream.connections == 1
+    
+    def test_links_and_redirects_point_at_the_proxy(self, proxy):
+        connection = http.client.HTTPConnection('127.0.0.1', proxy.port, timeout=10)
+        try:
+            status, headers, body = _get(connection, '/redirect')
+        finally:
+            connection.close()
+        proxy_origin = proxy.url.rstrip('/')
+        assert headers['Location'] == f"{proxy_origin}/dashboard"
+        assert body == f'<a href="{proxy_origin}/next">next</a>'.encode()
+    
+    def test_malformed_upstream_response_is_502(self, proxy):
+        connection = http.client.HTTPConnection('127.0.0.1', proxy.port, timeout=10)
+        try:
+            status, _, body = _get(connection, '/bad')
+            # The proxy recovers with a new upstream connection
+            assert _get(connection, '/page')[0] == 200
+        finally:
+            connection.close()
+        assert status == 502
+        assert body.startswith(b"Upstream unreachable")
+    
+    def test_injected_error_is_counted(self, proxy, upstream):
+        proxy.scenario.rules.append(FaultRule(path='/page', error_rate=1.0, error_status=503))
+        connection = http.client.HTTPConnection('127.0.0.1', proxy.port, timeout=10)
+        try:
+            status = _get(connection, '/page')[0]
+        finally:
+            connection.close()
+        assert status == 503
+        assert proxy.stats['/page'] == {'requests': 1, 'errors': 1}
+        assert upstream.connections == 0
@@ -0,0 +1,75 @@
+"""
+Locator health index: per-alternative records of fallback chains and their ranking
+"""
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from config.config import Config
+from pages.base_page import BasePage
+from utils.locator_health import LocatorHealthIndex, chain_key
+from utils.retry import locator_key
+
+DEAD = (By.ID, "old-login")
+SLOW = (By.XPATH, "//button[text()='Login']")
+LIVE = (By.CSS_SELECTOR, "button[type='submit']")
+CHAIN = (DEAD, SLOW, LIVE)
+
+class FakeDriver:
+    """Answers find_elements from a fixed set of present locators"""
+    
+    def __init__(self, present):
+        self.present = set(present)
+    
+    def find_elements(self, by, value):
+        return [object()] if (by, value) in self.present else []
+    
+    def implicitly_wait(self, seconds):
+        pass
+
+@pytest.fixture
+def index(tmp_path):
+    return LocatorHealthIndex(str(tmp_path / "locator_health.json"))
+
+def _page(index, present):
+    page = BasePage(FakeDriver(present))
+    page.locator_index = index
+    return page
+
+def _alternatives(index):
+    return index.stats(chain_key(CHAIN))['alternatives']
+
+class TestFallbackChains:
+    """resolve_locator records every alternative it tried"""
+    
+    def test_alternatives_before_the_winner_are_misses(self, index):
+        assert _page(index, [SLOW, LIVE]).resolve_locator(CHAIN) == SLOW
+        alternatives = _alternatives(index)
+        assert (alternatives[locator_key(DEAD)]['lookups'], alternatives[locator_key(DEAD)]['misses']) == (1, 1)
+        assert (alternatives[locator_key(SLOW)]['lookups'], alternatives[locator_key(SLOW)]['hits']) == (1, 1)
+        # Not tried: the winner came first
+        assert locator_key(LIVE) not in alternatives
+        assert index.stats(chain_key(CHAIN))['hits'] == 1
+    
+    def test_timeout_records_a_miss_for_every_alternative(self, index):
+        with pytest.raises(TimeoutException):
+            _page(index, []).resolve_locator(CHAIN, timeout=1)
+        alternatives = _alternatives(index)
+        assert [alternatives[locator_key(locator)]['misses'] for locator in CHAIN] == [1, 1, 1]
+        assert index.stats(chain_key(CHAIN))['misses'] == 1
+    
+    def test_alternative_time_is_its_own_probe(self, index):
+        _page(index, [LIVE]).resolve_locator(CHAIN)
+        alternatives = _alternatives(index)
+        chain_time = index.stats(chain_key(CHAIN))['time']
+        assert sum(alternatives[locator_key(locator)]['time'] for locator in CHAIN) <= chain_time
+    
+    def test_dead_primary_is_demoted_once_reported(self, index, monkeypatch):
+        monkeypatch.setattr(Config, 'LOCATOR_DEAD_MIN_LOOKUPS', 3)
+        _page(index, [SLOW, LIVE]).resolve_locator(CHAIN)
+        # Undecided alternatives are tried first: the dead primary, then the untried one
+        assert index.rank(CHAIN) == [DEAD, LIVE, SLOW]
+        for _ in range(2):
+            _page(index, [SLOW, LIVE]).resolve_locator(CHAIN)
+        assert index.rank(CHAIN)[-1] == DEAD
+        assert set(index.rank(CHAIN)[:2]) == {SLOW, LIVE}
+        assert index.dead_locators() == [f"{chain_key(CHAIN)} >> {locator_key(DEAD)}"]
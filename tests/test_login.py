@@ -5,6 +5,7 @@ import pytest
 import time
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
+from pages import smoke_flows
 from config.config import Config
 
 class TestLogin:
@@ -30,26 +31,8 @@ class TestLogin:
         3. Click login button
         4. Verify successful login (redirect to dashboard)
         """
-        # Navigate to login page
-        self.login_page.navigate_to_login()
-        assert self.login_page.is_on_login_page(), "Should be on login page"
-        
-        # Perform login
-        login_success = self.login_page.login(
-            valid_credentials['email'], 
-            valid_credentials['password']
-        )
-        
-        # Verify login success
-        assert login_success, "Login should be successful"
-        
-        # Verify we're redirected away from login page
-        time.sleep(2)  # Wait for redirect
-        assert not self.login_page.is_on_login_page(), "Should be redirected away from login page"
-        
-        # Verify dashboard is accessible
-        if self.dashboard_page.is_on_dashboard():
-            assert self.dashboard_page.verify_page_loaded(), "Dashboard should load properly"
+        # Same steps as the synthetic monitor's valid_login check
+        smoke_flows.valid_login(self.driver, valid_credentials['email'], valid_credentials['password'])
     
     @pytest.mark.regression
     @pytest.mark.login
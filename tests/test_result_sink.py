@@ -0,0 +1,166 @@
+"""
+Streaming results: outcome folding in ResultSink and pagination in ReportBuilder
+"""
+import json
+import re
+from types import SimpleNamespace
+import pytest
+from utils.report_builder import ReportBuilder, page_name, read_records
+from utils.result_sink import ResultSink
+
+def _report(nodeid, when, outcome, duration=0.5, longrepr=None, **extra):
+    """Phase report as pytest_runtest_logreport receives it"""
+    return SimpleNamespace(nodeid=nodeid, when=when, outcome=outcome, duration=duration,
+                           failed=outcome == 'failed', skipped=outcome == 'skipped',
+                           longrepr=longrepr, longreprtext=str(longrepr or ''), **extra)
+
+def _run(sink, nodeid, setup='passed', call='passed', **call_extra):
+    """Feed one test's setup/call/teardown reports; call=None for a setup-only test"""
+    sink.add(_report(nodeid, 'setup', setup, duration=0.25,
+                     longrepr="E   RuntimeError: no browser" if setup == 'failed' else None))
+    if call is not None:
+        sink.add(_report(nodeid, 'call', call,
+                         longrepr="E   AssertionError: wrong title" if call in ('failed', 'rerun') else None,
+                         **call_extra))
+    sink.add(_report(nodeid, 'teardown', 'passed', duration=0.25))
+
+@pytest.fixture
+def sink(tmp_path):
+    result_sink = ResultSink(str(tmp_path / "results.jsonl")).open("http://site.test/")
+    yield result_sink
+    result_sink.close()
+
+def _tests(path):
+    return [record for record in read_records(path) if record['type'] == 'test']
+
+class TestResultSink:
+    """One line per finished attempt, outcome folded from its phases"""
+    
+    def test_session_header_and_summary(self, sink):
+        _run(sink, "tests/test_a.py::test_ok")
+        sink.close(exitstatus=0)
+        records = list(read_records(sink.path))
+        assert [record['type'] for record in records] == ['session', 'test', 'summary']
+        assert records[0]['base_url'] == "http://site.test/"
+        assert records[0]['environment']['platform']
+        assert records[-1]['counts'] == {'passed': 1}
+        assert records[-1]['exitstatus'] == 0
+    
+    def test_line_written_at_teardown(self, sink):
+        """A test still running is not in the file; a finished one is, without closing"""
+        sink.add(_report("tests/test_a.py::test_ok", 'setup', 'passed'))
+        sink.add(_report("tests/test_a.py::test_ok", 'call', 'passed'))
+        assert _tests(sink.path) == []
+        sink.add(_report("tests/test_a.py::test_ok", 'teardown', 'passed'))
+        assert [record['nodeid'] for record in _tests(sink.path)] == ["tests/test_a.py::test_ok"]
+    
+    def test_passed_record(self, sink):
+        _run(sink, "tests/test_a.py::test_ok")
+        record, = _tests(sink.path)
+        assert record['outcome'] == 'passed'
+        assert record['duration'] == 1.0
+        assert set(record['phases']) == {'setup', 'call', 'teardown'}
+        # Empty fields are left out of the line
+        assert 'longrepr' not in record and 'metrics' not in record
+    
+    def test_failed_call_keeps_message_and_category(self, sink):
+        _run(sink, "tests/test_a.py::test_fail", call='failed', failure_category='assertion')
+        record, = _tests(sink.path)
+        assert record['outcome'] == 'failed'
+        assert record['failure_category'] == 'assertion'
+        assert "wrong title" in record['longrepr']
+    
+    def test_failed_setup_is_an_error(self, sink):
+        _run(sink, "tests/test_a.py::test_broken", setup='failed', call=None)
+        assert _tests(sink.path)[0]['outcome'] == 'error'
+    
+    def test_each_rerun_is_its_own_attempt(self, sink):
+        _run(sink, "tests/test_a.py::test_flaky", call='rerun')
+        _run(sink, "tests/test_a.py::test_flaky")
+        assert [record['outcome'] for record in _tests(sink.path)] == ['rerun', 'passed']
+        assert sink.counts == {'rerun': 1, 'passed': 1}
+    
+    def test_skip_reason_and_xfail(self, sink):
+        nodeid = "tests/test_a.py::test_skipped"
+        sink.add(_report(nodeid, 'setup', 'skipped', longrepr=("test_a.py", 3, "Skipped: no grid")))
+        sink.add(_report(nodeid, 'teardown', 'passed'))
+        _run(sink, "tests/test_a.py::test_known_bug", call='skipped', wasxfail="bug #12")
+        skipped, xfailed = _tests(sink.path)
+        assert (skipped['outcome'], skipped['skip_reason']) == ('skipped', "Skipped: no grid")
+        assert xfailed['outcome'] == 'xfailed'
+    
+    def test_metrics_only_when_measured(self, sink):
+        nodeid = "tests/test_a.py::test_measured"
+        sink.add(_report(nodeid, 'setup', 'passed'))
+        sink.add(_report(nodeid, 'call', 'passed', network_profile='slow-3g'))
+        sink.add(_report(nodeid, 'teardown', 'passed', browser_memory={'rss_mb': 310.0, 'heap_mb': 12.5},
+                         network_resources=[{'bytes': 1000}, {'bytes': 2000}]))
+        record, = _tests(sink.path)
+        assert record['network_profile'] == 'slow-3g'
+        assert record['metrics'] == {'memory': {'rss_mb': 310.0, 'heap_mb': 12.5},
+                                     'requests': 2, 'transfer_bytes': 3000}
+
+def _write_results(path, outcomes):
+    """Results file with one test per outcome"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'session', 'started': "2026-01-01T10:00:00",
+                            'base_url': "http://site.test/"}) + "\n")
+        for number, outcome in enumerate(outcomes, 1):
+            record = {'type': 'test', 'nodeid': f"tests/test_m{number % 2}.py::test_{number}",
+                      'outcome': outcome, 'duration': number / 10}
+            if outcome == 'failed':
+                record['longrepr'] = f"E   AssertionError: case {number}"
+            f.write(json.dumps(record) + "\n")
+        f.write(json.dumps({'type': 'summary', 'duration': 1.0, 'exitstatus': 1}) + "\n")
+
+def _page_links(tmp_path, number):
+    """Pages a report page links to"""
+    html = (tmp_path / "report" / page_name(number)).read_text(encoding='utf-8')
+    return set(re.findall(r'href="(tests-\d+\.html)"', html))
+
+class TestReportBuilder:
+    """Paginated static report from a results file"""
+    
+    def test_pages_hold_page_size_tests(self, tmp_path):
+        results = tmp_path / "results.jsonl"
+        _write_results(results, ['passed'] * 7)
+        builder = ReportBuilder(str(tmp_path / "report"), page_size=3)
+        builder.build(str(results))
+        pages = sorted(path.name for path in (tmp_path / "report").glob("tests-*.html"))
+        assert pages == [page_name(1), page_name(2), page_name(3)]
+        rows = [(tmp_path / "report" / page).read_text(encoding='utf-8').count('<tr id="t')
+                for page in pages]
+        assert rows == [3, 3, 1]
+    
+    def test_navigation_between_pages(self, tmp_path):
+        results = tmp_path / "results.jsonl"
+        _write_results(results, ['passed'] * 7)
+        ReportBuilder(str(tmp_path / "report"), page_size=3).build(str(results))
+        assert _page_links(tmp_path, 1) == {page_name(2)}
+        assert _page_links(tmp_path, 2) == {page_name(1), page_name(3)}
+        assert _page_links(tmp_path, 3) == {page_name(2)}
+    
+    def test_full_last_page_has_no_next_link(self, tmp_path):
+        """A page is closed only when the next test arrives, so it knows it is the last"""
+        results = tmp_path / "results.jsonl"
+        _write_results(results, ['passed'] * 6)
+        builder = ReportBuilder(str(tmp_path / "report"), page_size=3)
+        builder.build(str(results))
+        assert builder.pages == 2
+        assert _page_links(tmp_path, 2) == {page_name(1)}
+    
+    def test_search_index_and_failures_point_at_the_right_page(self, tmp_path):
+        results = tmp_path / "results.jsonl"
+        _write_results(results, ['passed', 'passed', 'passed', 'failed', 'skipped'])
+        builder = ReportBuilder(str(tmp_path / "report"), page_size=3)
+        builder.build(str(results))
+        search = (tmp_path / "report" / "search.js").read_text(encoding='utf-8')
+        entries = json.loads(search[search.index('['):search.rindex(']') + 1].replace(",\n]", "\n]"))
+        assert [(entry[1], entry[2]) for entry in entries] == [
+            ('passed', page_name(1)), ('passed', page_name(1)), ('passed', page_name(1)),
+            ('failed', page_name(2)), ('skipped', page_name(2))]
+        failures = (tmp_path / "report" / "failures.html").read_text(encoding='utf-8')
+        assert f'href="{page_name(2)}#t4"' in failures
+        assert builder.counts == {'passed': 3, 'failed': 1, 'skipped': 1}
+        assert builder.success_rate() == 75.0
+        assert builder.failures == [("tests/test_m0.py::test_4", 'failed', None, "AssertionError: case 4")]
@@ -0,0 +1,108 @@
+"""
+Run history database: ingesting result streams and the flake-rate and trend queries
+"""
+import json
+from datetime import datetime, timedelta
+import pytest
+from utils.run_history import RunHistory
+
+LOGIN = "tests/test_login.py::TestLogin::test_valid_login"
+TITLE = "tests/test_dashboard.py::TestDashboard::test_dashboard_page_title"
+
+@pytest.fixture
+def history(tmp_path):
+    run_history = RunHistory(str(tmp_path / "history.db"))
+    yield run_history
+    run_history.close()
+
+def _write_run(tmp_path, number, tests, days_ago=0.0):
+    """
+    Results file of one run
+
+    Args:
+        number (int): Run number, also its id
+        tests (list): (nodeid, outcome, call seconds, markers) per attempt
+        days_ago (float): Age of the run
+    """
+    started = (datetime.now() - timedelta(days=days_ago)).isoformat(timespec='seconds')
+    path = tmp_path / f"results-{number}.jsonl"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'type': 'session', 'run_id': f"run-{number}", 'started': started,
+                            'base_url': "http://site.test/", 'browser': 'chrome',
+                            'environment': {'name': 'staging', 'platform': 'Linux-6.1'}}) + "\n")
+        for nodeid, outcome, seconds, markers in tests:
+            record = {'type': 'test', 'nodeid': nodeid, 'outcome': outcome, 'duration': seconds + 0.5,
+                      'phases': {'setup': {'outcome': 'passed', 'duration': 0.5},
+                                 'call': {'outcome': outcome, 'duration': seconds}},
+                      'markers': markers}
+            if outcome in ('failed', 'rerun'):
+                record['longrepr'] = "E   AssertionError: title mismatch"
+                record['failure_category'] = 'assertion'
+            f.write(json.dumps(record) + "\n")
+        f.write(json.dumps({'type': 'summary', 'duration': 12.5, 'exitstatus': 0}) + "\n")
+    return str(path)
+
+class TestRunHistory:
+    """Ingest and queries over a temporary database"""
+    
+    def test_ingest_stores_run_and_attempts(self, history, tmp_path):
+        path = _write_run(tmp_path, 1, [(LOGIN, 'rerun', 1.0, ['smoke']), (LOGIN, 'passed', 1.0, ['smoke']),
+                                        (TITLE, 'failed', 2.0, ['regression'])])
+        assert history.ingest(path) == 3
+        run, = history.runs()
+        assert (run['environment'], run['platform'], run['browser']) == ('staging', 'Linux-6.1', 'chrome')
+        assert (run['total'], run['passed'], run['failed'], run['reruns']) == (2, 1, 1, 1)
+        assert (run['duration'], run['exitstatus']) == (12.5, 0)
+        attempts = history.db.execute(
+            "SELECT attempt, outcome, message FROM results WHERE nodeid = ? ORDER BY attempt", (LOGIN,)).fetchall()
+        assert [tuple(row) for row in attempts] == [(1, 'rerun', "AssertionError: title mismatch"),
+                                                    (2, 'passed', None)]
+    
+    def test_ingest_is_idempotent(self, history, tmp_path):
+        path = _write_run(tmp_path, 1, [(LOGIN, 'passed', 1.0, [])])
+        assert history.ingest(path) == 1
+        assert history.ingest(path) == 0
+        assert len(history.runs()) == 1
+    
+    def test_file_without_session_is_rejected(self, history, tmp_path):
+        path = tmp_path / "broken.jsonl"
+        path.write_text(json.dumps({'type': 'test', 'nodeid': LOGIN}) + "\n", encoding='utf-8')
+        with pytest.raises(ValueError):
+            history.ingest(str(path))
+    
+    def test_flake_rates(self, history, tmp_path):
+        """Passed after a rerun counts as flaky, never passing as failed, always passing not at all"""
+        runs = [
+            [(LOGIN, 'rerun', 1.0, []), (LOGIN, 'passed', 1.0, []), (TITLE, 'passed', 1.0, [])],
+            [(LOGIN, 'passed', 1.0, []), (TITLE, 'passed', 1.0, [])],
+            [(LOGIN, 'rerun', 1.0, []), (LOGIN, 'passed', 1.0, []), (TITLE, 'passed', 1.0, [])],
+            [(LOGIN, 'passed', 1.0, []), (TITLE, 'failed', 1.0, [])],
+        ]
+        for number, tests in enumerate(runs, 1):
+            history.ingest(_write_run(tmp_path, number, tests, days_ago=len(runs) - number))
+        rates = {row['nodeid']: tuple(row)[1:] for row in history.flake_rates()}
+        assert rates == {LOGIN: (4, 2, 0, 0.5, 0.0), TITLE: (4, 0, 1, 0.0, 0.25)}
+        assert [row['nodeid'] for row in history.flake_rates(min_runs=5)] == []
+    
+    def test_old_runs_fall_out_of_the_window(self, history, tmp_path):
+        history.ingest(_write_run(tmp_path, 1, [(LOGIN, 'failed', 1.0, [])], days_ago=40))
+        history.ingest(_write_run(tmp_path, 2, [(LOGIN, 'passed', 1.0, [])], days_ago=1))
+        assert history.flake_rates(days=30) == []
+        assert len(history.flake_rates(days=60)) == 1
+    
+    def test_duration_change_finds_the_first_slow_run(self, history, tmp_path):
+        seconds = [1.0, 1.1, 0.9, 3.0, 3.2, 2.9]
+        for number, value in enumerate(seconds, 1):
+            history.ingest(_write_run(tmp_path, number, [(LOGIN, 'passed', value, []),
+                                                         (TITLE, 'passed', 2.0, [])],
+                                      days_ago=len(seconds) - number))
+        change, = history.duration_change("test_valid_login", factor=2)
+        assert (change['nodeid'], change['uid']) == (LOGIN, "run-4")
+        assert (change['before'], change['after']) == (1.0, 3.0)
+        assert history.duration_change(TITLE, factor=2) == []
+    
+    def test_slowest_by_marker(self, history, tmp_path):
+        history.ingest(_write_run(tmp_path, 1, [(LOGIN, 'passed', 1.0, ['smoke']),
+                                                (TITLE, 'passed', 4.0, ['regression'])]))
+        assert [row['nodeid'] for row in history.slowest()] == [TITLE, LOGIN]
+        assert [row['nodeid'] for row in history.slowest(marker='smoke')] == [LOGIN]
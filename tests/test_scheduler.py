@@ -0,0 +1,107 @@
+"""
+Duration-aware scheduling: unit grouping, LPT order and deterministic --shard splits
+"""
+import random
+import pytest
+from utils.durations import DurationStore
+from utils.scheduler import assign_shards, build_units, lpt_order, parse_shard
+
+class FakeItem:
+    """Just enough of a pytest item for the scheduler"""
+    
+    def __init__(self, nodeid, readonly=False, incremental_skip=False):
+        self.nodeid = nodeid
+        self.cls = object if '::Test' in nodeid else None
+        self.readonly = readonly
+        self.incremental_skip = incremental_skip
+        # No class/module-scoped fixtures
+        self._fixtureinfo = None
+    
+    def get_closest_marker(self, name):
+        return object() if name == 'readonly_session' and self.readonly else None
+
+def _durations(tmp_path, seconds):
+    """DurationStore with the given per-nodeid durations"""
+    store = DurationStore(str(tmp_path / "durations.json"))
+    store.durations = dict(seconds)
+    return store
+
+def _shard_nodeids(shards):
+    return [[item.nodeid for unit in shard['units'] for item in unit['items']] for shard in shards]
+
+class TestScheduler:
+    """Units, LPT ordering and shard assignment"""
+    
+    def test_readonly_class_is_one_unit(self, tmp_path):
+        """A class's readonly_session tests share a unit; other tests stand alone"""
+        items = [
+            FakeItem("tests/test_a.py::TestA::test_one", readonly=True),
+            FakeItem("tests/test_a.py::TestA::test_two", readonly=True),
+            FakeItem("tests/test_a.py::TestA::test_resize"),
+            FakeItem("tests/test_b.py::test_three"),
+        ]
+        durations = _durations(tmp_path, {item.nodeid: 2.0 for item in items})
+        units = build_units(items, durations)
+        assert [(unit['key'], len(unit['items']), unit['seconds']) for unit in units] == [
+            ("tests/test_a.py::TestA", 2, 4.0),
+            ("tests/test_a.py::TestA::test_resize", 1, 2.0),
+            ("tests/test_b.py::test_three", 1, 2.0),
+        ]
+    
+    def test_incrementally_skipped_tests_cost_nothing(self, tmp_path):
+        """Tests skipped as unchanged do not weigh on their unit"""
+        items = [FakeItem("tests/test_a.py::test_one", incremental_skip=True)]
+        units = build_units(items, _durations(tmp_path, {"tests/test_a.py::test_one": 30.0}))
+        assert units[0]['seconds'] == 0.0
+    
+    def test_unknown_tests_get_the_median_estimate(self, tmp_path):
+        """Tests without history are estimated at the median known duration"""
+        durations = _durations(tmp_path, {"a": 1.0, "b": 3.0, "c": 8.0})
+        units = build_units([FakeItem("tests/test_new.py::test_new")], durations)
+        assert units[0]['seconds'] == 3.0
+    
+    def test_lpt_order_is_longest_first_with_key_ties(self):
+        """Longest units first; equal durations ordered by key"""
+        units = [{'key': key, 'items': [], 'seconds': seconds}
+                 for key, seconds in (("b", 1.0), ("c", 5.0), ("a", 1.0), ("d", 3.0))]
+        assert [unit['key'] for unit in lpt_order(units)] == ["c", "d", "a", "b"]
+    
+    def test_shards_are_balanced_longest_first(self, tmp_path):
+        """Each unit goes to the least loaded shard, lowest index on ties"""
+        seconds = {f"tests/test_x.py::test_{name}": value
+                   for name, value in (("a", 8), ("b", 7), ("c", 6), ("d", 5), ("e", 4))}
+        units = build_units([FakeItem(nodeid) for nodeid in seconds], _durations(tmp_path, seconds))
+        shards = assign_shards(units, 2)
+        assert [shard['seconds'] for shard in shards] == [17.0, 13.0]
+        assert _shard_nodeids(shards) == [
+            ["tests/test_x.py::test_a", "tests/test_x.py::test_d", "tests/test_x.py::test_e"],
+            ["tests/test_x.py::test_b", "tests/test_x.py::test_c"],
+        ]
+    
+    def test_shards_are_deterministic_and_disjoint(self, tmp_path):
+        """Every node computes the same split regardless of collection order"""
+        items = [FakeItem(f"tests/test_m{index % 4}.py::test_{index}") for index in range(40)]
+        durations = _durations(tmp_path, {item.nodeid: 1 + index % 7 for index, item in enumerate(items)})
+        expected = _shard_nodeids(assign_shards(build_units(items, durations), 3))
+
+        shuffled = items[:]
+        random.Random(3).shuffle(shuffled)
+        assert _shard_nodeids(assign_shards(build_units(shuffled, durations), 3)) == expected
+
+        assigned = [nodeid for shard in expected for nodeid in shard]
+        assert sorted(assigned) == sorted(item.nodeid for item in items)
+    
+    def test_more_shards_than_units(self, tmp_path):
+        """Surplus shards are empty rather than an error"""
+        units = build_units([FakeItem("tests/test_a.py::test_one")],
+                            _durations(tmp_path, {"tests/test_a.py::test_one": 1.0}))
+        assert [len(shard['units']) for shard in assign_shards(units, 3)] == [1, 0, 0]
+    
+    @pytest.mark.parametrize("value, expected", [("1/1", (1, 1)), ("2/4", (2, 4)), ("4/4", (4, 4))])
+    def test_parse_shard(self, value, expected):
+        assert parse_shard(value) == expected
+    
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "2", "a/b", "1/2/3"])
+    def test_parse_shard_rejects_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_shard(value)
@@ -0,0 +1,62 @@
+"""
+Startup cost of the framework: collection must not pay for browser modules
+"""
+import json
+import os
+import subprocess
+import sys
+from config.config import Config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What pytest imports to collect the suite (pytest itself is not ours to budget)
+COLLECTION_IMPORTS = "conftest, tests.test_login, tests.test_dashboard, tests.test_website_general"
+
+# Heavy modules only a started browser, an HTTP probe or a table read needs
+HEAVY_MODULES = (
+    'webdriver_manager',
+    'selenium.webdriver.remote.webdriver',
+    'selenium.webdriver.chrome.webdriver',
+    'selenium.webdriver.firefox.webdriver',
+    'selenium.webdriver.edge.webdriver',
+    'selenium.webdriver.support.wait',
+    'requests',
+    'pandas',
+    'httpx',
+)
+
+PROBE = f"""
+import json, sys, time
+import pytest
+start = time.perf_counter()
+import {COLLECTION_IMPORTS}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                   'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+def _probe():
+    """Import the suite in a fresh interpreter and report time and heavy modules"""
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True,
+                            text=True, env=dict(os.environ, PYTHONPATH=ROOT), timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+class TestStartup:
+    """Import-time budget for collection and HTTP-only runs"""
+    
+    def test_collection_does_not_import_browser_modules(self):
+        """Browser backends, webdriver_manager and optional libraries load on first use"""
+        assert _probe()['heavy'] == []
+    
+    def test_collection_import_time_within_budget(self):
+        """Importing conftest and the test modules stays within IMPORT_TIME_BUDGET"""
+        # Warm-up probe writes bytecode caches; then best of three, so the budget
+        # is about our imports, not compilation or a busy machine
+        _probe()
+        seconds = min(_probe()['seconds'] for _ in range(3))
+        assert seconds <= Config.IMPORT_TIME_BUDGET, (
+            f"Suite import took {seconds * 1000:.0f} ms "
+            f"(budget {Config.IMPORT_TIME_BUDGET * 1000:.0f} ms) - "
+            f"move heavy imports into the functions that need them"
+        )
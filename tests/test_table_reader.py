@@ -0,0 +1,39 @@
+"""
+Table extraction: read_table on a local table page, with and without pagination
+"""
+from urllib.parse import quote
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+
+TABLE = (By.ID, "siswa")
+
+# One page of a paginated table; "Next" leads to a page that must not be read
+PAGE = """
+<table id="siswa">
+  <thead><tr><th>Nama</th><th>Kelas</th><th>Aksi</th></tr></thead>
+  <tbody>
+    <tr><td>Andi</td><td>7A</td><td><a href="/siswa/1/edit">Edit</a></td></tr>
+    <tr><td>Budi</td><td>7B</td><td><button title="Hapus"></button></td></tr>
+  </tbody>
+</table>
+<ul class="pagination"><li><a href="data:text/html,page-2" rel="next">Next</a></li></ul>
+"""
+
+class TestReadTable:
+    """BasePage.read_table against a data: URL page"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, driver):
+        self.driver = driver
+        self.page = BasePage(driver)
+        self.page.navigate_to("data:text/html;charset=utf-8," + quote(PAGE))
+    
+    def test_single_page_without_pagination(self):
+        """follow_pagination=False reads the current page and never clicks "next" """
+        table = self.page.read_table(TABLE, follow_pagination=False)
+        assert list(table.columns) == ['Nama', 'Kelas', 'Aksi', 'actions']
+        assert table['Nama'].tolist() == ['Andi', 'Budi']
+        assert table['actions'].tolist() == [[{'text': 'Edit', 'href': '/siswa/1/edit'}],
+                                             [{'text': 'Hapus', 'href': None}]]
+        assert self.driver.current_url.startswith("data:text/html;charset=utf-8,")
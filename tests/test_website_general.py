@@ -7,6 +7,7 @@ from selenium.webdriver.common.by import By
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.base_page import BasePage
+from pages import smoke_flows
 from config.config import Config
 
 class TestWebsiteGeneral:
@@ -20,6 +21,7 @@ class TestWebsiteGeneral:
         self.login_page = LoginPage(driver)
         self.dashboard_page = DashboardPage(driver)
     
+    @pytest.mark.readonly_session
     @pytest.mark.smoke
     @pytest.mark.critical
     def test_website_accessibility(self):
@@ -32,16 +34,8 @@ class TestWebsiteGeneral:
         3. Verify page has title
         4. Verify basic HTML structure
         """
-        # Navigate to base URL
-        self.base_page.navigate_to(Config.BASE_URL)
-        
-        # Verify page loads
-        self.base_page.wait_for_page_to_load()
-        
-        # Check page title
-        page_title = self.base_page.get_page_title()
-        assert page_title is not None, "Website should have a page title"
-        assert len(page_title) > 0, "Page title should not be empty"
+        # Navigate to base URL, wait for the load and check the title (shared with the monitor)
+        page_title = smoke_flows.website_accessibility(self.driver)
         
         print(f"Website title: '{page_title}'")
         
@@ -51,6 +45,7 @@ class TestWebsiteGeneral:
         
         print(f"Website URL: '{current_url}'")
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_website_https(self):
         """
@@ -97,6 +92,7 @@ class TestWebsiteGeneral:
         self.driver.set_window_size(original_size['width'], original_size['height'])
         time.sleep(1)
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_basic_html_structure(self):
         """
@@ -118,6 +114,7 @@ class TestWebsiteGeneral:
             assert element_present, f"Page should have {element_name} element"
             print(f"✓ {element_name} element found")
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_common_navigation_elements(self):
         """
@@ -147,6 +144,7 @@ class TestWebsiteGeneral:
         else:
             print("ℹ No standard navigation elements found (may be custom implementation)")
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_links_and_buttons(self):
         """
@@ -174,6 +172,7 @@ class TestWebsiteGeneral:
         total_interactive = len(clickable_links) + len(clickable_buttons)
         assert total_interactive > 0, "Page should have some clickable links or buttons"
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_images_loading(self):
         """
@@ -202,6 +201,7 @@ class TestWebsiteGeneral:
         else:
             print("No images found on the page")
     
+    @pytest.mark.readonly_session
     @pytest.mark.smoke
     def test_login_page_accessibility(self):
         """
@@ -227,6 +227,7 @@ class TestWebsiteGeneral:
             current_url = self.base_page.get_current_url()
             print(f"Current URL after login navigation: {current_url}")
     
+    @pytest.mark.readonly_session
     @pytest.mark.regression
     def test_javascript_functionality(self):
         """
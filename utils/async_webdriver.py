@@ -0,0 +1,308 @@
+"""
+Asyncio client for the W3C WebDriver protocol
+
+Drives many browser sessions concurrently from one event loop over a single
+pooled HTTP client, instead of one blocking ``webdriver.Remote`` (and usually
+one process) per browser. Talks to any W3C endpoint: Selenium Grid, the local
+stand-in hub (``utils.local_hub``) or a driver binary started directly.
+
+Usage:
+    async with AsyncWebDriverClient() as client:
+        results = await client.run_concurrently(check_page, urls, concurrency=20)
+"""
+import asyncio
+import base64
+import httpx
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from config.config import Config
+from utils.driver_manager import DriverManager
+
+# Key under which W3C endpoints return element references
+ELEMENT_KEY = 'element-6066-11e4-a6c3-4a41f6f6ebb6'
+
+# Strategies W3C endpoints accept natively; the rest are rewritten to CSS
+W3C_STRATEGIES = (By.CSS_SELECTOR, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT, By.TAG_NAME)
+
+
+def w3c_locator(by, value):
+    """
+    Translate a Selenium locator into a W3C ``using``/``value`` pair
+
+    Mirrors what ``webdriver.Remote.find_element`` does for id, name and
+    class name, which W3C endpoints do not support directly.
+    """
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f'.{value}'
+    if by not in W3C_STRATEGIES:
+        raise ValueError(f"Unsupported locator strategy: {by}")
+    return by, value
+
+
+class AsyncElement:
+    """Reference to an element inside an ``AsyncSession``"""
+
+    def __init__(self, session, element_id):
+        self.session = session
+        self.id = element_id
+
+    def _path(self, suffix=''):
+        return f"/element/{self.id}{suffix}"
+
+    async def click(self):
+        await self.session.command('POST', self._path('/click'), {})
+
+    async def clear(self):
+        await self.session.command('POST', self._path('/clear'), {})
+
+    async def send_keys(self, text):
+        await self.session.command('POST', self._path('/value'), {'text': str(text)})
+
+    async def text(self):
+        return await self.session.command('GET', self._path('/text'))
+
+    async def get_attribute(self, name):
+        return await self.session.command('GET', self._path(f'/attribute/{name}'))
+
+    async def get_property(self, name):
+        return await self.session.command('GET', self._path(f'/property/{name}'))
+
+    async def is_displayed(self):
+        # W3C has no displayedness endpoint; same atom-free check as dom_wait
+        return await self.session.execute_script(
+            "var el = arguments[0];"
+            "return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) &&"
+            " window.getComputedStyle(el).visibility !== 'hidden';", self)
+
+    async def is_enabled(self):
+        return await self.session.command('GET', self._path('/enabled'))
+
+    async def screenshot(self):
+        """PNG bytes of the element"""
+        data = await self.session.command('GET', self._path('/screenshot'))
+        return base64.b64decode(data)
+
+    def to_json(self):
+        return {ELEMENT_KEY: self.id}
+
+
+class AsyncSession:
+    """One WebDriver session; every method is a single awaitable round trip"""
+
+    def __init__(self, client, session_id, capabilities):
+        """
+        Args:
+            client (AsyncWebDriverClient): Owning client (shares its connection pool)
+            session_id (str): W3C session id
+            capabilities (dict): Capabilities returned by the endpoint
+        """
+        self.client = client
+        self.session_id = session_id
+        self.capabilities = capabilities
+
+    async def command(self, method, path, payload=None):
+        """Send a session command and return its ``value``"""
+        return await self.client.request(method, f"/session/{self.session_id}{path}", payload)
+
+    async def get(self, url):
+        await self.command('POST', '/url', {'url': url})
+
+    async def current_url(self):
+        return await self.command('GET', '/url')
+
+    async def title(self):
+        return await self.command('GET', '/title')
+
+    async def page_source(self):
+        return await self.command('GET', '/source')
+
+    async def find_element(self, by, value):
+        using, value = w3c_locator(by, value)
+        result = await self.command('POST', '/element', {'using': using, 'value': value})
+        return AsyncElement(self, result[ELEMENT_KEY])
+
+    async def find_elements(self, by, value):
+        using, value = w3c_locator(by, value)
+        result = await self.command('POST', '/elements', {'using': using, 'value': value})
+        return [AsyncElement(self, item[ELEMENT_KEY]) for item in result]
+
+    async def execute_script(self, script, *args):
+        """Run a script and return its result (element references become AsyncElement)"""
+        payload = {'script': script, 'args': [self._wrap(arg) for arg in args]}
+        return self._unwrap(await self.command('POST', '/execute/sync', payload))
+
+    async def execute_async_script(self, script, *args):
+        """Run an asynchronous script (last argument is the callback) and return its result"""
+        payload = {'script': script, 'args': [self._wrap(arg) for arg in args]}
+        return self._unwrap(await self.command('POST', '/execute/async', payload))
+
+    async def screenshot(self):
+        """PNG bytes of the viewport"""
+        return base64.b64decode(await self.command('GET', '/screenshot'))
+
+    async def set_timeouts(self, implicit=None, page_load=None, script=None):
+        timeouts = {'implicit': implicit, 'pageLoad': page_load, 'script': script}
+        await self.command('POST', '/timeouts', {
+            key: int(seconds * 1000) for key, seconds in timeouts.items() if seconds is not None
+        })
+
+    async def set_window_size(self, width, height):
+        await self.command('POST', '/window/rect', {'width': width, 'height': height})
+
+    async def delete_all_cookies(self):
+        await self.command('DELETE', '/cookie')
+
+    async def quit(self):
+        """End the session; errors are ignored so cleanup never masks a test failure"""
+        try:
+            await self.client.request('DELETE', f"/session/{self.session_id}")
+        except (WebDriverException, httpx.HTTPError) as e:
+            print(f"Warning: Could not end async session {self.session_id}: {e}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.quit()
+
+    def _wrap(self, value):
+        if isinstance(value, AsyncElement):
+            return value.to_json()
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+
+class AsyncWebDriverClient:
+    """Pooled HTTP client opening ``AsyncSession``s against one W3C endpoint"""
+
+    def __init__(self, remote_url=None, max_connections=None, timeout=None):
+        """
+        Args:
+            remote_url (str): W3C endpoint, uses config default if None
+            max_connections (int): Connection pool size shared by all sessions
+            timeout (float): Per-request HTTP timeout in seconds
+        """
+        self.remote_url = (remote_url or Config.REMOTE_URL).rstrip('/')
+        self.max_connections = max_connections or Config.ASYNC_MAX_CONNECTIONS
+        self.timeout = timeout or Config.ASYNC_REQUEST_TIMEOUT
+        self._http = None
+        self._errors = ErrorHandler()
+
+    async def __aenter__(self):
+        self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def open(self):
+        """Create the shared connection pool"""
+        if self._http is None:
+            limits = httpx.Limits(max_connections=self.max_connections,
+                                  max_keepalive_connections=self.max_connections)
+            self._http = httpx.AsyncClient(base_url=self.remote_url, limits=limits,
+                                           timeout=self.timeout)
+        return self
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def request(self, method, path, payload=None):
+        """
+        Send one WebDriver command
+
+        Raises:
+            WebDriverException: The Selenium exception matching the W3C error
+                (NoSuchElementException, StaleElementReferenceException, ...)
+        """
+        self.open()
+        response = await self._http.request(method, path, json=payload)
+        if response.status_code >= 400:
+            # Same error mapping RemoteConnection uses for the synchronous driver
+            self._errors.check_response({'status': response.status_code, 'value': response.text})
+        try:
+            return response.json().get('value')
+        except ValueError:
+            raise WebDriverException(f"Invalid WebDriver response: {response.text[:200]}")
+
+    async def new_session(self, browser_name=None, capabilities=None):
+        """
+        Start a browser session
+
+        Args:
+            browser_name (str): Browser name, uses config default if None
+            capabilities (dict): Explicit W3C capabilities, built from the
+                DriverManager browser options if None
+
+        Returns:
+            AsyncSession: The new session
+        """
+        if capabilities is None:
+            browser_name = (browser_name or Config.BROWSER).lower()
+            capabilities = DriverManager().build_options(browser_name).to_capabilities()
+
+        value = await self.request('POST', '/session',
+                                   {'capabilities': {'alwaysMatch': capabilities}})
+        return AsyncSession(self, value['sessionId'], value.get('capabilities', {}))
+
+    async def run_concurrently(self, func, items, concurrency=None, browser_name=None):
+        """
+        Run ``func(session, item)`` for every item over a bounded set of sessions
+
+        Each worker opens one session and processes items until the queue is
+        empty, so ``concurrency`` browsers serve any number of items.
+
+        Args:
+            func (callable): Coroutine function taking (AsyncSession, item)
+            items (iterable): Work items (URLs, credentials, viewports, ...)
+            concurrency (int): Number of parallel sessions
+            browser_name (str): Browser for the sessions
+
+        Returns:
+            list: Results in item order; failed items hold their exception
+        """
+        items = list(items)
+        results = [None] * len(items)
+        queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+
+        async def worker():
+            session = await self.new_session(browser_name)
+            try:
+                while not queue.empty():
+                    index, item = queue.get_nowait()
+                    try:
+                        results[index] = await func(session, item)
+                    except Exception as e:
+                        results[index] = e
+                        await session.delete_all_cookies()
+            finally:
+                await session.quit()
+
+        concurrency = min(concurrency or Config.ASYNC_CONCURRENCY, len(items))
+        # Let every worker finish (and quit its session) before reporting a startup failure
+        outcomes = await asyncio.gather(*(worker() for _ in range(concurrency)),
+                                        return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        return results
+
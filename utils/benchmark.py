@@ -0,0 +1,184 @@
+"""
+Timing helpers for the framework overhead benchmarks
+
+``Benchmark`` runs an operation a fixed number of rounds (after warmup) and
+keeps the samples; ``BenchmarkReport`` collects the results of a session,
+summarizes them as percentiles and compares them against a stored baseline.
+"""
+import json
+import os
+import time
+from datetime import datetime
+from config.config import Config
+
+# Percentiles reported for every benchmark
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(samples, pct):
+    """
+    Percentile with linear interpolation between closest ranks
+
+    Args:
+        samples (list): Measurements
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: Interpolated percentile, None for no samples
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples):
+    """
+    Summary statistics of a list of durations
+
+    Returns:
+        dict: rounds, min, max, mean and p<N> for every PERCENTILES entry (seconds)
+    """
+    stats = {
+        'rounds': len(samples),
+        'min': min(samples),
+        'max': max(samples),
+        'mean': sum(samples) / len(samples),
+    }
+    for pct in PERCENTILES:
+        stats[f"p{pct}"] = percentile(samples, pct)
+    return stats
+
+
+class Benchmark:
+    """Times one operation over a fixed number of rounds"""
+
+    def __init__(self, name, rounds=None, warmup=None):
+        """
+        Args:
+            name (str): Benchmark name (the test node id)
+            rounds (int): Measured rounds, uses config default if None
+            warmup (int): Unmeasured rounds run first, uses config default if None
+        """
+        self.name = name
+        self.rounds = Config.BENCHMARK_ROUNDS if rounds is None else rounds
+        self.warmup = Config.BENCHMARK_WARMUP if warmup is None else warmup
+        self.samples = []
+
+    def __call__(self, func, *args, setup=None, teardown=None, rounds=None, **kwargs):
+        """
+        Run ``func(*args, **kwargs)`` and time each round
+
+        Args:
+            func (callable): Operation to measure
+            setup (callable): Run before every round, not timed
+            teardown (callable): Run after every round, not timed
+            rounds (int): Override the measured rounds for slow operations
+
+        Returns:
+            object: Result of the last round
+        """
+        rounds = self.rounds if rounds is None else rounds
+        result = None
+        for index in range(self.warmup + rounds):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if teardown:
+                    teardown()
+            if index >= self.warmup:
+                self.samples.append(elapsed)
+        return result
+
+    @property
+    def stats(self):
+        """Summary statistics, None before the first measured round"""
+        return summarize(self.samples) if self.samples else None
+
+
+class BenchmarkReport:
+    """Session results, baseline comparison and persistence"""
+
+    def __init__(self, baseline_path=None, tolerance=None):
+        """
+        Args:
+            baseline_path (str): Baseline JSON, uses config default if None
+            tolerance (float): Allowed p50 slowdown ratio before a regression (0.2 = 20%)
+        """
+        self.baseline_path = baseline_path or Config.BENCHMARK_BASELINE_PATH
+        self.tolerance = Config.BENCHMARK_TOLERANCE if tolerance is None else tolerance
+        self.results = {}
+        self.baseline = self._read(self.baseline_path)
+
+    @staticmethod
+    def _read(path):
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f).get('benchmarks', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read benchmark baseline: {e}")
+            return {}
+
+    def add(self, name, stats):
+        """Record the statistics of a finished benchmark"""
+        if stats:
+            self.results[name] = stats
+
+    def regression(self, name, stats):
+        """
+        Compare a result against the baseline
+
+        Returns:
+            float: p50 ratio current / baseline if slower than the tolerance allows,
+            None if within tolerance or without baseline
+        """
+        baseline = self.baseline.get(name)
+        if not baseline or not baseline.get('p50'):
+            return None
+        ratio = stats['p50'] / baseline['p50']
+        return ratio if ratio > 1 + self.tolerance else None
+
+    def rows(self):
+        """
+        Result rows for terminal output
+
+        Returns:
+            list: (name, stats, ratio vs baseline p50 or None, regressed) tuples
+        """
+        rows = []
+        for name, stats in sorted(self.results.items()):
+            baseline = self.baseline.get(name)
+            ratio = stats['p50'] / baseline['p50'] if baseline and baseline.get('p50') else None
+            rows.append((name, stats, ratio, self.regression(name, stats) is not None))
+        return rows
+
+    def save(self, path):
+        """
+        Write this session's results as JSON (a baseline or a run record)
+
+        Args:
+            path (str): JSON file location
+
+        Returns:
+            str: Path written
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'browser': Config.BROWSER,
+                'headless': Config.HEADLESS,
+                'benchmarks': {name: {key: round(value, 6) if isinstance(value, float) else value
+                                      for key, value in stats.items()}
+                               for name, stats in sorted(self.results.items())},
+            }, f, indent=2)
+        return path
@@ -0,0 +1,140 @@
+"""
+Registry of browser backends, loaded lazily
+
+Each browser is described by dotted import paths for its options, driver
+service, WebDriver class and ``webdriver_manager`` installer. Nothing is
+imported until a backend is actually used, so collection, HTTP-only tests
+and tooling never load Selenium's browser modules or webdriver_manager.
+
+Register another browser (e.g. Safari) with ``register_browser``.
+"""
+import importlib
+
+
+def load(path):
+    """
+    Import ``package.module:attribute``
+
+    Args:
+        path (str): Dotted module path and attribute separated by a colon
+
+    Returns:
+        object: The attribute
+    """
+    module_name, _, attribute = path.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class BrowserBackend:
+    """How to build options, a driver service and a WebDriver for one browser"""
+
+    def __init__(self, name, options, service, driver, installer=None, aliases=(), configure=None):
+        """
+        Args:
+            name (str): Canonical browser name (chrome, firefox, edge)
+            options (str): Import path of the Options class
+            service (str): Import path of the driver Service class
+            driver (str): Import path of the WebDriver class
+            installer (str): Import path of the webdriver_manager class resolving
+                the driver binary; None lets Selenium Manager find it
+            aliases (tuple): Other names of the browser (W3C ``browserName`` values)
+            configure (callable): Adds browser-specific arguments to new options
+        """
+        self.name = name
+        self.options_path = options
+        self.service_path = service
+        self.driver_path = driver
+        self.installer_path = installer
+        self.aliases = tuple(aliases)
+        self.configure = configure
+
+    @property
+    def names(self):
+        """Every name the browser is known by"""
+        return (self.name,) + self.aliases
+
+    def options(self):
+        """New browser options with the browser-specific defaults applied"""
+        options = load(self.options_path)()
+        if self.configure:
+            self.configure(options)
+        return options
+
+    def service(self):
+        """Driver service for a local browser (driver binary resolved on first use)"""
+        service_class = load(self.service_path)
+        if self.installer_path is None:
+            return service_class()
+        return service_class(load(self.installer_path)().install())
+
+    def driver(self, options):
+        """Start a local browser"""
+        return load(self.driver_path)(service=self.service(), options=options)
+
+
+BROWSERS = {}
+
+
+def register_browser(backend):
+    """Make a browser backend available under its name and aliases"""
+    for name in backend.names:
+        BROWSERS[name] = backend
+    return backend
+
+
+def get_browser(name):
+    """
+    Look up a browser backend
+
+    Args:
+        name (str): Browser name or alias (case insensitive)
+
+    Returns:
+        BrowserBackend: Registered backend
+
+    Raises:
+        ValueError: If no backend is registered under that name
+    """
+    backend = BROWSERS.get((name or '').lower())
+    if backend is None:
+        raise ValueError(f"Unsupported browser: {name}")
+    return backend
+
+
+def supported_browsers():
+    """Canonical names of the registered browsers"""
+    return tuple(dict.fromkeys(backend.name for backend in BROWSERS.values()))
+
+
+def _chrome_defaults(options):
+    # Additional Chrome options for stability
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+
+
+register_browser(BrowserBackend(
+    'chrome',
+    options='selenium.webdriver.chrome.options:Options',
+    service='selenium.webdriver.chrome.service:Service',
+    driver='selenium.webdriver.chrome.webdriver:WebDriver',
+    installer='webdriver_manager.chrome:ChromeDriverManager',
+    configure=_chrome_defaults,
+))
+register_browser(BrowserBackend(
+    'firefox',
+    options='selenium.webdriver.firefox.options:Options',
+    service='selenium.webdriver.firefox.service:Service',
+    driver='selenium.webdriver.firefox.webdriver:WebDriver',
+    installer='webdriver_manager.firefox:GeckoDriverManager',
+))
+register_browser(BrowserBackend(
+    'edge',
+    options='selenium.webdriver.edge.options:Options',
+    service='selenium.webdriver.edge.service:Service',
+    driver='selenium.webdriver.edge.webdriver:WebDriver',
+    installer='webdriver_manager.microsoft:EdgeChromiumDriverManager',
+    # Edge reports itself as 'msedge' / 'MicrosoftEdge'
+    aliases=('msedge', 'microsoftedge'),
+))
@@ -0,0 +1,176 @@
+"""
+WebDriver command latency instrumentation
+
+Wraps a driver's RemoteConnection so every command is recorded with its name,
+duration and payload size, attributed to the running test and to the
+outermost page-object method that issued it. Makes N+1 round-trip patterns
+(e.g. one ``.text`` call per menu item) visible and enforceable via budgets.
+"""
+import bisect
+import json
+import sys
+import time
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# How far up the stack to look for the calling page-object method
+MAX_STACK_DEPTH = 40
+
+
+def _empty_stats():
+    return {
+        'commands': 0,
+        'time': 0.0,
+        'bytes': 0,
+        'by_command': {},
+        'by_method': {},
+        'histogram': [0] * (len(HISTOGRAM_BUCKETS_MS) + 1),
+    }
+
+
+def _payload_size(value):
+    """Approximate JSON size of a command payload or response value"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _page_object_method():
+    """Name of the outermost page-object method on the current call stack"""
+    frame = sys._getframe(2)
+    found = None
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        owner = frame.f_locals.get('self')
+        if owner is not None and type(owner).__module__.startswith('pages.'):
+            found = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+        depth += 1
+    return found
+
+
+class CommandRecorder:
+    """Collects per-test command statistics for the current process"""
+
+    def __init__(self):
+        self.current_test = None
+        self.tests = {}
+
+    def record(self, command, duration, size, method):
+        """
+        Record one WebDriver command
+
+        Args:
+            command (str): WebDriver command name (e.g. findElement, getElementText)
+            duration (float): Round-trip time in seconds
+            size (int): Request plus response payload size in bytes
+            method (str): Calling page-object method, if any
+        """
+        stats = self.tests.setdefault(self.current_test or '<no test>', _empty_stats())
+        stats['commands'] += 1
+        stats['time'] += duration
+        stats['bytes'] += size
+        stats['by_command'][command] = stats['by_command'].get(command, 0) + 1
+        stats['histogram'][bisect.bisect_left(HISTOGRAM_BUCKETS_MS, duration * 1000)] += 1
+
+        if method:
+            entry = stats['by_method'].setdefault(method, {'commands': 0, 'time': 0.0})
+            entry['commands'] += 1
+            entry['time'] += duration
+
+    def command_count(self, nodeid):
+        """Commands recorded so far for a test"""
+        return self.tests.get(nodeid, {}).get('commands', 0)
+
+    def pop_test(self, nodeid):
+        """Return and forget the statistics of a finished test"""
+        return self.tests.pop(nodeid, None)
+
+
+# Process-wide recorder shared by all instrumented drivers
+RECORDER = CommandRecorder()
+
+
+class InstrumentedConnection:
+    """RemoteConnection wrapper that times every command it executes"""
+
+    def __init__(self, connection, recorder=None):
+        """
+        Args:
+            connection (RemoteConnection): The driver's original command executor
+            recorder (CommandRecorder): Where to record, uses the process-wide one if None
+        """
+        self._connection = connection
+        self._recorder = recorder or RECORDER
+
+    def execute(self, command, params):
+        start = time.perf_counter()
+        response = self._connection.execute(command, params)
+        duration = time.perf_counter() - start
+
+        size = _payload_size(params) + _payload_size((response or {}).get('value'))
+        self._recorder.record(command, duration, size, _page_object_method())
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def instrument(driver, recorder=None):
+    """
+    Install the instrumented command executor on a driver (idempotent)
+
+    Args:
+        driver (WebDriver): Driver to instrument
+        recorder (CommandRecorder): Where to record, uses the process-wide one if None
+
+    Returns:
+        WebDriver: The same driver
+    """
+    if not isinstance(driver.command_executor, InstrumentedConnection):
+        driver.command_executor = InstrumentedConnection(driver.command_executor, recorder)
+    return driver
+
+
+class CommandReport:
+    """Session-wide aggregation of per-test command statistics"""
+
+    def __init__(self):
+        self.tests = {}
+
+    def add(self, nodeid, stats):
+        """Store the statistics of a finished test (a rerun replaces earlier attempts)"""
+        if stats:
+            self.tests[nodeid] = stats
+
+    def chattiest_tests(self, limit=10):
+        """(nodeid, stats) pairs with the most commands"""
+        ranked = sorted(self.tests.items(), key=lambda item: item[1]['commands'], reverse=True)
+        return ranked[:limit]
+
+    def chattiest_methods(self, limit=10):
+        """(method, totals) pairs with the most commands across all tests"""
+        methods = {}
+        for stats in self.tests.values():
+            for method, entry in stats['by_method'].items():
+                total = methods.setdefault(method, {'commands': 0, 'time': 0.0, 'tests': 0})
+                total['commands'] += entry['commands']
+                total['time'] += entry['time']
+                total['tests'] += 1
+        ranked = sorted(methods.items(), key=lambda item: item[1]['commands'], reverse=True)
+        return ranked[:limit]
+
+    def histogram(self):
+        """Session-wide latency histogram as (label, count) pairs"""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for stats in self.tests.values():
+            counts = [a + b for a, b in zip(counts, stats['histogram'])]
+        labels = [f"<= {bound} ms" for bound in HISTOGRAM_BUCKETS_MS]
+        labels.append(f"> {HISTOGRAM_BUCKETS_MS[-1]} ms")
+        return list(zip(labels, counts))
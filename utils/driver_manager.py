@@ -4,23 +4,38 @@ WebDriver utilities for managing browser instances
 import os
 import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from config.config import Config
+from utils.browsers import get_browser
+from utils.browser_context import BrowserContext
+from utils.command_metrics import instrument
+from utils.memory_watchdog import MemoryWatchdog
+from utils import network_trace
 
 class DriverManager:
     """Manages WebDriver instances for different browsers"""
     
-    def __init__(self):
+    SUPPORTED_BACKENDS = ('local', 'remote')
+    
+    def __init__(self, backend=None, remote_url=None):
+        """
+        Args:
+            backend (str): Driver backend (local, remote), uses config default if None
+            remote_url (str): Selenium Grid / W3C endpoint for the remote backend
+        """
         self.driver = None
+        # Warm drivers parked for reuse: list of (browser_name, driver)
+        self.pool = []
+        # Long-lived browser hosting per-test contexts (context isolation mode)
+        self.context_host = None
+        self.context = None
+        # Memory history of long-lived browsers, sampled between tests
+        self.watchdog = MemoryWatchdog()
+        self.backend = (backend or Config.DRIVER_BACKEND).lower()
+        self.remote_url = remote_url or Config.REMOTE_URL
+        
+        if self.backend not in self.SUPPORTED_BACKENDS:
+            raise ValueError(f"Unsupported driver backend: {self.backend}")
+        
         Config.create_directories()
     
     def get_driver(self, browser_name=None):
@@ -36,16 +51,23 @@ class DriverManager:
         if browser_name is None:
             browser_name = Config.BROWSER
         
-        browser_name = browser_name.lower()
+        browser = get_browser(browser_name)
+        
+        pooled = self._take_from_pool(browser)
+        if pooled:
+            self.driver = pooled
+            return self.driver
         
-        if browser_name == 'chrome':
-            self.driver = self._get_chrome_driver()
-        elif browser_name == 'firefox':
-            self.driver = self._get_firefox_driver()
-        elif browser_name == 'edge':
-            self.driver = self._get_edge_driver()
+        options = self.build_options(browser.name)
+        
+        if self.backend == 'remote':
+            self.driver = self._get_remote_driver(options)
         else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
+            # Browser modules and webdriver_manager are imported here, on first use
+            self.driver = browser.driver(options)
+        
+        if Config.COMMAND_METRICS:
+            instrument(self.driver)
         
         # Configure common driver settings
         self.driver.implicitly_wait(Config.IMPLICIT_WAIT)
@@ -53,41 +75,49 @@ class DriverManager:
         
         return self.driver
     
-    def _get_chrome_driver(self):
-        """Initialize Chrome WebDriver"""
-        options = ChromeOptions()
-        
-        if Config.HEADLESS:
-            options.add_argument('--headless')
+    def build_options(self, browser_name):
+        """
+        Build browser options (capabilities) shared by local and remote backends
         
-        # Additional Chrome options for stability
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
+        Args:
+            browser_name (str): Browser name (chrome, firefox, edge)
         
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
-    
-    def _get_firefox_driver(self):
-        """Initialize Firefox WebDriver"""
-        options = FirefoxOptions()
+        Returns:
+            ArgOptions: Browser-specific options instance
+        """
+        browser = get_browser(browser_name)
+        options = browser.options()
         
         if Config.HEADLESS:
             options.add_argument('--headless')
         
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        if Config.NETWORK_TRACE:
+            network_trace.enable(options, browser.name)
+        
+        return options
+    
+    def _get_remote_driver(self, options):
+        """Initialize Remote WebDriver against a Selenium Grid or W3C endpoint"""
+        from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+        return RemoteWebDriver(command_executor=self.remote_url, options=options)
     
-    def _get_edge_driver(self):
-        """Initialize Edge WebDriver"""
-        options = EdgeOptions()
+    def network_recorder(self, driver=None):
+        """
+        Start recording a driver's network requests from this point on
         
-        if Config.HEADLESS:
-            options.add_argument('--headless')
+        Args:
+            driver (WebDriver): Driver to record, the current one if None
         
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        Returns:
+            NetworkRecorder: Recorder, None if tracing is off or the browser can't trace
+        """
+        driver = driver or self.driver
+        if not Config.NETWORK_TRACE or driver is None \
+                or not network_trace.NetworkRecorder.supported(driver):
+            return None
+        recorder = network_trace.NetworkRecorder(driver)
+        recorder.reset()
+        return recorder
     
     def take_screenshot(self, test_name="test"):
         """
@@ -113,6 +143,147 @@ class DriverManager:
             print(f"Failed to take screenshot: {e}")
             return None
     
+    def get_context_driver(self, browser_name=None):
+        """
+        Return the long-lived browser focused on a fresh isolated browser context
+        
+        The browser is started on first use and shared by later calls; each call
+        gets its own CDP browser context (separate cookies, storage and cache).
+        Falls back to a new browser when the driver cannot issue CDP commands.
+        
+        Args:
+            browser_name (str): Browser name (chrome, edge)
+        
+        Returns:
+            WebDriver: Driver focused on the new context's page
+        """
+        if self.context_host is None:
+            self.context_host = self.get_driver(browser_name)
+            self.driver = None
+        
+        if not BrowserContext.supported(self.context_host):
+            print("Warning: Browser contexts need local Chrome/Edge, using a new browser instead")
+            host, self.context_host = self.context_host, None
+            self.driver = host
+            return self.driver
+        
+        self.context = BrowserContext(self.context_host)
+        try:
+            self.driver = self.context.open()
+        except Exception as e:
+            # Host browser died (crash, force quit): start a new one once
+            print(f"Warning: Context host unusable, restarting browser: {e}")
+            self.quit_context_host()
+            self.context_host = self.get_driver(browser_name)
+            self.context = BrowserContext(self.context_host)
+            self.driver = self.context.open()
+        return self.driver
+    
+    def release_context(self):
+        """
+        Dispose the current browser context, keeping the host browser running
+        unless the memory watchdog flagged it
+        """
+        if self.context is None:
+            self.quit_driver()
+            return
+        
+        try:
+            self.context.close()
+        except Exception as e:
+            print(f"Warning: Could not dispose browser context, restarting browser: {e}")
+            self.quit_context_host()
+        finally:
+            self.context = None
+            self.driver = None
+        
+        reason = self.context_host and self.watchdog.verdict(self.context_host)
+        if reason:
+            print(f"Recycling context host browser: {reason}")
+            self.quit_context_host()
+    
+    def quit_context_host(self):
+        """Quit the long-lived browser used for context isolation"""
+        if self.context_host:
+            self._quit(self.context_host)
+            self.context_host = None
+    
+    def release_driver(self):
+        """
+        Park the current driver in the pool with cookies and storage reset,
+        so the next get_driver() call skips browser startup.
+        Falls back to quitting when the pool is full, the reset fails or the
+        memory watchdog flagged the browser.
+        """
+        if not self.driver:
+            return
+        
+        if len(self.pool) >= Config.DRIVER_POOL_SIZE:
+            self.quit_driver()
+            return
+        
+        reason = self.watchdog.verdict(self.driver)
+        if reason:
+            print(f"Recycling pooled browser: {reason}")
+            self.quit_driver()
+            return
+        
+        try:
+            self.reset_state(self.driver)
+        except Exception as e:
+            print(f"Warning: Could not reset driver for reuse: {e}")
+            self.quit_driver()
+            return
+        
+        self.pool.append((self.driver.capabilities.get('browserName', '').lower(), self.driver))
+        self.driver = None
+    
+    @staticmethod
+    def reset_state(driver):
+        """
+        Clear cookies and storage of the current origin and park on about:blank
+        
+        Raises:
+            WebDriverException: If the browser cannot be reset
+        """
+        driver.delete_all_cookies()
+        # Storage is inaccessible on about:blank/data: pages, nothing to clear there
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.get("about:blank")
+    
+    def _take_from_pool(self, browser):
+        """Return a live pooled driver for the browser backend, or None"""
+        index = 0
+        while index < len(self.pool):
+            pooled_name, driver = self.pool[index]
+            if pooled_name not in browser.names:
+                index += 1
+                continue
+            # The next entry moves into this index
+            del self.pool[index]
+            try:
+                driver.current_url  # Liveness check
+                return driver
+            except Exception:
+                # Dead browser: drop it and keep looking for a live one
+                self._quit(driver)
+        return None
+    
+    def drain_pool(self):
+        """Quit every pooled driver"""
+        while self.pool:
+            _, driver = self.pool.pop()
+            self._quit(driver)
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Warning: Issue closing pooled driver: {e}")
+    
     def quit_driver(self):
         """Quit the WebDriver instance safely"""
         if self.driver:
@@ -131,6 +302,17 @@ class DriverManager:
         import subprocess
         import platform
         
+        if self.backend == 'remote':
+            # Browsers live on the grid nodes; only the session can be released
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception as e:
+                    print(f"Warning: Could not quit remote session: {e}")
+                finally:
+                    self.driver = None
+            return
+        
         try:
             if platform.system() == "Windows":
                 # Kill Chrome processes
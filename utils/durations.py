@@ -0,0 +1,119 @@
+"""
+Historical per-test durations persisted across runs
+
+Keeps an exponentially weighted moving average of each test attempt's wall
+time (setup + call + teardown) so the scheduler can balance
+workers and CI shards by expected cost instead of test count.
+"""
+import json
+import os
+from statistics import median
+from config.config import Config
+from utils.file_lock import file_lock
+
+# Weight of the newest sample in the moving average
+SMOOTHING = 0.5
+
+
+def base_nodeid(nodeid):
+    """Node id without the ``@group`` suffix xdist adds under ``--dist loadgroup``"""
+    head, separator, group = nodeid.rpartition('@')
+    if separator and '::' in head and ']' not in group and '::' not in group:
+        return head
+    return nodeid
+
+
+class DurationStore:
+    """JSON-backed moving averages of test durations"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): JSON file location, uses config default if None
+        """
+        self.path = path or Config.DURATIONS_PATH
+        self.durations = {}
+        # Samples measured during this session, merged on save
+        self._samples = {}
+        self._pending = {}
+        self._skipped = set()
+
+    def load(self):
+        """Load durations from disk (missing or corrupt file means empty)"""
+        self.durations = self._read()
+        return self
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('durations', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read test durations: {e}")
+            return {}
+
+    def record_phase(self, nodeid, when, seconds, skipped=False):
+        """
+        Add the duration of one test phase; the sample is complete at teardown
+
+        Args:
+            nodeid (str): pytest node id
+            when (str): setup, call or teardown
+            seconds (float): Phase duration
+            skipped (bool): The test was skipped (its sample is discarded)
+        """
+        nodeid = base_nodeid(nodeid)
+        self._pending[nodeid] = self._pending.get(nodeid, 0.0) + seconds
+        if skipped:
+            self._skipped.add(nodeid)
+        if when == 'teardown':
+            seconds = self._pending.pop(nodeid)
+            # A skipped test says nothing about how long it takes to run
+            if nodeid in self._skipped:
+                self._skipped.discard(nodeid)
+            else:
+                self.record(nodeid, seconds)
+
+    def record(self, nodeid, seconds):
+        """Record one complete run of a test"""
+        self._samples.setdefault(nodeid, []).append(seconds)
+        self.durations[nodeid] = _smooth(self.durations.get(nodeid), seconds)
+
+    def default_estimate(self):
+        """Estimate for tests without history: median known duration"""
+        if self.durations:
+            return median(self.durations.values())
+        return Config.DEFAULT_TEST_DURATION
+
+    def estimate(self, nodeid, default=None):
+        """Expected duration of a test in seconds"""
+        value = self.durations.get(base_nodeid(nodeid))
+        if value is None:
+            return self.default_estimate() if default is None else default
+        return value
+
+    def save(self):
+        """Apply this session's samples to the file on disk and write it"""
+        if not self._samples:
+            return
+        with file_lock(self.path):
+            durations = self._read()
+            for nodeid, samples in self._samples.items():
+                for seconds in samples:
+                    durations[nodeid] = _smooth(durations.get(nodeid), seconds)
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'durations': durations}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+        self.durations = durations
+        self._samples = {}
+
+
+def _smooth(previous, seconds):
+    if previous is None:
+        return round(seconds, 3)
+    return round(SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3)
@@ -0,0 +1,449 @@
+"""
+Local latency / fault-injection reverse proxy
+
+Sits between the browser (or an HTTP client) and the target - the real site
+or the local stand-in - and degrades responses per route as declared in a
+JSON scenario file: added latency with jitter, bandwidth caps, dropped
+connections and 5xx responses. Pointing the suite at the proxy shows whether
+``EXPLICIT_WAIT`` and the page-object timeouts survive realistic degradation
+without being padded far beyond it.
+
+A reverse proxy (the suite's BASE_URL is the proxy) rather than a browser
+proxy: HTTPS traffic through a browser proxy is an opaque CONNECT tunnel, so
+routes could not be told apart. Redirects, cookies and absolute links of the
+upstream are rewritten to the proxy so the browser stays behind it. Each
+browser connection keeps one upstream connection alive for its requests, so
+the proxy adds the injected faults and not a TCP/TLS handshake per request.
+
+Scenario file::
+
+    {
+      "upstream": "https://mathsteam.id/",
+      "seed": 7,
+      "rules": [
+        {"path": "/dashboard", "latency_ms": 1500, "jitter_ms": 500},
+        {"path": "/login", "methods": ["POST"], "error_rate": 0.2, "error_status": 503},
+        {"path": "*.js", "bandwidth_kbps": 256},
+        {"path": "*", "drop_rate": 0.02}
+      ]
+    }
+
+Rules match the request path (fnmatch glob) and method; the first match wins.
+
+Usage:
+    python -m utils.fault_proxy scenarios/degraded.json --port 8766
+"""
+import argparse
+import fnmatch
+import http.client
+import json
+import random
+import socket
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from config.config import Config
+
+# Headers that describe a single connection and are never forwarded
+HOP_BY_HOP = frozenset((
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade',
+))
+
+# Bodies in which absolute upstream URLs are rewritten to the proxy
+REWRITTEN_TYPES = ('text/html', 'text/css', 'javascript', 'json')
+
+RULE_KEYS = ('name', 'path', 'methods', 'latency_ms', 'jitter_ms', 'bandwidth_kbps',
+             'drop_rate', 'error_rate', 'error_status')
+
+
+class FaultRule:
+    """Degradation applied to requests matching a path pattern"""
+
+    def __init__(self, path='*', methods=None, latency_ms=0, jitter_ms=0, bandwidth_kbps=None,
+                 drop_rate=0.0, error_rate=0.0, error_status=503, name=None):
+        """
+        Args:
+            path (str): fnmatch pattern of the request path (query string excluded)
+            methods (list): HTTP methods the rule applies to, all if None
+            latency_ms (float): Delay before the response
+            jitter_ms (float): Extra random delay up to this many ms
+            bandwidth_kbps (float): Response throughput cap in kbit/s, None for unlimited
+            drop_rate (float): Share of requests whose connection is reset without a response
+            error_rate (float): Share of requests answered with error_status instead of upstream
+            error_status (int): Status of injected errors
+            name (str): Label in the statistics, defaults to the path pattern
+        """
+        self.path = path
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth_kbps = bandwidth_kbps
+        self.drop_rate = drop_rate
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.name = name or path
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a rule from its scenario entry
+
+        Raises:
+            ValueError: On unknown keys (usually a typo that would silently disable a fault)
+        """
+        unknown = set(data) - set(RULE_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown fault rule keys: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def matches(self, method, path):
+        """True if the rule applies to a request"""
+        if self.methods is not None and method not in self.methods:
+            return False
+        return fnmatch.fnmatchcase(path, self.path)
+
+
+class Scenario:
+    """Ordered fault rules plus the upstream they apply to"""
+
+    def __init__(self, rules, upstream=None, seed=None):
+        """
+        Args:
+            rules (list): FaultRule instances, first match wins
+            upstream (str): Target base URL, None to let the caller decide
+            seed (int): Random seed for reproducible drops and errors
+        """
+        self.rules = rules
+        self.upstream = upstream
+        self.seed = seed
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a JSON scenario file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not a valid scenario
+        """
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls([FaultRule.from_dict(rule) for rule in data.get('rules', [])],
+                   upstream=data.get('upstream'), seed=data.get('seed'))
+
+    def rule_for(self, method, path):
+        """First rule matching a request, None to pass it through untouched"""
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+
+class FaultProxy:
+    """Serves the degrading reverse proxy in a background thread"""
+
+    def __init__(self, scenario, upstream=None, host='127.0.0.1', port=None, timeout=60):
+        """
+        Args:
+            scenario (Scenario): Faults to inject
+            upstream (str): Target base URL, uses the scenario's, then BASE_URL if None
+            host (str): Interface to bind
+            port (int): Port to listen on (0 picks a free port), config default if None
+            timeout (float): Upstream connection timeout in seconds
+        """
+        self.scenario = scenario
+        self.upstream = (upstream or scenario.upstream or Config.BASE_URL).rstrip('/')
+        self.host = host
+        self.port = Config.FAULT_PROXY_PORT if port is None else port
+        self.timeout = timeout
+        self.random = random.Random(scenario.seed)
+        # Per-rule counters: requests, delayed, throttled, dropped, errors
+        self.stats = {}
+        self._lock = threading.Lock()
+        # One upstream connection per handler thread (= per browser connection)
+        self._local = threading.local()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL with trailing slash, usable as ``BASE_URL``"""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """Start serving in a background thread"""
+        proxy = self
+
+        class Handler(_FaultProxyRequestHandler):
+            pass
+        Handler.server_state = proxy
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Pick up the real port when 0 was requested
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def count(self, rule, event):
+        """Increment a rule's counter"""
+        with self._lock:
+            counters = self.stats.setdefault(rule.name, {})
+            counters[event] = counters.get(event, 0) + 1
+
+    def roll(self, rate):
+        """True with the given probability (scenario-seeded)"""
+        if not rate:
+            return False
+        with self._lock:
+            return self.random.random() < rate
+
+    def upstream_connection(self):
+        """The calling thread's upstream connection, opened on first use and then kept alive"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            upstream = urlsplit(self.upstream)
+            connection_class = http.client.HTTPSConnection if upstream.scheme == 'https' \
+                else http.client.HTTPConnection
+            connection = connection_class(upstream.netloc, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def close_upstream_connection(self):
+        """Close the calling thread's upstream connection; the next request opens a new one"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def jitter(self, jitter_ms):
+        with self._lock:
+            return self.random.uniform(0, jitter_ms) if jitter_ms else 0
+
+
+class _FaultProxyRequestHandler(BaseHTTPRequestHandler):
+    """Forwards requests upstream, degrading them per the scenario"""
+
+    server_state = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Keep test output clean
+        pass
+
+    def finish(self):
+        super().finish()
+        # The browser closed its connection: this thread serves no more requests
+        self.server_state.close_upstream_connection()
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_HEAD(self):
+        self._handle('HEAD')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def do_OPTIONS(self):
+        self._handle('OPTIONS')
+
+    def _handle(self, method):
+        proxy = self.server_state
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+
+        rule = proxy.scenario.rule_for(method, urlsplit(self.path).path)
+        if rule is not None:
+            proxy.count(rule, 'requests')
+            delay = rule.latency_ms + proxy.jitter(rule.jitter_ms)
+            if delay:
+                proxy.count(rule, 'delayed')
+                time.sleep(delay / 1000)
+            if proxy.roll(rule.drop_rate):
+                proxy.count(rule, 'dropped')
+                return self._drop()
+            if proxy.roll(rule.error_rate):
+                proxy.count(rule, 'errors')
+                return self._respond(rule.error_status, [('Content-Type', 'text/plain')],
+                                     f"Injected fault: {rule.error_status}".encode(), method)
+
+        try:
+            status, headers, data = self._forward(method, body)
+        except (OSError, ValueError, http.client.HTTPException) as e:
+            return self._respond(502, [('Content-Type', 'text/plain')],
+                                 f"Upstream unreachable: {e}".encode(), method)
+
+        bandwidth = rule.bandwidth_kbps if rule is not None else None
+        if bandwidth:
+            proxy.count(rule, 'throttled')
+        self._respond(status, headers, data, method, bandwidth)
+
+    def _forward(self, method, body):
+        proxy = self.server_state
+        upstream = urlsplit(proxy.upstream)
+
+        proxy_origin = proxy.url.rstrip('/')
+        upstream_origin = f"{upstream.scheme}://{upstream.netloc}"
+        headers = {}
+        for name, value in self.headers.items():
+            lower = name.lower()
+            if lower in HOP_BY_HOP or lower in ('host', 'accept-encoding', 'content-length'):
+                continue
+            if lower in ('origin', 'referer'):
+                value = value.replace(proxy_origin, upstream_origin)
+            headers[name] = value
+        headers['Host'] = upstream.netloc
+        # Uncompressed bodies, so absolute upstream URLs can be rewritten
+        headers['Accept-Encoding'] = 'identity'
+        if body is not None:
+            headers['Content-Length'] = str(len(body))
+
+        target = f"{upstream.path.rstrip('/')}{self.path}"
+        while True:
+            connection = proxy.upstream_connection()
+            reused = connection.sock is not None
+            try:
+                connection.request(method, target, body, headers)
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                proxy.close_upstream_connection()
+                # The upstream closed the idle kept-alive connection before reading
+                # the request: send it again on a new one
+                if not reused:
+                    raise
+            except BaseException:
+                proxy.close_upstream_connection()
+                raise
+        if response.will_close:
+            proxy.close_upstream_connection()
+        status = response.status
+        upstream_headers = response.getheaders()
+
+        rewrite = upstream.scheme == 'https'
+        headers = []
+        content_type = ''
+        encoded = False
+        for name, value in upstream_headers:
+            lower = name.lower()
+            if lower in HOP_BY_HOP or lower == 'content-length':
+                continue
+            if lower == 'location':
+                value = value.replace(upstream_origin, proxy_origin)
+            elif lower == 'set-cookie' and rewrite:
+                value = _plain_http_cookie(value)
+            elif lower == 'content-type':
+                content_type = value.lower()
+            elif lower == 'content-encoding':
+                encoded = True
+            headers.append((name, value))
+
+        if not encoded and any(kind in content_type for kind in REWRITTEN_TYPES):
+            data = _rewrite_origin(data, upstream_origin, proxy_origin)
+        return status, headers, data
+
+    def _respond(self, status, headers, data, method='GET', bandwidth_kbps=None):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if method == 'HEAD' or not data:
+            return
+
+        if not bandwidth_kbps:
+            self.wfile.write(data)
+            return
+        # Paced writes: one chunk per tenth of a second at the capped rate
+        rate = bandwidth_kbps * 1000 / 8
+        chunk = max(int(rate / 10), 1024)
+        for start in range(0, len(data), chunk):
+            piece = data[start:start + chunk]
+            # Each piece arrives only after the time it takes at the capped rate
+            time.sleep(len(piece) / rate)
+            self.wfile.write(piece)
+            self.wfile.flush()
+
+    def _drop(self):
+        # Reset instead of a clean close, like a failing load balancer
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        self.close_connection = True
+
+
+def _rewrite_origin(data, upstream_origin, proxy_origin):
+    """Replace absolute upstream URLs (plain and JSON-escaped) with the proxy's"""
+    for old, new in ((upstream_origin, proxy_origin),
+                     (upstream_origin.replace('/', '\\/'), proxy_origin.replace('/', '\\/'))):
+        data = data.replace(old.encode(), new.encode())
+    return data
+
+
+def _plain_http_cookie(cookie):
+    """Make an HTTPS cookie acceptable on the plain-HTTP proxy origin"""
+    attributes = []
+    for attribute in cookie.split(';'):
+        name = attribute.strip().split('=', 1)[0].lower()
+        if name in ('secure', 'domain'):
+            continue
+        if name == 'samesite' and attribute.strip().lower() == 'samesite=none':
+            # SameSite=None requires Secure; Lax keeps same-site navigation working
+            attribute = ' SameSite=Lax'
+        attributes.append(attribute)
+    return ';'.join(attributes)
+
+
+def main():
+    """Run the fault-injection proxy until interrupted"""
+    parser = argparse.ArgumentParser(description="Latency / fault-injection reverse proxy")
+    parser.add_argument('scenario', help="JSON scenario file")
+    parser.add_argument('--upstream', default=None,
+                        help="Target base URL (default: the scenario's, then BASE_URL)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=Config.FAULT_PROXY_PORT)
+    args = parser.parse_args()
+
+    proxy = FaultProxy(Scenario.load(args.scenario), upstream=args.upstream,
+                       host=args.host, port=args.port).start()
+    print(f"Fault proxy for {proxy.upstream} listening on {proxy.url} "
+          f"({len(proxy.scenario.rules)} rules)")
+
+    try:
+        proxy._thread.join()
+    except KeyboardInterrupt:
+        print("Stopping fault proxy")
+    finally:
+        proxy.stop()
+        for name, counters in proxy.stats.items():
+            print(f"{name}: " + ", ".join(f"{key} {value}" for key, value in sorted(counters.items())))
+
+
+if __name__ == '__main__':
+    main()
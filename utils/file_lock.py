@@ -0,0 +1,57 @@
+"""
+Cross-process lock for the JSON stores
+
+xdist workers (and parallel jobs sharing a workspace) save the same stores
+at the end of a session, each with a read-merge-replace that must not
+interleave with another process's. The lock is a ``<path>.lock`` file
+created exclusively, which behaves the same on Windows and POSIX.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+# A lock older than this was left behind by a killed process
+STALE_LOCK_SECONDS = 30
+
+
+@contextmanager
+def file_lock(path, timeout=10, poll=0.05):
+    """
+    Hold an exclusive lock on a file path
+
+    Args:
+        path (str): File the lock protects
+        timeout (float): Seconds to wait for another holder
+        poll (float): Seconds between attempts
+
+    Raises:
+        TimeoutError: If the lock is still held after the timeout
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                # Released between the two calls
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout:g}s")
+            time.sleep(poll)
+
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
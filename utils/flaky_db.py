@@ -0,0 +1,155 @@
+"""
+Flakiness database persisted across runs
+
+Tracks per-test outcomes (including reruns and their failure categories) and
+per-locator action retries, so consistently flaky tests can be run last or
+quarantined instead of rerunning the whole suite.
+"""
+import json
+import os
+from datetime import datetime
+from config.config import Config
+from utils.file_lock import file_lock
+
+
+class FlakinessDB:
+    """JSON-backed store of test and locator flakiness"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): JSON file location, uses config default if None
+        """
+        self.path = path or Config.FLAKINESS_DB_PATH
+        self.tests = {}
+        self.locators = {}
+        # Increments recorded during this session, merged on save
+        self._test_delta = {}
+        self._locator_delta = {}
+
+    def load(self):
+        """Load the database from disk (missing or corrupt file means empty)"""
+        data = self._read()
+        self.tests = data.get('tests', {})
+        self.locators = data.get('locators', {})
+        return self
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read flakiness database: {e}")
+            return {}
+
+    def record_test(self, nodeid, outcome, category=None):
+        """
+        Record one attempt of a test
+
+        Args:
+            nodeid (str): pytest node id
+            outcome (str): passed, failed or rerun
+            category (str): Transient failure category, if any
+        """
+        for store in (self.tests, self._test_delta):
+            entry = store.setdefault(nodeid, _empty_test_entry())
+            entry['attempts'] += 1
+            if outcome == 'rerun':
+                entry['reruns'] += 1
+            elif outcome == 'passed':
+                entry['runs'] += 1
+                if entry.pop('_pending_rerun', False):
+                    entry['flaky_passes'] += 1
+            elif outcome == 'failed':
+                entry['runs'] += 1
+                entry['failures'] += 1
+                entry.pop('_pending_rerun', None)
+
+            if outcome == 'rerun':
+                entry['_pending_rerun'] = True
+            if category:
+                entry['categories'][category] = entry['categories'].get(category, 0) + 1
+            entry['last_seen'] = datetime.now().isoformat(timespec='seconds')
+
+    def record_locators(self, stats):
+        """
+        Merge action retry statistics collected by ``utils.retry``
+
+        Args:
+            stats (dict): Locator key -> {'retries', 'recovered', 'failed'}
+        """
+        for store in (self.locators, self._locator_delta):
+            for key, counters in stats.items():
+                entry = store.setdefault(key, {'retries': 0, 'recovered': 0, 'failed': 0})
+                for field, value in counters.items():
+                    entry[field] = entry.get(field, 0) + value
+
+    def flake_rate(self, nodeid):
+        """
+        Share of attempts that hit a transient failure and were rerun
+
+        Returns:
+            float: Flake rate in [0, 1], 0.0 for unknown tests
+        """
+        entry = self.tests.get(nodeid)
+        if not entry or not entry['attempts']:
+            return 0.0
+        return entry['reruns'] / entry['attempts']
+
+    def is_flaky(self, nodeid):
+        """True if the test has enough history and exceeds the flake threshold"""
+        entry = self.tests.get(nodeid)
+        if not entry or entry['runs'] < Config.FLAKY_MIN_RUNS:
+            return False
+        return self.flake_rate(nodeid) >= Config.FLAKY_THRESHOLD
+
+    def flaky_tests(self):
+        """Node ids of consistently flaky tests, flakiest first"""
+        flaky = [nodeid for nodeid in self.tests if self.is_flaky(nodeid)]
+        return sorted(flaky, key=self.flake_rate, reverse=True)
+
+    def save(self):
+        """Merge this session's increments into the file on disk and write it"""
+        with file_lock(self.path):
+            data = self._read()
+            tests = data.get('tests', {})
+            locators = data.get('locators', {})
+
+            for nodeid, delta in self._test_delta.items():
+                entry = tests.setdefault(nodeid, _empty_test_entry())
+                for field in ('attempts', 'runs', 'reruns', 'failures', 'flaky_passes'):
+                    entry[field] = entry.get(field, 0) + delta[field]
+                for category, count in delta['categories'].items():
+                    entry['categories'][category] = entry['categories'].get(category, 0) + count
+                entry['last_seen'] = delta['last_seen']
+
+            for key, delta in self._locator_delta.items():
+                entry = locators.setdefault(key, {'retries': 0, 'recovered': 0, 'failed': 0})
+                for field, value in delta.items():
+                    entry[field] = entry.get(field, 0) + value
+
+            for entry in tests.values():
+                entry.pop('_pending_rerun', None)
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'tests': tests, 'locators': locators}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+        self.tests, self.locators = tests, locators
+        self._test_delta, self._locator_delta = {}, {}
+
+
+def _empty_test_entry():
+    return {
+        'attempts': 0,
+        'runs': 0,
+        'reruns': 0,
+        'failures': 0,
+        'flaky_passes': 0,
+        'categories': {},
+        'last_seen': None,
+    }
@@ -0,0 +1,121 @@
+"""
+Target health probe used to gate the test session before any browser starts
+"""
+import statistics
+import time
+from config.config import Config
+
+
+class HealthCheck:
+    """Probes the target site over plain HTTP and measures baseline latency"""
+
+    def __init__(self, base_url=None, timeout=None, samples=None):
+        """
+        Args:
+            base_url (str): Site to probe, uses config default if None
+            timeout (float): Per-request timeout in seconds
+            samples (int): Requests per URL used for the latency baseline
+        """
+        self.base_url = (base_url or Config.BASE_URL).rstrip('/')
+        self.timeout = timeout or Config.HEALTH_CHECK_TIMEOUT
+        self.samples = samples or Config.HEALTH_CHECK_SAMPLES
+        self.results = {}
+        self.errors = []
+
+    @property
+    def urls(self):
+        """URLs that must respond for the suite to be worth running"""
+        return {
+            'home': f"{self.base_url}/",
+            'login': f"{self.base_url}/login",
+        }
+
+    def run(self):
+        """
+        Probe every URL
+
+        Returns:
+            HealthCheck: self, for chaining
+        """
+        import requests
+        self.results = {}
+        self.errors = []
+
+        with requests.Session() as session:
+            for name, url in self.urls.items():
+                self.results[name] = self._probe(session, name, url)
+
+        return self
+
+    def _probe(self, session, name, url):
+        """Request a URL several times and record status and latencies"""
+        import requests
+        latencies = []
+        status = None
+
+        for _ in range(self.samples):
+            start = time.perf_counter()
+            try:
+                response = session.get(url, timeout=self.timeout, allow_redirects=True)
+            except requests.RequestException as e:
+                self.errors.append(f"{name}: {url} unreachable ({e.__class__.__name__})")
+                return {'url': url, 'status': None, 'latency': None}
+
+            latencies.append(time.perf_counter() - start)
+            status = response.status_code
+
+            # 404 means the route is gone; other 4xx (e.g. bot protection) still
+            # leave the site usable for a real browser
+            if status >= 500 or status == 404:
+                self.errors.append(f"{name}: {url} returned HTTP {status}")
+                break
+
+        latency = statistics.median(latencies)
+        if latency > Config.HEALTH_MAX_LATENCY:
+            self.errors.append(
+                f"{name}: {url} too slow ({latency:.2f}s > {Config.HEALTH_MAX_LATENCY}s)"
+            )
+
+        return {'url': url, 'status': status, 'latency': latency}
+
+    @property
+    def healthy(self):
+        """True if every URL responded in time without a server error"""
+        return bool(self.results) and not self.errors
+
+    @property
+    def baseline_latency(self):
+        """Slowest median latency across probed URLs, None if nothing responded"""
+        latencies = [r['latency'] for r in self.results.values() if r['latency'] is not None]
+        return max(latencies) if latencies else None
+
+    def wait_scale(self):
+        """
+        Scale factor for wait budgets derived from the measured latency
+
+        Budget is HEALTH_WAIT_MULTIPLIER x baseline latency, capped at
+        MAX_WAIT_SCALE x EXPLICIT_WAIT. A fast probe never shortens waits: one
+        latency sample says nothing about how long the app takes to render.
+
+        Returns:
+            float: Multiplier to apply to configured timeouts (at least 1.0)
+        """
+        latency = self.baseline_latency
+        if latency is None:
+            return 1.0
+
+        budget = latency * Config.HEALTH_WAIT_MULTIPLIER
+        return min(max(budget / Config.EXPLICIT_WAIT, 1.0), Config.MAX_WAIT_SCALE)
+
+    def summary(self):
+        """One line per probed URL for terminal output"""
+        lines = []
+        for name, result in self.results.items():
+            if result['latency'] is None:
+                lines.append(f"{name}: {result['url']} -> unreachable")
+            else:
+                lines.append(
+                    f"{name}: {result['url']} -> HTTP {result['status']} "
+                    f"in {result['latency'] * 1000:.0f} ms"
+                )
+        return lines
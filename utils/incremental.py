@@ -0,0 +1,408 @@
+"""
+Content-hash incremental runs: skip tests whose inputs have not changed
+
+A passing test is recorded with a fingerprint of everything it depends on:
+its module source, the page-object and helper modules it imports, the
+conftest files above it, the config values that change behaviour and a
+content hash of every server page those page objects open. On the next run
+the fingerprints are recomputed with a few plain HTTP requests and tests whose
+fingerprint matches a recent pass are skipped. Results older than the
+staleness cap are always re-verified.
+
+Pages that redirect an anonymous client to the login form are fetched again
+with a session logged in as the tests' user, so changes behind the login count
+too; if that login fails they have no fingerprint and their tests always run.
+Under xdist the controller fetches every page once and hands the fingerprints
+to the workers, so all of them skip (and order) the same tests.
+"""
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+import sys
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+from config.config import Config
+from utils.file_lock import file_lock
+from utils.durations import base_nodeid
+
+# Config values that change what a test does (hashed, never stored in clear)
+CONFIG_KEYS = (
+    'BASE_URL', 'LOGIN_EMAIL', 'LOGIN_PASSWORD', 'BROWSER', 'HEADLESS',
+    'DRIVER_BACKEND', 'DRIVER_ISOLATION', 'WAIT_BACKEND',
+)
+
+# Packages whose modules count as a test's source when it (indirectly) imports them
+SOURCE_PACKAGES = ('pages.', 'utils.')
+
+# Per-request tokens that differ on every response without the page changing
+VOLATILE_PATTERNS = (
+    re.compile(rb'(<meta[^>]+name="csrf-token"[^>]+content=")[^"]*'),
+    re.compile(rb'(name="_token"[^>]+value=")[^"]*'),
+    re.compile(rb'(nonce=")[^"]*'),
+)
+
+# CSRF token of the login form (Laravel hidden input, else the meta tag)
+TOKEN_PATTERNS = (
+    re.compile(r'name="_token"[^>]+value="([^"]*)"'),
+    re.compile(r'<meta[^>]+name="csrf-token"[^>]+content="([^"]*)"'),
+)
+
+
+def _digest(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return _digest(f.read())
+    except OSError:
+        return None
+
+
+def page_urls(cls):
+    """``*_URL`` attributes of a page-object class (e.g. ``LoginPage.LOGIN_URL``)"""
+    return {value for name, value in vars(cls).items()
+            if name.endswith('_URL') and isinstance(value, str)}
+
+
+def page_objects(module):
+    """Page-object classes a test module uses, with their base classes"""
+    classes = set()
+    for value in vars(module).values():
+        if inspect.isclass(value) and value.__module__.startswith('pages.'):
+            classes.update(base for base in inspect.getmro(value)
+                           if base.__module__.startswith('pages.'))
+    return classes
+
+
+def source_modules(module):
+    """Source files of the page-object and helper modules a test module uses, transitively"""
+    seen = {}
+    pending = [module]
+    while pending:
+        for value in vars(pending.pop()).values():
+            if inspect.ismodule(value):
+                name = value.__name__
+            else:
+                name = getattr(value, '__module__', None)
+            if not isinstance(name, str) or not name.startswith(SOURCE_PACKAGES) or name in seen:
+                continue
+            dependency = sys.modules.get(name)
+            if dependency is not None and getattr(dependency, '__file__', None):
+                seen[name] = dependency.__file__
+                pending.append(dependency)
+    return sorted(seen.values())
+
+
+def site_urls():
+    """BASE_URL and the ``*_URL`` of every page-object class in the pages package"""
+    import pages
+
+    urls = {Config.BASE_URL}
+    for module_info in pkgutil.iter_modules(pages.__path__, 'pages.'):
+        module = importlib.import_module(module_info.name)
+        for value in vars(module).values():
+            if inspect.isclass(value) and value.__module__ == module.__name__:
+                urls.update(page_urls(value))
+    return sorted(urls)
+
+
+def conftest_paths(path, rootpath):
+    """conftest.py files from the root directory down to a test file"""
+    paths = []
+    directory = path.parent
+    while True:
+        candidate = directory / 'conftest.py'
+        if candidate.exists():
+            paths.append(candidate)
+        if directory == rootpath or directory.parent == directory:
+            break
+        directory = directory.parent
+    return list(reversed(paths))
+
+
+class ResponseFingerprints:
+    """Content hashes of server pages, fetched once per session"""
+
+    def __init__(self, timeout=None, hashes=None, login_url=None):
+        """
+        Args:
+            timeout (float): Per-request timeout in seconds
+            hashes (dict): Fingerprints fetched elsewhere (the xdist controller);
+                nothing is fetched then and other URLs have no fingerprint
+            login_url (str): Login form URL, BASE_URL + 'login' if None
+        """
+        self.timeout = timeout or Config.HEALTH_CHECK_TIMEOUT
+        self.login_url = login_url or f"{Config.BASE_URL}login"
+        self.fixed = hashes is not None
+        self.hashes = dict(hashes or {})
+        self._session = None
+        # Logged-in session for pages behind the login (False once login failed)
+        self._login_session = None
+
+    def get(self, url):
+        """
+        Fingerprint of a URL, fetched on first use
+
+        ETag or Last-Modified from a HEAD request when the server sends one,
+        otherwise a hash of the body with per-request tokens removed.
+
+        Returns:
+            str: Fingerprint, None if the URL could not be fetched
+        """
+        if url not in self.hashes and not self.fixed:
+            self.hashes[url] = self._fetch(url)
+        return self.hashes.get(url)
+
+    def prefetch(self, urls):
+        """
+        Fingerprint several URLs up front
+
+        Returns:
+            dict: url -> fingerprint (None if it could not be fetched)
+        """
+        return {url: self.get(url) for url in urls}
+
+    def _fetch(self, url):
+        import requests
+
+        if self._session is None:
+            self._session = requests.Session()
+        try:
+            fingerprint, location = self._fingerprint(self._session, url)
+            if location is None or not self._is_login(location):
+                return fingerprint
+            # Behind the login: what matters is the page the tests see once logged in
+            session = self._logged_in()
+            if session is None:
+                return None
+            fingerprint, location = self._fingerprint(session, url)
+            return None if location is not None and self._is_login(location) else fingerprint
+        except requests.RequestException:
+            return None
+
+    def _fingerprint(self, session, url):
+        """(fingerprint, redirect location or None) of one URL"""
+        response = session.head(url, timeout=self.timeout, allow_redirects=False)
+        if not response.is_redirect:
+            validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+            if validator and response.ok:
+                return f"validator:{validator}", None
+            response = session.get(url, timeout=self.timeout, allow_redirects=False)
+        if response.is_redirect:
+            # Only where it sends the browser matters, not per-request query strings
+            location = response.headers.get('Location', '').split('?', 1)[0]
+            return f"redirect:{response.status_code}:{location}", location
+        if response.status_code >= 500:
+            return None, None
+        body = response.content
+        for pattern in VOLATILE_PATTERNS:
+            body = pattern.sub(rb'\1', body)
+        return f"{response.status_code}:{_digest(body)}", None
+
+    def _is_login(self, location):
+        return urlsplit(location).path.rstrip('/') == urlsplit(self.login_url).path.rstrip('/')
+
+    def _logged_in(self):
+        """HTTP session logged in through the login form, None if login failed"""
+        if self._login_session is None:
+            self._login_session = self._login() or False
+        return self._login_session or None
+
+    def _login(self):
+        import requests
+
+        session = requests.Session()
+        try:
+            form = session.get(self.login_url, timeout=self.timeout)
+            data = {'email': Config.LOGIN_EMAIL, 'password': Config.LOGIN_PASSWORD}
+            for pattern in TOKEN_PATTERNS:
+                match = pattern.search(form.text)
+                if match:
+                    data['_token'] = match.group(1)
+                    break
+            response = session.post(self.login_url, data=data, timeout=self.timeout,
+                                    allow_redirects=False)
+        except requests.RequestException:
+            session.close()
+            return None
+        # A successful login redirects away from the form; a failed one back to it
+        if not response.is_redirect or self._is_login(response.headers.get('Location', '')):
+            session.close()
+            return None
+        return session
+
+    def close(self):
+        """Close the pooled HTTP sessions"""
+        for session in (self._session, self._login_session):
+            if session:
+                session.close()
+
+
+class InputFingerprinter:
+    """Computes the input fingerprint of collected tests"""
+
+    def __init__(self, config, responses=None):
+        """
+        Args:
+            config (pytest.Config): Session config (root path and CLI options)
+            responses (ResponseFingerprints): Page fingerprints, created if None
+        """
+        self.rootpath = config.rootpath
+        self.responses = responses or ResponseFingerprints()
+        self.options = {name: config.getoption(name)
+                        for name in ('--browser', '--headless', '--base-url')}
+        self._files = {}
+
+    def _source(self, path):
+        path = str(path)
+        if path not in self._files:
+            self._files[path] = _file_digest(path)
+        return self._files[path]
+
+    def _relative(self, path):
+        try:
+            return os.path.relpath(str(path), str(self.rootpath)).replace(os.sep, '/')
+        except ValueError:
+            return str(path)
+
+    def inputs(self, item):
+        """
+        Everything a test depends on, as a dict of digests
+
+        Returns:
+            dict: {sources, config, responses}, None if an input is unavailable
+        """
+        module = getattr(item, 'module', None)
+        if module is None:
+            return None
+
+        classes = page_objects(module)
+        paths = [item.path] + conftest_paths(item.path, self.rootpath)
+        paths += source_modules(module)
+        sources = {self._relative(path): self._source(path) for path in paths}
+
+        urls = {Config.BASE_URL}
+        for cls in classes:
+            urls.update(page_urls(cls))
+        responses = {url: self.responses.get(url) for url in sorted(urls)}
+
+        if None in sources.values() or None in responses.values():
+            return None
+
+        config = {key: getattr(Config, key, None) for key in CONFIG_KEYS}
+        config.update(self.options)
+        return {
+            'sources': sources,
+            'config': _digest(json.dumps(config, sort_keys=True, default=str)),
+            'responses': responses,
+        }
+
+    def fingerprint(self, item):
+        """
+        Fingerprint of a test's inputs
+
+        Returns:
+            str: sha256 hex digest, None if an input could not be read
+        """
+        inputs = self.inputs(item)
+        if inputs is None:
+            return None
+        return _digest(json.dumps([base_nodeid(item.nodeid), inputs], sort_keys=True))
+
+
+class IncrementalStore:
+    """JSON-backed fingerprints of the last pass of each test"""
+
+    def __init__(self, path=None, max_age_hours=None):
+        """
+        Args:
+            path (str): JSON file location, uses config default if None
+            max_age_hours (float): Passes older than this are re-verified
+        """
+        self.path = path or Config.INCREMENTAL_PATH
+        self.max_age = timedelta(hours=Config.INCREMENTAL_MAX_AGE_HOURS
+                                 if max_age_hours is None else max_age_hours)
+        self.passes = {}
+        # Changes made during this session, merged on save (None = forget)
+        self._delta = {}
+
+    def load(self):
+        """Load recorded passes from disk (missing or corrupt file means empty)"""
+        self.passes = self._read()
+        return self
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('passes', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read incremental results: {e}")
+            return {}
+
+    def unchanged_since(self, nodeid, fingerprint, now=None):
+        """
+        When a test last passed with exactly these inputs
+
+        Returns:
+            str: ISO timestamp of the pass, None if the test has to run
+        """
+        entry = self.passes.get(base_nodeid(nodeid))
+        if fingerprint is None or entry is None or entry['fingerprint'] != fingerprint:
+            return None
+        passed_at = datetime.fromisoformat(entry['passed_at'])
+        if (now or datetime.now()) - passed_at > self.max_age:
+            return None
+        return entry['passed_at']
+
+    def record(self, nodeid, outcome, fingerprint):
+        """
+        Record the outcome of a test that ran
+
+        Args:
+            nodeid (str): pytest node id
+            outcome (str): passed or failed
+            fingerprint (str): Input fingerprint the test ran with
+        """
+        nodeid = base_nodeid(nodeid)
+        if outcome == 'passed' and fingerprint:
+            entry = {'fingerprint': fingerprint,
+                     'passed_at': datetime.now().isoformat(timespec='seconds')}
+        else:
+            entry = None
+
+        self._delta[nodeid] = entry
+        if entry is None:
+            self.passes.pop(nodeid, None)
+        else:
+            self.passes[nodeid] = entry
+
+    def save(self):
+        """Apply this session's results to the file on disk and write it"""
+        if not self._delta:
+            return
+        with file_lock(self.path):
+            passes = self._read()
+            for nodeid, entry in self._delta.items():
+                if entry is None:
+                    passes.pop(nodeid, None)
+                else:
+                    passes[nodeid] = entry
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'passes': passes}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+        self.passes = passes
+        self._delta = {}
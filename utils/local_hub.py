@@ -0,0 +1,296 @@
+"""
+Tiny local stand-in for a Selenium Grid hub
+
+Accepts W3C WebDriver sessions on a single endpoint and fans them out over
+locally spawned browser drivers (chromedriver, geckodriver, msedgedriver).
+Lets the ``remote`` driver backend be exercised offline without a real grid.
+
+Usage:
+    python -m utils.local_hub --port 4444 --max-sessions 4
+"""
+import argparse
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.config import Config
+from utils.browsers import get_browser
+
+
+def _start_driver_service(browser_name):
+    """
+    Start a local driver service for the given browser
+
+    Args:
+        browser_name (str): Browser name (chrome, firefox, edge)
+
+    Returns:
+        Service: Started selenium driver service
+    """
+    service = get_browser(browser_name).service()
+    service.start()
+    return service
+
+
+def _requested_browser(payload):
+    """
+    Extract the requested browser from a W3C new session payload
+
+    Args:
+        payload (dict): New session request body
+
+    Returns:
+        str: Browser name (chrome, firefox, edge)
+    """
+    capabilities = payload.get('capabilities', {})
+    candidates = [capabilities.get('alwaysMatch', {})] + capabilities.get('firstMatch', [{}])
+
+    for candidate in candidates:
+        name = (candidate or {}).get('browserName')
+        if name:
+            try:
+                return get_browser(name).name
+            except ValueError:
+                return name.lower()
+
+    return Config.BROWSER
+
+
+class LocalHub:
+    """Routes W3C sessions to locally spawned driver services"""
+
+    PATH_PREFIX = '/wd/hub'
+
+    def __init__(self, host='127.0.0.1', port=None, max_sessions=None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to listen on, uses config default if None
+            max_sessions (int): Concurrent session limit, uses config default if None
+        """
+        self.host = host
+        self.port = Config.LOCAL_HUB_PORT if port is None else port
+        self.max_sessions = max_sessions or Config.LOCAL_HUB_MAX_SESSIONS
+        self.sessions = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_sessions)
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Endpoint to pass as ``REMOTE_URL`` / ``command_executor``"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving in a background thread"""
+        hub = self
+
+        class Handler(_HubRequestHandler):
+            pass
+        Handler.hub = hub
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Pick up the real port when 0 was requested
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and shut down every driver that is still running"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        with self._lock:
+            sessions = list(self.sessions.items())
+            self.sessions.clear()
+
+        for session_id, service in sessions:
+            self._release(service)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def create_session(self, body):
+        """
+        Spawn a driver and forward the new session request to it
+
+        Args:
+            body (bytes): Raw new session request body
+
+        Returns:
+            tuple: (status code, response body bytes)
+        """
+        if not self._slots.acquire(blocking=False):
+            return _w3c_error(500, 'session not created',
+                              f"Local hub is at capacity ({self.max_sessions} sessions)")
+
+        try:
+            browser_name = _requested_browser(json.loads(body or b'{}'))
+            service = _start_driver_service(browser_name)
+        except Exception as e:
+            self._slots.release()
+            return _w3c_error(500, 'session not created', f"Could not start local driver: {e}")
+
+        status, response = _forward(service.service_url, 'POST', '/session', body)
+
+        try:
+            session_id = json.loads(response)['value']['sessionId']
+        except (ValueError, KeyError, TypeError):
+            self._release(service)
+            return status, response
+
+        with self._lock:
+            self.sessions[session_id] = service
+
+        return status, response
+
+    def route(self, method, path, body):
+        """
+        Forward a session command to the driver that owns the session
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path without hub prefix
+            body (bytes): Raw request body
+
+        Returns:
+            tuple: (status code, response body bytes)
+        """
+        parts = path.strip('/').split('/')
+        session_id = parts[1] if len(parts) > 1 else None
+
+        with self._lock:
+            service = self.sessions.get(session_id)
+
+        if service is None:
+            return _w3c_error(404, 'invalid session id', f"Unknown session: {session_id}")
+
+        status, response = _forward(service.service_url, method, path, body)
+
+        # Deleting the session frees the driver and its slot
+        if method == 'DELETE' and len(parts) == 2:
+            with self._lock:
+                self.sessions.pop(session_id, None)
+            self._release(service)
+
+        return status, response
+
+    def status(self):
+        """W3C ``/status`` payload"""
+        with self._lock:
+            active = len(self.sessions)
+
+        return 200, json.dumps({
+            'value': {
+                'ready': active < self.max_sessions,
+                'message': f"Local hub: {active}/{self.max_sessions} sessions in use",
+            }
+        }).encode()
+
+    def _release(self, service):
+        """Stop a driver service and free its slot"""
+        try:
+            service.stop()
+        except Exception as e:
+            print(f"Warning: Issue stopping local driver: {e}")
+        finally:
+            self._slots.release()
+
+
+class _HubRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler translating requests into ``LocalHub`` calls"""
+
+    hub = None
+
+    def _dispatch(self, method):
+        path = self.path
+        if path.startswith(LocalHub.PATH_PREFIX):
+            path = path[len(LocalHub.PATH_PREFIX):] or '/'
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        if path.rstrip('/') == '/status':
+            status, response = self.hub.status()
+        elif path.rstrip('/') == '/session' and method == 'POST':
+            status, response = self.hub.create_session(body)
+        elif path.startswith('/session/'):
+            status, response = self.hub.route(method, path, body)
+        else:
+            status, response = _w3c_error(404, 'unknown command', f"Unknown endpoint: {method} {path}")
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def log_message(self, format, *args):
+        # Keep test output clean
+        pass
+
+
+def _forward(base_url, method, path, body):
+    """Send a request to a driver service and return (status, body)"""
+    request = urllib.request.Request(
+        base_url.rstrip('/') + path,
+        data=body if method == 'POST' else None,
+        method=method,
+        headers={'Content-Type': 'application/json; charset=utf-8'},
+    )
+
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except urllib.error.URLError as e:
+        return _w3c_error(500, 'unknown error', f"Local driver unreachable: {e.reason}")
+
+
+def _w3c_error(status, error, message):
+    """Build a W3C error response"""
+    return status, json.dumps({
+        'value': {'error': error, 'message': message, 'stacktrace': ''}
+    }).encode()
+
+
+def main():
+    """Run the local hub until interrupted"""
+    parser = argparse.ArgumentParser(description="Local stand-in Selenium Grid hub")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=Config.LOCAL_HUB_PORT)
+    parser.add_argument('--max-sessions', type=int, default=Config.LOCAL_HUB_MAX_SESSIONS)
+    args = parser.parse_args()
+
+    hub = LocalHub(args.host, args.port, args.max_sessions).start()
+    print(f"Local hub listening on {hub.url} ({hub.max_sessions} sessions)")
+
+    try:
+        hub._thread.join()
+    except KeyboardInterrupt:
+        print("Stopping local hub")
+    finally:
+        hub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""
+Locator health index persisted across runs
+
+Records, for every locator BasePage resolves, how often it matched, how long
+resolution took and - for fallback chains and compound selectors - which
+alternative actually matched. The index ranks fallback chains so the fastest
+working selector is tried first, and reports locators that never match.
+
+Usage:
+    python -m utils.locator_health            # print report
+    python -m utils.locator_health --min-lookups 3
+"""
+import argparse
+import json
+import os
+from selenium.webdriver.common.by import By
+from config.config import Config
+from utils.file_lock import file_lock
+from utils.retry import locator_key
+
+# Counter fields kept per locator / alternative
+FIELDS = ('lookups', 'hits', 'misses', 'matches', 'time')
+
+
+def split_alternatives(locator):
+    """
+    Split a compound selector into its alternatives
+
+    CSS selector lists (``a, b``) and XPath unions (``//a | //b``) are split at
+    top level only; separators inside brackets, parentheses or quotes are kept.
+
+    Args:
+        locator (tuple): Locator tuple (By.CSS_SELECTOR, 'a, b')
+
+    Returns:
+        list: Locator tuples, a single-item list for simple locators
+    """
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        separator = ','
+    elif by == By.XPATH:
+        separator = '|'
+    else:
+        return [locator]
+
+    parts, depth, quote, current = [], 0, None, ''
+    for char in value:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        current += char
+    parts.append(current.strip())
+
+    return [(by, part) for part in parts if part]
+
+
+def chain_key(locators):
+    """Stable string key for a fallback chain of locators"""
+    return ' || '.join(locator_key(locator) for locator in locators)
+
+
+class LocatorHealthIndex:
+    """JSON-backed statistics for locators, chains and their alternatives"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): JSON file location, uses config default if None
+        """
+        self.path = path or Config.LOCATOR_HEALTH_PATH
+        self.locators = {}
+        # Increments recorded during this session, merged on save
+        self._delta = {}
+
+    def load(self):
+        """Load the index from disk (missing or corrupt file means empty)"""
+        self.locators = self._read()
+        return self
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('locators', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read locator health index: {e}")
+            return {}
+
+    def record(self, key, hit, duration, matches=None):
+        """
+        Record one resolution of a locator
+
+        Args:
+            key (str): Locator key
+            hit (bool): Whether anything matched
+            duration (float): Resolution time in seconds
+            matches (int): Number of matched elements, if known
+        """
+        for store in (self.locators, self._delta):
+            _bump(store.setdefault(key, _empty_entry()), hit, duration, matches)
+
+    def record_chain(self, key, duration, attempts, winner=None):
+        """
+        Record one resolution of a fallback chain and of each alternative tried
+
+        Args:
+            key (str): Chain key
+            duration (float): Resolution time of the whole chain in seconds
+            attempts (dict): Alternative key -> seconds spent probing it
+            winner (str): Key of the alternative that matched, None if none did
+        """
+        for store in (self.locators, self._delta):
+            entry = store.setdefault(key, _empty_entry())
+            _bump(entry, winner is not None, duration, None)
+            for alternative, seconds in attempts.items():
+                alt_entry = entry['alternatives'].setdefault(alternative, _empty_counters())
+                _bump(alt_entry, alternative == winner, seconds, None)
+
+    def record_alternatives(self, key, counts):
+        """
+        Record per-alternative match counts of a compound selector
+
+        Args:
+            key (str): Compound locator key
+            counts (dict): Alternative key -> number of matched elements
+        """
+        for store in (self.locators, self._delta):
+            entry = store.setdefault(key, _empty_entry())
+            for alternative, count in counts.items():
+                alt_entry = entry['alternatives'].setdefault(alternative, _empty_counters())
+                _bump(alt_entry, count > 0, 0.0, count)
+
+    def stats(self, key):
+        """Counters for a key, None if never seen"""
+        return self.locators.get(key)
+
+    def rank(self, locators, min_lookups=None):
+        """
+        Order a fallback chain: undecided alternatives first (in declared
+        order), then working ones (fastest first), then dead ones.
+
+        An alternative is undecided until it has matched once or missed as
+        often as the dead-locator report requires. Trying those first costs a
+        few lookups per alternative, and in return every alternative gets its
+        own timing and a broken primary is reported as dead before it is
+        demoted behind the working ones.
+
+        Args:
+            locators (tuple): Locator tuples in declared order
+            min_lookups (int): Misses before an alternative counts as dead
+
+        Returns:
+            list: Locator tuples in promoted order
+        """
+        min_lookups = Config.LOCATOR_DEAD_MIN_LOOKUPS if min_lookups is None else min_lookups
+        chain = self.locators.get(chain_key(locators), {}).get('alternatives', {})
+
+        def sort_key(locator):
+            entry = chain.get(locator_key(locator)) or _empty_counters()
+            if entry['hits']:
+                return (1, entry['time'] / entry['lookups'])
+            if entry['lookups'] >= min_lookups:
+                return (2, 0.0)
+            return (0, 0.0)
+
+        return sorted(locators, key=sort_key)
+
+    def dead_locators(self, min_lookups=None):
+        """
+        Locators (and alternatives) that have never matched
+
+        Args:
+            min_lookups (int): Lookups required before a locator counts as dead
+
+        Returns:
+            list: Keys of dead locators and 'locator >> alternative' entries
+        """
+        min_lookups = Config.LOCATOR_DEAD_MIN_LOOKUPS if min_lookups is None else min_lookups
+        dead = []
+        for key, entry in sorted(self.locators.items()):
+            if entry['lookups'] >= min_lookups and not entry['hits']:
+                dead.append(key)
+            for alternative, alt_entry in sorted(entry['alternatives'].items()):
+                if alt_entry['lookups'] >= min_lookups and not alt_entry['hits']:
+                    dead.append(f"{key} >> {alternative}")
+        return dead
+
+    def slowest(self, limit=10):
+        """Keys with the highest average resolution time"""
+        timed = [(entry['time'] / entry['lookups'], key)
+                 for key, entry in self.locators.items() if entry['lookups']]
+        return sorted(timed, reverse=True)[:limit]
+
+    def save(self):
+        """Merge this session's increments into the file on disk and write it"""
+        with file_lock(self.path):
+            locators = self._read()
+
+            for key, delta in self._delta.items():
+                entry = locators.setdefault(key, _empty_entry())
+                _merge(entry, delta)
+                for alternative, alt_delta in delta['alternatives'].items():
+                    _merge(entry['alternatives'].setdefault(alternative, _empty_counters()), alt_delta)
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'locators': locators}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+        self.locators = locators
+        self._delta = {}
+
+    def report_lines(self, min_lookups=None):
+        """Human-readable report of dead and slow locators"""
+        lines = []
+        dead = self.dead_locators(min_lookups)
+        lines.append(f"Dead locators ({len(dead)}):")
+        lines.extend(f"  {key}" for key in dead)
+        lines.append("Slowest locators (avg resolution):")
+        lines.extend(f"  {avg * 1000:8.1f} ms  {key}" for avg, key in self.slowest())
+        return lines
+
+
+def _empty_counters():
+    return {field: 0 for field in FIELDS}
+
+
+def _empty_entry():
+    entry = _empty_counters()
+    entry['alternatives'] = {}
+    return entry
+
+
+def _bump(entry, hit, duration, matches):
+    entry['lookups'] += 1
+    entry['hits' if hit else 'misses'] += 1
+    entry['time'] += duration
+    if matches:
+        entry['matches'] += matches
+
+
+def _merge(entry, delta):
+    for field in FIELDS:
+        entry[field] = entry.get(field, 0) + delta.get(field, 0)
+
+
+def main():
+    """Print the locator health report"""
+    parser = argparse.ArgumentParser(description="Locator health report")
+    parser.add_argument('--path', default=Config.LOCATOR_HEALTH_PATH)
+    parser.add_argument('--min-lookups', type=int, default=Config.LOCATOR_DEAD_MIN_LOOKUPS)
+    args = parser.parse_args()
+
+    index = LocatorHealthIndex(args.path).load()
+    for line in index.report_lines(args.min_lookups):
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
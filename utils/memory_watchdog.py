@@ -0,0 +1,208 @@
+"""
+Browser memory watchdog for long-lived and pooled sessions
+
+Samples the browser process tree's resident memory (via psutil, when
+installed, for local drivers) and the page's JS heap (CDP
+``Runtime.getHeapUsage`` on Chromium, ``performance.memory`` otherwise)
+between tests. A browser is flagged for recycling when it crosses the RSS or
+heap limits, or when its RSS grows too far past its first sample or shows a
+steady upward trend over the last samples (a leak), so long runs keep a
+stable speed instead of degrading as the browser swaps. The JS heap belongs
+to whatever page the test ended on, so it is only held to its absolute
+limit: a drop or jump between two tests says more about the pages than
+about the browser.
+"""
+import time
+import weakref
+from config.config import Config
+
+MB = 1024 * 1024
+
+HEAP_SCRIPT = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+class MemorySample:
+    """Memory of one browser at one point in time (bytes, None if unavailable)"""
+
+    def __init__(self, rss=None, heap=None):
+        self.rss = rss
+        self.heap = heap
+        self.at = time.time()
+
+    def as_dict(self):
+        """Sample in MB for reports"""
+        return {
+            'rss_mb': None if self.rss is None else round(self.rss / MB, 1),
+            'heap_mb': None if self.heap is None else round(self.heap / MB, 1),
+        }
+
+
+def browser_rss(driver):
+    """
+    Resident memory of a local browser's process tree (driver service and children)
+
+    Returns:
+        int: Bytes, None for remote drivers or without psutil
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None:
+        return None
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    try:
+        root = psutil.Process(process.pid)
+        total = 0
+        for proc in [root] + root.children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def js_heap(driver):
+    """
+    Used JS heap of the current page
+
+    Returns:
+        int: Bytes, None if the browser exposes neither CDP nor performance.memory
+    """
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            return int(driver.execute_cdp_cmd('Runtime.getHeapUsage', {})['usedSize'])
+        except Exception:
+            pass
+    try:
+        heap = driver.execute_script(HEAP_SCRIPT)
+    except Exception:
+        return None
+    return int(heap) if heap else None
+
+
+def trend(values):
+    """Least-squares slope of a series, per sample"""
+    count = len(values)
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(count))
+    return numerator / denominator if denominator else 0.0
+
+
+class MemoryWatchdog:
+    """Keeps per-browser memory history and decides when a browser should be recycled"""
+
+    def __init__(self, max_rss_mb=None, max_heap_mb=None, max_growth=None,
+                 leak_slope_mb=None, leak_window=None):
+        """
+        Args:
+            max_rss_mb (float): Browser process tree RSS limit
+            max_heap_mb (float): JS heap limit
+            max_growth (float): Limit on RSS relative to the browser's first sample
+            leak_slope_mb (float): RSS growth per sample, sustained over the window, that counts as a leak
+            leak_window (int): Number of recent samples the leak trend is fitted on
+        Every limit uses its config default if None.
+        """
+        self.max_rss = (Config.MEMORY_MAX_RSS_MB if max_rss_mb is None else max_rss_mb) * MB
+        self.max_heap = (Config.MEMORY_MAX_HEAP_MB if max_heap_mb is None else max_heap_mb) * MB
+        self.max_growth = Config.MEMORY_MAX_GROWTH if max_growth is None else max_growth
+        self.leak_slope = (Config.MEMORY_LEAK_SLOPE_MB if leak_slope_mb is None else leak_slope_mb) * MB
+        self.leak_window = Config.MEMORY_LEAK_WINDOW if leak_window is None else leak_window
+        # Drivers are weakly referenced: quitting and dropping one forgets its history
+        self._history = weakref.WeakKeyDictionary()
+
+    def sample(self, driver):
+        """
+        Measure a browser and add the sample to its history
+
+        Returns:
+            MemorySample: The new sample
+        """
+        sample = MemorySample(rss=browser_rss(driver), heap=js_heap(driver))
+        history = self._history.setdefault(driver, [])
+        history.append(sample)
+        # Keep the first sample (growth baseline) and the leak window
+        if len(history) > self.leak_window + 1:
+            del history[1:len(history) - self.leak_window]
+        return sample
+
+    def verdict(self, driver):
+        """
+        Why the browser should be recycled, judged on its samples so far
+
+        Returns:
+            str: Reason, None if the browser can stay
+        """
+        history = self._history.get(driver)
+        if not history:
+            return None
+
+        latest = history[-1]
+        if latest.rss is not None and latest.rss > self.max_rss:
+            return f"RSS {latest.rss / MB:.0f} MB over {self.max_rss / MB:g} MB"
+        if latest.heap is not None and latest.heap > self.max_heap:
+            return f"JS heap {latest.heap / MB:.0f} MB over {self.max_heap / MB:g} MB"
+
+        # Growth and trend on RSS only: the heap is the current page's, not the browser's
+        first, last = history[0].rss, latest.rss
+        if first and last and last > first * self.max_growth:
+            return f"RSS grew {last / first:.1f}x since start"
+
+        recent = [s.rss for s in history[-self.leak_window:]]
+        if len(recent) >= self.leak_window and None not in recent:
+            slope = trend(recent)
+            if slope >= self.leak_slope:
+                return f"RSS leaking {slope / MB:.1f} MB per test over {len(recent)} tests"
+        return None
+
+    def check(self, driver):
+        """
+        Sample a browser and judge it
+
+        Returns:
+            tuple: (MemorySample, recycle reason or None)
+        """
+        sample = self.sample(driver)
+        return sample, self.verdict(driver)
+
+    def forget(self, driver):
+        """Drop a browser's history (it was quit)"""
+        self._history.pop(driver, None)
+
+
+class MemoryReport:
+    """Per-test browser memory of a session, for the summary and reports/memory.json"""
+
+    def __init__(self):
+        self.tests = {}
+
+    def add(self, nodeid, memory):
+        """Record the memory sampled after a test (dict from the report)"""
+        if memory:
+            self.tests[nodeid] = memory
+
+    def flagged(self):
+        """Tests after which the watchdog flagged the browser: (nodeid, reason) pairs"""
+        return [(nodeid, memory['verdict']) for nodeid, memory in self.tests.items()
+                if memory.get('verdict')]
+
+    def largest(self, key='heap_mb', limit=5):
+        """Tests with the largest memory by key, largest first"""
+        measured = [(nodeid, memory) for nodeid, memory in self.tests.items()
+                    if memory.get(key) is not None]
+        return sorted(measured, key=lambda entry: -entry[1][key])[:limit]
+
+    def save(self, path=None):
+        """Write the per-test samples as JSON"""
+        import json
+        import os
+        path = path or Config.MEMORY_REPORT_PATH
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'tests': self.tests}, f, indent=2, sort_keys=True)
+        return path
@@ -0,0 +1,403 @@
+"""
+Synthetic monitoring: the smoke flows on an interval, served as Prometheus metrics
+
+A long-running process keeps two warm browsers - an anonymous one for the
+public/login/logout flows and an authenticated one for the dashboard - and
+runs the smoke flows every MONITOR_INTERVAL seconds (with jitter so several
+monitors don't hit the site in lockstep). Latency and success are exposed in
+Prometheus text format on ``/metrics``. Browsers are replaced after a failed
+flow (unknown state) and when the memory watchdog flags them (see
+utils/memory_watchdog.py).
+
+Usage:
+    python -m utils.monitor --interval 300 --port 9108 --headless
+"""
+import argparse
+import random
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.config import Config
+from utils.driver_manager import DriverManager
+
+# Histogram buckets of flow durations in seconds
+DURATION_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60)
+
+METRIC_PREFIX = 'mathsteam_monitor'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())) + '}'
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MonitorMetrics:
+    """Thread-safe counters, gauges and duration histograms in Prometheus text format"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checks = {}
+        self.up = {}
+        self.last_run = {}
+        self.durations = {}
+        self.recycles = {}
+        self.heap = {}
+        self.rss = {}
+        self.cycles = 0
+
+    def record_check(self, flow, success, seconds):
+        """Record one run of a flow"""
+        with self._lock:
+            key = (flow, 'success' if success else 'failure')
+            self.checks[key] = self.checks.get(key, 0) + 1
+            self.up[flow] = 1 if success else 0
+            self.last_run[flow] = time.time()
+
+            histogram = self.durations.setdefault(
+                flow, {'buckets': [0] * len(DURATION_BUCKETS), 'sum': 0.0, 'count': 0})
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    histogram['buckets'][index] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+
+    def record_recycle(self, session, reason):
+        """Record a browser being replaced"""
+        with self._lock:
+            key = (session, reason)
+            self.recycles[key] = self.recycles.get(key, 0) + 1
+
+    def record_memory(self, session, sample):
+        """Record the latest JS heap and process RSS of a browser (MemorySample)"""
+        with self._lock:
+            if sample.heap is not None:
+                self.heap[session] = sample.heap
+            if sample.rss is not None:
+                self.rss[session] = sample.rss
+
+    def record_cycle(self):
+        """Record a completed monitoring cycle"""
+        with self._lock:
+            self.cycles += 1
+
+    def render(self):
+        """
+        Metrics in Prometheus text exposition format (version 0.0.4)
+
+        Returns:
+            str: Exposition text
+        """
+        p = METRIC_PREFIX
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{p}_{name}{suffix}{_labels(labels)} {_number(value)}")
+
+        with self._lock:
+            family('checks_total', 'counter', 'Synthetic flow runs by result',
+                   [('', {'flow': flow, 'result': result}, count)
+                    for (flow, result), count in sorted(self.checks.items())])
+            family('check_up', 'gauge', 'Whether the last run of the flow succeeded',
+                   [('', {'flow': flow}, value) for flow, value in sorted(self.up.items())])
+            family('last_check_timestamp_seconds', 'gauge', 'Unix time of the last run of the flow',
+                   [('', {'flow': flow}, round(value, 3))
+                    for flow, value in sorted(self.last_run.items())])
+
+            samples = []
+            for flow, histogram in sorted(self.durations.items()):
+                for bound, count in zip(DURATION_BUCKETS, histogram['buckets']):
+                    samples.append(('_bucket', {'flow': flow, 'le': _number(float(bound))}, count))
+                samples.append(('_bucket', {'flow': flow, 'le': '+Inf'}, histogram['count']))
+                samples.append(('_sum', {'flow': flow}, round(histogram['sum'], 6)))
+                samples.append(('_count', {'flow': flow}, histogram['count']))
+            family('check_duration_seconds', 'histogram', 'Duration of synthetic flow runs', samples)
+
+            family('browser_recycles_total', 'counter', 'Warm browsers replaced, by reason',
+                   [('', {'session': session, 'reason': reason}, count)
+                    for (session, reason), count in sorted(self.recycles.items())])
+            family('browser_js_heap_bytes', 'gauge', 'Used JS heap of the warm browser',
+                   [('', {'session': session}, value) for session, value in sorted(self.heap.items())])
+            family('browser_rss_bytes', 'gauge', 'Resident memory of the warm browser process tree',
+                   [('', {'session': session}, value) for session, value in sorted(self.rss.items())])
+            family('cycles_total', 'counter', 'Completed monitoring cycles', [('', {}, self.cycles)])
+
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serves ``/metrics`` from a MonitorMetrics in a background thread"""
+
+    def __init__(self, metrics, host='0.0.0.0', port=None):
+        """
+        Args:
+            metrics (MonitorMetrics): Metrics to expose
+            host (str): Interface to bind
+            port (int): Port to listen on, uses config default if None
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = Config.MONITOR_PORT if port is None else port
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Scrape URL"""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self):
+        """Start serving in a background thread"""
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class WarmBrowser:
+    """A browser kept running between monitoring cycles"""
+
+    def __init__(self, name, metrics, driver_manager=None):
+        """
+        Args:
+            name (str): Session label (anonymous, authenticated)
+            metrics (MonitorMetrics): Where recycles and memory samples are recorded
+            driver_manager (DriverManager): Manager starting the browser, new one if None
+        """
+        self.name = name
+        self.metrics = metrics
+        self.manager = driver_manager or DriverManager()
+        self.driver = None
+
+    def get(self):
+        """The warm driver, started on first use or after a recycle"""
+        if self.driver is None:
+            self.driver = self.manager.get_driver()
+        return self.driver
+
+    def recycle(self, reason):
+        """Quit the browser; the next ``get`` starts a fresh one"""
+        if self.driver is None:
+            return
+        self.manager.driver = self.driver
+        self.manager.quit_driver()
+        self.driver = None
+        self.metrics.record_recycle(self.name, reason)
+        print(f"monitor: recycled {self.name} browser ({reason})")
+
+    def check_memory(self):
+        """
+        Sample the browser's memory and recycle it when the watchdog flags it
+
+        Returns:
+            str: Recycle reason, None if the browser stays
+        """
+        if self.driver is None:
+            return None
+        sample, reason = self.manager.watchdog.check(self.driver)
+        self.metrics.record_memory(self.name, sample)
+        if reason:
+            self.recycle('memory')
+        return reason
+
+
+class SyntheticMonitor:
+    """Runs the smoke flows on warm browsers on an interval"""
+
+    def __init__(self, metrics=None, interval=None, jitter=None, email=None, password=None):
+        """
+        Args:
+            metrics (MonitorMetrics): Metrics sink, new one if None
+            interval (float): Seconds between cycles, uses config default if None
+            jitter (float): Random +/- fraction applied to each interval
+            email (str): Login email, uses config default if None
+            password (str): Login password, uses config default if None
+        """
+        self.metrics = metrics or MonitorMetrics()
+        self.interval = Config.MONITOR_INTERVAL if interval is None else interval
+        self.jitter = Config.MONITOR_JITTER if jitter is None else jitter
+        self.email = email or Config.LOGIN_EMAIL
+        self.password = password or Config.LOGIN_PASSWORD
+        self.browsers = {
+            'anonymous': WarmBrowser('anonymous', self.metrics),
+            'authenticated': WarmBrowser('authenticated', self.metrics),
+        }
+        self.stop_event = threading.Event()
+        self._random = random.Random()
+
+    @property
+    def flows(self):
+        """Smoke flows in run order: (name, browser, callable)"""
+        return (
+            ('website_accessibility', 'anonymous', self.website_accessibility),
+            ('valid_login', 'anonymous', self.valid_login),
+            ('logout_functionality', 'anonymous', self.logout_functionality),
+            ('dashboard_accessibility_after_login', 'authenticated',
+             self.dashboard_accessibility_after_login),
+        )
+
+    def website_accessibility(self, driver):
+        """Home page loads with a title (test_website_accessibility)"""
+        from pages import smoke_flows
+        smoke_flows.website_accessibility(driver)
+
+    def valid_login(self, driver):
+        """Login with valid credentials from a clean session (test_valid_login)"""
+        # The warm browser may still hold a session from the previous cycle
+        driver.delete_all_cookies()
+        from pages import smoke_flows
+        smoke_flows.valid_login(driver, self.email, self.password)
+
+    def logout_functionality(self, driver):
+        """Logout from the session valid_login opened (test_logout_functionality)"""
+        from pages import smoke_flows
+        assert smoke_flows.logout_functionality(driver), "Logout control not found"
+
+    def dashboard_accessibility_after_login(self, driver):
+        """Dashboard loads in the warm authenticated session (test_dashboard_accessibility_after_login)"""
+        # First run or an expired session logs in once, then the session stays warm
+        from pages import smoke_flows
+        smoke_flows.dashboard_accessibility_after_login(driver, self.email, self.password, relogin=True)
+
+    def run_cycle(self):
+        """
+        Run every flow once
+
+        Returns:
+            dict: Flow name -> True if it succeeded
+        """
+        results = {}
+        for name, browser_name, flow in self.flows:
+            browser = self.browsers[browser_name]
+            start = time.perf_counter()
+            try:
+                flow(browser.get())
+                success = True
+            except Exception as e:
+                success = False
+                print(f"monitor: {name} failed: {e.__class__.__name__}: {e}")
+            self.metrics.record_check(name, success, time.perf_counter() - start)
+            results[name] = success
+            if not success:
+                # Unknown state (half logged in, crashed renderer): start over next time
+                browser.recycle('failure')
+
+        for browser in self.browsers.values():
+            reason = browser.check_memory()
+            if reason:
+                print(f"monitor: {browser.name} browser {reason}")
+        self.metrics.record_cycle()
+        return results
+
+    def next_delay(self):
+        """Seconds until the next cycle: the interval with random jitter applied"""
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + self._random.uniform(-spread, spread))
+
+    def run_forever(self, cycles=None):
+        """
+        Run cycles until stopped (or ``cycles`` have run)
+
+        Args:
+            cycles (int): Number of cycles, None for no limit
+        """
+        completed = 0
+        try:
+            while not self.stop_event.is_set():
+                results = self.run_cycle()
+                completed += 1
+                passed = sum(results.values())
+                print(f"monitor: cycle {completed}: {passed}/{len(results)} flows passed")
+                if cycles is not None and completed >= cycles:
+                    break
+                self.stop_event.wait(self.next_delay())
+        finally:
+            self.close()
+
+    def stop(self, *args):
+        """Stop after the current flow (usable as a signal handler)"""
+        self.stop_event.set()
+
+    def close(self):
+        """Quit the warm browsers"""
+        for browser in self.browsers.values():
+            if browser.driver is not None:
+                browser.manager.driver = browser.driver
+                browser.manager.quit_driver()
+                browser.driver = None
+
+
+def main():
+    """Run the synthetic monitor until interrupted"""
+    parser = argparse.ArgumentParser(description="Synthetic monitoring of the MathsTeam smoke flows")
+    parser.add_argument('--interval', type=float, default=Config.MONITOR_INTERVAL,
+                        help="Seconds between cycles")
+    parser.add_argument('--jitter', type=float, default=Config.MONITOR_JITTER,
+                        help="Random +/- fraction applied to each interval")
+    parser.add_argument('--host', default='0.0.0.0', help="Metrics interface to bind")
+    parser.add_argument('--port', type=int, default=Config.MONITOR_PORT, help="Metrics port")
+    parser.add_argument('--base-url', default=Config.BASE_URL)
+    parser.add_argument('--headless', action='store_true', default=Config.HEADLESS)
+    parser.add_argument('--cycles', type=int, default=None, help="Stop after this many cycles")
+    args = parser.parse_args()
+
+    # Page objects are imported by the flows, after this: their URLs are derived from BASE_URL
+    Config.HEADLESS = args.headless
+    Config.BASE_URL = args.base_url
+
+    monitor = SyntheticMonitor(interval=args.interval, jitter=args.jitter)
+    server = MetricsServer(monitor.metrics, args.host, args.port).start()
+    signal.signal(signal.SIGTERM, monitor.stop)
+    print(f"monitor: metrics on {server.url}, every {args.interval:g}s +/-{args.jitter:.0%}")
+
+    try:
+        monitor.run_forever(args.cycles)
+    except KeyboardInterrupt:
+        print("monitor: stopping")
+    finally:
+        monitor.close()
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+Named network condition profiles (throttled 3G/4G, high latency, offline)
+
+A profile is applied to a Chrome/Edge page through CDP
+``Network.emulateNetworkConditions`` and ``Emulation.setCPUThrottlingRate``,
+selected per test with ``@pytest.mark.network_profile("slow-3g")`` or for
+the whole run with ``--network-profile``. Test timings are kept per profile
+in ``ProfileTimings`` so runs under different profiles can be compared.
+
+Register another profile with ``register_profile``.
+"""
+import json
+import os
+from datetime import datetime
+from config.config import Config
+from utils.file_lock import file_lock
+
+# Navigation timing of the page the test ended on (ms from navigation start)
+PAGE_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+return nav ? {ttfb_ms: nav.responseStart, dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+              load_ms: nav.loadEventEnd} : null;
+"""
+
+# Unthrottled runs are recorded under this name, as the comparison baseline
+BASELINE = 'none'
+
+
+class NetworkProfile:
+    """Network and CPU conditions emulated for a test"""
+
+    def __init__(self, name, latency_ms=0, download_kbps=None, upload_kbps=None,
+                 offline=False, cpu_slowdown=1, wait_scale=1.0):
+        """
+        Args:
+            name (str): Profile name used by the marker and --network-profile
+            latency_ms (float): Added round-trip latency
+            download_kbps (float): Download bandwidth in kbit/s, None for unlimited
+            upload_kbps (float): Upload bandwidth in kbit/s, None for unlimited
+            offline (bool): Emulate a lost connection
+            cpu_slowdown (float): CPU throttling factor (1 = no throttling)
+            wait_scale (float): Multiplier on wait budgets while the profile is active
+        """
+        self.name = name
+        self.latency_ms = latency_ms
+        self.download_kbps = download_kbps
+        self.upload_kbps = upload_kbps
+        self.offline = offline
+        self.cpu_slowdown = cpu_slowdown
+        self.wait_scale = wait_scale
+
+    def conditions(self):
+        """Parameters of Network.emulateNetworkConditions (throughput in bytes/s, -1 = unlimited)"""
+        def throughput(kbps):
+            return -1 if kbps is None else kbps * 1000 / 8
+
+        return {
+            'offline': self.offline,
+            'latency': self.latency_ms,
+            'downloadThroughput': throughput(self.download_kbps),
+            'uploadThroughput': throughput(self.upload_kbps),
+        }
+
+    def apply(self, driver):
+        """Throttle the driver's current page"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', self.conditions())
+        driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': self.cpu_slowdown})
+
+    @staticmethod
+    def clear(driver):
+        """Remove throttling from the driver's current page"""
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+            'offline': False, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1,
+        })
+        driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': 1})
+
+    @staticmethod
+    def supported(driver):
+        """True if the driver can issue CDP commands (local Chrome/Edge)"""
+        return hasattr(driver, 'execute_cdp_cmd')
+
+
+PROFILES = {}
+
+
+def register_profile(profile):
+    """Make a network profile available under its name"""
+    PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name):
+    """
+    Look up a network profile
+
+    Args:
+        name (str): Profile name (case insensitive)
+
+    Returns:
+        NetworkProfile: Registered profile
+
+    Raises:
+        ValueError: If no profile is registered under that name
+    """
+    profile = PROFILES.get((name or '').lower())
+    if profile is None:
+        raise ValueError(f"Unknown network profile: {name} (known: {', '.join(PROFILES)})")
+    return profile
+
+
+# Presets after Chrome DevTools / Lighthouse throttling
+register_profile(NetworkProfile('slow-3g', latency_ms=2000, download_kbps=400, upload_kbps=400,
+                                cpu_slowdown=6, wait_scale=3.0))
+register_profile(NetworkProfile('fast-3g', latency_ms=563, download_kbps=1440, upload_kbps=675,
+                                cpu_slowdown=4, wait_scale=2.0))
+register_profile(NetworkProfile('slow-4g', latency_ms=150, download_kbps=1600, upload_kbps=750,
+                                cpu_slowdown=4, wait_scale=1.5))
+register_profile(NetworkProfile('fast-4g', latency_ms=60, download_kbps=9000, upload_kbps=1500,
+                                cpu_slowdown=2, wait_scale=1.2))
+register_profile(NetworkProfile('high-latency', latency_ms=500, wait_scale=1.5))
+register_profile(NetworkProfile('offline', offline=True))
+
+
+class ProfileTimings:
+    """JSON-backed per-profile test timings, for comparing runs under different conditions"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): JSON file location, uses config default if None
+        """
+        self.path = path or Config.NETWORK_PROFILE_TIMINGS_PATH
+        self.timings = {}
+        # Measurements of this session, merged on save
+        self._session = {}
+
+    def load(self):
+        """Load timings from disk (missing or corrupt file means empty)"""
+        self.timings = self._read()
+        return self
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('profiles', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read network profile timings: {e}")
+            return {}
+
+    def update(self, profile, nodeid, values):
+        """
+        Add measurements of a test run under a profile
+
+        Args:
+            profile (str): Profile name, BASELINE for unthrottled runs
+            nodeid (str): Test node id
+            values (dict): Metrics, e.g. duration (s) or the page timing (ms)
+        """
+        values = {key: value for key, value in values.items() if value is not None}
+        if not values:
+            return
+        for timings in (self.timings, self._session):
+            timings.setdefault(profile, {}).setdefault(nodeid, {}).update(values)
+
+    def session_profiles(self):
+        """Throttled profiles measured in this session"""
+        return sorted(name for name in self._session if name != BASELINE)
+
+    def summary(self, profile):
+        """
+        Mean timings of a profile in this session and its slowdown against unthrottled runs
+
+        Returns:
+            dict: tests, mean duration (s), mean load_ms, slowdown (duration ratio
+            over tests also measured unthrottled, None without baseline)
+        """
+        tests = self._session.get(profile, {})
+        durations = [entry['duration'] for entry in tests.values() if 'duration' in entry]
+        loads = [entry['load_ms'] for entry in tests.values() if entry.get('load_ms')]
+        baseline = self.timings.get(BASELINE, {})
+        ratios = [entry['duration'] / baseline[nodeid]['duration']
+                  for nodeid, entry in tests.items()
+                  if 'duration' in entry and baseline.get(nodeid, {}).get('duration')]
+        return {
+            'tests': len(tests),
+            'duration': sum(durations) / len(durations) if durations else None,
+            'load_ms': sum(loads) / len(loads) if loads else None,
+            'slowdown': sum(ratios) / len(ratios) if ratios else None,
+        }
+
+    def save(self):
+        """Merge this session's timings into the file (other workers may have saved)"""
+        if not self._session:
+            return
+        with file_lock(self.path):
+            merged = self._read()
+            for profile, tests in self._session.items():
+                for nodeid, values in tests.items():
+                    merged.setdefault(profile, {}).setdefault(nodeid, {}).update(values)
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated': datetime.now().isoformat(timespec='seconds'),
+                           'profiles': merged}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        self.timings = merged
@@ -0,0 +1,341 @@
+"""
+Network trace of a test from the browser's CDP Network events
+
+Chrome/Edge are started with performance logging (``goog:loggingPrefs`` /
+``ms:loggingPrefs``), which makes the driver buffer the ``Network.*`` DevTools
+events of the session. ``NetworkRecorder`` drains that log after a test and
+rebuilds every request: URL, status, transfer size, DNS/connect/SSL/TTFB/
+download timings, initiator and cache hits. A test's requests become a
+compact HAR 1.2 file (no headers or bodies) when it fails or breaks the
+network budget, and a session-wide ``NetworkReport`` ranks the heaviest and
+slowest resources.
+"""
+import json
+import os
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+from config.config import Config
+
+# Capability enabling the performance (DevTools events) log, per browser
+LOGGING_CAPABILITIES = {
+    'chrome': 'goog:loggingPrefs',
+    'edge': 'ms:loggingPrefs',
+}
+
+
+def enable(options, browser_name):
+    """
+    Turn on the performance log in browser options
+
+    Returns:
+        bool: True if the browser supports network tracing
+    """
+    capability = LOGGING_CAPABILITIES.get(browser_name)
+    if capability is None:
+        return False
+    options.set_capability(capability, {'performance': 'ALL'})
+    return True
+
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat(timespec='milliseconds')
+
+
+def _span(timing, start, end):
+    """Milliseconds between two ResourceTiming marks, -1 if the phase didn't happen"""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return -1
+    return round(timing[end] - timing[start], 3)
+
+
+def resource_key(url):
+    """URL without query string or fragment, so cache-busted assets group together"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class NetworkRecorder:
+    """Rebuilds requests from a driver's performance log"""
+
+    def __init__(self, driver):
+        """
+        Args:
+            driver (WebDriver): Chrome/Edge driver started with performance logging
+        """
+        self.driver = driver
+        self.requests = {}
+        self.finished = []
+
+    @staticmethod
+    def supported(driver):
+        """True if the driver has the performance log enabled (local Chrome/Edge)"""
+        if not hasattr(driver, 'get_log'):
+            return False
+        try:
+            return 'performance' in driver.log_types
+        except Exception:
+            return False
+
+    def reset(self):
+        """Drop everything logged so far (earlier tests on a reused browser)"""
+        self.drain()
+        self.requests.clear()
+        self.finished.clear()
+
+    def drain(self):
+        """Read the buffered DevTools events from the driver"""
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method', '')
+            if method.startswith('Network.'):
+                self._handle(method, message.get('params', {}))
+
+    def _handle(self, method, params):
+        request_id = params.get('requestId')
+
+        if method == 'Network.requestWillBeSent':
+            previous = self.requests.pop(request_id, None)
+            if previous is not None and params.get('redirectResponse'):
+                # Same id continues after a redirect: close the hop
+                previous['response'] = params['redirectResponse']
+                previous['end'] = params['timestamp']
+                self.finished.append(previous)
+            self.requests[request_id] = {
+                'url': params['request']['url'],
+                'method': params['request'].get('method', 'GET'),
+                'type': params.get('type', 'Other'),
+                'initiator': params.get('initiator', {}),
+                'start': params['timestamp'],
+                'wall_time': params.get('wallTime'),
+                'response': None,
+                'cache': None,
+            }
+            return
+
+        record = self.requests.get(request_id)
+        if record is None:
+            return
+
+        if method == 'Network.responseReceived':
+            record['response'] = params['response']
+            record['type'] = params.get('type', record['type'])
+        elif method == 'Network.requestServedFromCache':
+            record['cache'] = 'memory'
+        elif method == 'Network.dataReceived':
+            record['data'] = record.get('data', 0) + params.get('dataLength', 0)
+        elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+            record['end'] = params['timestamp']
+            record['transfer'] = params.get('encodedDataLength')
+            record['error'] = params.get('errorText')
+            self.finished.append(self.requests.pop(request_id))
+
+    def entries(self):
+        """
+        Drain the log and return the finished requests as HAR entries
+
+        Returns:
+            list: HAR 1.2 entry dicts, in start order
+        """
+        self.drain()
+        return [self._entry(record) for record in sorted(self.finished, key=lambda r: r['start'])]
+
+    @staticmethod
+    def _cache(record, response):
+        if record['cache']:
+            return record['cache']
+        if response.get('fromDiskCache') or response.get('fromPrefetchCache'):
+            return 'disk'
+        if response.get('fromServiceWorker'):
+            return 'service-worker'
+        if response.get('status') == 304:
+            return 'revalidated'
+        return None
+
+    def _entry(self, record):
+        response = record['response'] or {}
+        timing = response.get('timing') or {}
+        total = max((record.get('end', record['start']) - record['start']) * 1000, 0)
+
+        timings = {'blocked': -1, 'dns': -1, 'connect': -1, 'ssl': -1,
+                   'send': 0, 'wait': 0, 'receive': 0}
+        if timing:
+            # ResourceTiming marks are ms offsets from requestTime (seconds)
+            offset = (timing['requestTime'] - record['start']) * 1000
+            first = next((timing[mark] for mark in ('dnsStart', 'connectStart', 'sendStart')
+                          if timing.get(mark, -1) >= 0), 0)
+            timings.update(
+                blocked=round(offset + first, 3),
+                dns=_span(timing, 'dnsStart', 'dnsEnd'),
+                connect=_span(timing, 'connectStart', 'connectEnd'),
+                ssl=_span(timing, 'sslStart', 'sslEnd'),
+                send=max(_span(timing, 'sendStart', 'sendEnd'), 0),
+                wait=max(_span(timing, 'sendEnd', 'receiveHeadersEnd'), 0),
+            )
+            headers_end = offset + timing.get('receiveHeadersEnd', 0)
+            timings['receive'] = round(max(total - headers_end, 0), 3)
+        else:
+            # Memory cache and data: URLs carry no timing
+            timings['wait'] = round(total, 3)
+
+        transfer = record.get('transfer')
+        if transfer is None:
+            transfer = response.get('encodedDataLength', 0)
+        initiator = record['initiator']
+        return {
+            'startedDateTime': _iso(record['wall_time']) if record['wall_time'] else None,
+            'time': round(total, 3),
+            'request': {
+                'method': record['method'],
+                'url': record['url'],
+                'httpVersion': response.get('protocol', ''),
+                'headers': [], 'queryString': [], 'cookies': [],
+                'headersSize': -1, 'bodySize': -1,
+            },
+            'response': {
+                'status': response.get('status', 0),
+                'statusText': response.get('statusText', record.get('error') or ''),
+                'httpVersion': response.get('protocol', ''),
+                'headers': [], 'cookies': [],
+                'content': {'size': record.get('data', 0), 'mimeType': response.get('mimeType', '')},
+                'redirectURL': '',
+                'headersSize': -1,
+                'bodySize': transfer,
+            },
+            'cache': {},
+            'timings': timings,
+            '_resourceType': record['type'],
+            '_initiator': initiator.get('url') or initiator.get('type', ''),
+            '_fromCache': self._cache(record, response),
+            '_error': record.get('error'),
+        }
+
+
+def summarize(entries):
+    """
+    Compact per-request records of a test for the session report
+
+    Returns:
+        list: dicts with url, type, status, bytes, time_ms, wait_ms, cache
+    """
+    return [{
+        'url': resource_key(entry['request']['url']),
+        'type': entry['_resourceType'],
+        'status': entry['response']['status'],
+        'bytes': entry['response']['bodySize'],
+        'time_ms': entry['time'],
+        'wait_ms': entry['timings']['wait'],
+        'cache': entry['_fromCache'],
+    } for entry in entries]
+
+
+def budget_breach(entries, budget_kb=None, slow_ms=None):
+    """
+    Check a test's requests against the network budget
+
+    Args:
+        entries (list): HAR entries of the test
+        budget_kb (float): Transfer budget, uses config default if None (0 = unlimited)
+        slow_ms (float): Slowest allowed request, uses config default if None (0 = unlimited)
+
+    Returns:
+        str: Why the budget was broken, None if within it
+    """
+    budget_kb = Config.NETWORK_BUDGET_KB if budget_kb is None else budget_kb
+    slow_ms = Config.NETWORK_SLOW_REQUEST_MS if slow_ms is None else slow_ms
+
+    transferred = sum(entry['response']['bodySize'] for entry in entries) / 1024
+    if budget_kb and transferred > budget_kb:
+        return f"transferred {transferred:.0f} KiB (budget {budget_kb:g} KiB)"
+    if slow_ms:
+        slowest = max(entries, key=lambda entry: entry['time'], default=None)
+        if slowest and slowest['time'] > slow_ms:
+            return f"{slowest['request']['url']} took {slowest['time']:.0f} ms (limit {slow_ms:g} ms)"
+    return None
+
+
+def write_har(entries, test_name="test"):
+    """
+    Write a test's requests as a HAR file in reports/har
+
+    Returns:
+        str: Path to the HAR file
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(Config.HAR_PATH, f"{test_name}_{timestamp}.har")
+    os.makedirs(Config.HAR_PATH, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'log': {
+            'version': '1.2',
+            'creator': {'name': 'mathsteam-regression', 'version': '1.0'},
+            'pages': [],
+            'entries': entries,
+        }}, f, separators=(',', ':'))
+    return path
+
+
+class NetworkReport:
+    """Session-wide aggregation of per-test requests by resource"""
+
+    def __init__(self):
+        self.tests = {}
+
+    def add(self, nodeid, resources):
+        """Store the requests of a finished test (a rerun replaces earlier attempts)"""
+        if resources:
+            self.tests[nodeid] = resources
+
+    def resources(self):
+        """
+        Per-resource totals across the session
+
+        Returns:
+            dict: url -> requests, cached, tests, max_bytes, total_bytes, mean_ms, max_ms, mean_wait_ms
+        """
+        totals = {}
+        for resources in self.tests.values():
+            for url in {resource['url'] for resource in resources}:
+                totals.setdefault(url, {'tests': 0})['tests'] += 1
+            for resource in resources:
+                total = totals[resource['url']]
+                total.setdefault('type', resource['type'])
+                total['requests'] = total.get('requests', 0) + 1
+                if resource['cache']:
+                    total['cached'] = total.get('cached', 0) + 1
+                    continue
+                # Timing and size of network fetches only; cache hits would flatter them
+                total['total_bytes'] = total.get('total_bytes', 0) + resource['bytes']
+                total['max_bytes'] = max(total.get('max_bytes', 0), resource['bytes'])
+                total.setdefault('times', []).append(resource['time_ms'])
+                total.setdefault('waits', []).append(resource['wait_ms'])
+
+        for total in totals.values():
+            total.setdefault('cached', 0)
+            times, waits = total.pop('times', []), total.pop('waits', [])
+            total['mean_ms'] = round(sum(times) / len(times), 1) if times else None
+            total['max_ms'] = round(max(times), 1) if times else None
+            total['mean_wait_ms'] = round(sum(waits) / len(waits), 1) if waits else None
+            total.setdefault('total_bytes', 0)
+            total.setdefault('max_bytes', 0)
+        return totals
+
+    def heaviest(self, limit=10):
+        """(url, totals) pairs with the largest single transfer"""
+        ranked = sorted(self.resources().items(), key=lambda item: item[1]['max_bytes'], reverse=True)
+        return [item for item in ranked if item[1]['max_bytes']][:limit]
+
+    def slowest(self, limit=10):
+        """(url, totals) pairs with the slowest mean fetch"""
+        fetched = [item for item in self.resources().items() if item[1]['mean_ms'] is not None]
+        return sorted(fetched, key=lambda item: item[1]['mean_ms'], reverse=True)[:limit]
+
+    def save(self, path=None):
+        """Write the per-resource totals as JSON"""
+        path = path or Config.NETWORK_REPORT_PATH
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'tests': len(self.tests), 'resources': self.resources()}, f,
+                      indent=2, sort_keys=True)
+        return path
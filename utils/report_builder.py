@@ -0,0 +1,395 @@
+"""
+Static HTML report from the streamed JSONL results
+
+Reads ``reports/results.jsonl`` (written by ``utils/result_sink.py``) in one
+pass and writes a self-contained site: an index with the run summary, a
+per-module table, the slowest tests and a search box, numbered pages of
+``REPORT_PAGE_SIZE`` tests each, and a failures page. Only one page of tests
+and the aggregates are held in memory, so runs of any size can be rendered.
+Optionally writes a Markdown summary in the format of
+LAPORAN_TESTING_REGRESSION_MATHSTEAM.md.
+
+Usage:
+    python -m utils.report_builder [results.jsonl] [--out DIR] [--page-size N] [--markdown FILE]
+"""
+import argparse
+import heapq
+import json
+import os
+from html import escape
+from config.config import Config
+
+# Rows of the slowest-tests tables
+SLOWEST_LIMIT = 20
+
+# Failures listed in the Markdown summary (all of them are on failures.html)
+MARKDOWN_FAILURE_LIMIT = 100
+
+OUTCOME_LABELS = {
+    'passed': '✅ PASS',
+    'failed': '❌ FAIL',
+    'error': '❌ ERROR',
+    'skipped': '⏭️ SKIP',
+    'xfailed': '⚠️ XFAIL',
+    'xpassed': '⚠️ XPASS',
+    'rerun': '🔁 RERUN',
+}
+
+STYLE = """
+body { font-family: -apple-system, Segoe UI, Roboto, sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; width: 100%; margin: 1em 0; font-size: 14px; }
+th, td { border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+th { background: #f3f3f3; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+.passed { color: #1a7f37; } .failed, .error { color: #cf222e; }
+.skipped, .xfailed, .xpassed, .rerun { color: #9a6700; }
+pre { white-space: pre-wrap; font-size: 12px; background: #f6f8fa; padding: 8px; }
+nav a { margin-right: 1em; }
+#search { width: 100%; padding: 6px; font-size: 14px; }
+"""
+
+SEARCH_SCRIPT = """
+<input id="search" placeholder="Cari test (nodeid / outcome)...">
+<ul id="matches"></ul>
+<script src="search.js"></script>
+<script>
+document.getElementById('search').addEventListener('input', function () {
+  var query = this.value.toLowerCase(), list = document.getElementById('matches');
+  list.innerHTML = '';
+  if (query.length < 2) return;
+  var shown = 0;
+  for (var i = 0; i < REPORT_INDEX.length && shown < 100; i++) {
+    var entry = REPORT_INDEX[i];
+    if ((entry[0] + ' ' + entry[1]).toLowerCase().indexOf(query) < 0) continue;
+    var item = document.createElement('li'), link = document.createElement('a');
+    link.href = entry[2] + '#t' + entry[3];
+    link.textContent = entry[0] + ' (' + entry[1] + ')';
+    item.appendChild(link);
+    list.appendChild(item);
+    shown++;
+  }
+});
+</script>
+"""
+
+
+def read_records(path):
+    """
+    Yield the records of a results file, skipping a torn last line
+
+    Args:
+        path (str): JSONL file written by ResultSink
+
+    Yields:
+        dict: session, test and summary records in file order
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Interrupted run: the last line may be partial
+                continue
+
+
+def failure_message(longrepr):
+    """First assertion/exception line ("E   ...") of a failure, else its last line"""
+    lines = (longrepr or '').strip().splitlines()
+    for line in lines:
+        if line.startswith('E '):
+            return line[1:].strip()
+    return lines[-1] if lines else ''
+
+
+def page_name(number):
+    return f"tests-{number:04d}.html"
+
+
+def _document(title, body):
+    return (f"<!DOCTYPE html>\n<html lang=\"id\"><head><meta charset=\"utf-8\">"
+            f"<title>{escape(title)}</title><style>{STYLE}</style></head>\n"
+            f"<body>\n<h1>{escape(title)}</h1>\n{body}\n</body></html>\n")
+
+
+def _seconds(value):
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def _outcome(outcome):
+    return f"<span class=\"{escape(outcome)}\">{escape(OUTCOME_LABELS.get(outcome, outcome))}</span>"
+
+
+class ReportBuilder:
+    """Renders a results stream into paginated static HTML (and Markdown)"""
+
+    def __init__(self, out_dir=None, page_size=None):
+        """
+        Args:
+            out_dir (str): Output directory, uses config default if None
+            page_size (int): Tests per page, uses config default if None
+        """
+        self.out_dir = out_dir or Config.STATIC_REPORT_PATH
+        self.page_size = page_size or Config.REPORT_PAGE_SIZE
+        self.session = {}
+        self.summary = None
+        self.counts = {}
+        self.modules = {}
+        self.slowest = []
+        self.failures = []
+        self.pages = 0
+        self.total = 0
+        self._rows = []
+
+    def build(self, results_path, markdown_path=None):
+        """
+        Render a results file
+
+        Args:
+            results_path (str): JSONL results of a run
+            markdown_path (str): Also write the Markdown summary here if given
+
+        Returns:
+            str: Path of the index page
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        with open(self._path('search.js'), 'w', encoding='utf-8') as search, \
+                open(self._path('failures.html.part'), 'w', encoding='utf-8') as failures:
+            search.write("var REPORT_INDEX = [\n")
+            for record in read_records(results_path):
+                kind = record.get('type')
+                if kind == 'session':
+                    self.session = record
+                elif kind == 'summary':
+                    self.summary = record
+                elif kind == 'test':
+                    self._add(record, search, failures)
+            self._write_page(last=True)
+            search.write("];\n")
+        self._write_failures()
+
+        index = self._path('index.html')
+        with open(index, 'w', encoding='utf-8') as f:
+            f.write(_document("Laporan Testing Regression", self._index_body()))
+        if markdown_path:
+            self.write_markdown(markdown_path)
+        return index
+
+    def _path(self, name):
+        return os.path.join(self.out_dir, name)
+
+    def _add(self, record, search, failures):
+        # A full page is written once the next test arrives, so it knows it has a successor
+        if len(self._rows) == self.page_size:
+            self._write_page()
+        self.total += 1
+        outcome = record.get('outcome', 'passed')
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+        module = record['nodeid'].split('::')[0]
+        stats = self.modules.setdefault(module, {'tests': 0, 'duration': 0.0, 'page': self.pages + 1})
+        stats['tests'] += 1
+        stats[outcome] = stats.get(outcome, 0) + 1
+        stats['duration'] += record.get('duration', 0)
+
+        entry = (record.get('duration', 0), self.total, record['nodeid'])
+        if len(self.slowest) < SLOWEST_LIMIT:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+        page = page_name(self.pages + 1)
+        search.write(json.dumps([record['nodeid'], outcome, page, self.total]) + ",\n")
+        if outcome in ('failed', 'error'):
+            failures.write(self._failure_row(record, page))
+            if len(self.failures) < MARKDOWN_FAILURE_LIMIT:
+                self.failures.append((record['nodeid'], outcome, record.get('failure_category'),
+                                      failure_message(record.get('longrepr'))))
+        self._rows.append(self._test_row(record))
+
+    def _test_row(self, record):
+        number = self.total
+        phases = record.get('phases', {})
+        phase_text = " / ".join(f"{name} {_seconds(phases[name]['duration'])}"
+                                for name in ('setup', 'call', 'teardown') if name in phases)
+        metrics = record.get('metrics', {})
+        metric_text = []
+        if metrics.get('commands'):
+            metric_text.append(f"{metrics['commands']['commands']} commands")
+        if metrics.get('memory'):
+            memory = metrics['memory']
+            metric_text.append(f"RSS {memory.get('rss_mb') or '-'} MB, heap {memory.get('heap_mb') or '-'} MB")
+        if metrics.get('requests'):
+            metric_text.append(f"{metrics['requests']} requests, "
+                               f"{(metrics.get('transfer_bytes') or 0) / 1024:.0f} KiB")
+        if record.get('network_profile') not in (None, 'none'):
+            metric_text.append(f"profile {record['network_profile']}")
+        artifacts = " ".join(
+            f"<a href=\"{escape(os.path.relpath(artifact['path'], self.out_dir))}\">{escape(artifact['kind'])}</a>"
+            for artifact in record.get('artifacts') or [])
+        detail = record.get('longrepr') or record.get('skip_reason')
+        if detail:
+            detail = f"<details><summary>detail</summary><pre>{escape(detail)}</pre></details>"
+        return (f"<tr id=\"t{number}\"><td class=\"num\">{number}</td>"
+                f"<td>{escape(record['nodeid'])}{detail or ''}</td>"
+                f"<td>{_outcome(record.get('outcome', 'passed'))}</td>"
+                f"<td class=\"num\">{_seconds(record.get('duration'))}</td>"
+                f"<td>{escape(phase_text)}</td><td>{escape('; '.join(metric_text))}</td>"
+                f"<td>{artifacts}</td></tr>\n")
+
+    def _failure_row(self, record, page):
+        return (f"<tr><td><a href=\"{page}#t{self.total}\">{escape(record['nodeid'])}</a></td>"
+                f"<td>{escape(record.get('failure_category') or '-')}</td>"
+                f"<td><pre>{escape(record.get('longrepr') or '')}</pre></td></tr>\n")
+
+    def _write_page(self, last=False):
+        if not self._rows:
+            return
+        self.pages += 1
+        links = ["<a href=\"index.html\">Ringkasan</a>"]
+        if self.pages > 1:
+            links.append(f"<a href=\"{page_name(self.pages - 1)}\">&laquo; Sebelumnya</a>")
+        if not last:
+            links.append(f"<a href=\"{page_name(self.pages + 1)}\">Berikutnya &raquo;</a>")
+        nav = f"<nav>{''.join(links)}</nav>"
+        table = ("<table><tr><th>#</th><th>Test</th><th>Status</th><th>Durasi (s)</th>"
+                 "<th>Fase (s)</th><th>Metrik</th><th>Artefak</th></tr>\n"
+                 + "".join(self._rows) + "</table>")
+        with open(self._path(page_name(self.pages)), 'w', encoding='utf-8') as f:
+            f.write(_document(f"Hasil Test - Halaman {self.pages}", f"{nav}\n{table}\n{nav}"))
+        self._rows = []
+
+    def _write_failures(self):
+        part = self._path('failures.html.part')
+        with open(self._path('failures.html'), 'w', encoding='utf-8') as f, \
+                open(part, encoding='utf-8') as rows:
+            f.write("<!DOCTYPE html>\n<html lang=\"id\"><head><meta charset=\"utf-8\">"
+                    f"<title>Test Gagal</title><style>{STYLE}</style></head>\n<body>\n"
+                    "<h1>Test Gagal</h1>\n<nav><a href=\"index.html\">Ringkasan</a></nav>\n"
+                    "<table><tr><th>Test</th><th>Kategori</th><th>Error</th></tr>\n")
+            for row in rows:
+                f.write(row)
+            f.write("</table>\n</body></html>\n")
+        os.remove(part)
+
+    def success_rate(self):
+        """Passed tests over executed (not skipped) tests, in percent"""
+        executed = self.total - self.counts.get('skipped', 0) - self.counts.get('rerun', 0)
+        return 100.0 * self.counts.get('passed', 0) / executed if executed else 0.0
+
+    def _index_body(self):
+        failed = self.counts.get('failed', 0) + self.counts.get('error', 0)
+        duration = self.summary['duration'] if self.summary else None
+        info = [
+            ("Tanggal", self.session.get('started', '-')),
+            ("Website Target", self.session.get('base_url', '-')),
+            ("Browser", f"{self.session.get('browser', '-')}"
+                        f"{' (headless)' if self.session.get('headless') else ''}"),
+            ("Durasi", f"{duration:.1f} s" if duration is not None else "run tidak selesai"),
+            ("Total Test", self.total),
+            ("Success Rate", f"{self.success_rate():.1f}%"),
+        ] + [(OUTCOME_LABELS.get(outcome, outcome), count) for outcome, count in sorted(self.counts.items())]
+        body = ["<table>" + "".join(f"<tr><th>{escape(str(key))}</th><td>{escape(str(value))}</td></tr>"
+                                    for key, value in info) + "</table>"]
+
+        body.append(f"<h2>Cari</h2>{SEARCH_SCRIPT}")
+        nav = " ".join(f"<a href=\"{page_name(number)}\">{number}</a>" for number in range(1, self.pages + 1))
+        body.append(f"<h2>Halaman</h2><nav>{nav}</nav>")
+        if failed:
+            body.append(f"<p><a href=\"failures.html\">{failed} test gagal &raquo;</a></p>")
+
+        rows = "".join(
+            f"<tr><td><a href=\"{page_name(stats['page'])}\">{escape(module)}</a></td>"
+            f"<td class=\"num\">{stats['tests']}</td><td class=\"num\">{stats.get('passed', 0)}</td>"
+            f"<td class=\"num\">{stats.get('failed', 0) + stats.get('error', 0)}</td>"
+            f"<td class=\"num\">{stats.get('skipped', 0)}</td>"
+            f"<td class=\"num\">{_seconds(stats['duration'])}</td></tr>"
+            for module, stats in sorted(self.modules.items()))
+        body.append("<h2>Hasil per Modul</h2><table><tr><th>Modul</th><th>Tests</th><th>Passed</th>"
+                    f"<th>Failed</th><th>Skipped</th><th>Durasi (s)</th></tr>{rows}</table>")
+
+        rows = "".join(
+            f"<tr><td><a href=\"{page_name((number - 1) // self.page_size + 1)}#t{number}\">"
+            f"{escape(nodeid)}</a></td><td class=\"num\">{_seconds(duration)}</td></tr>"
+            for duration, number, nodeid in sorted(self.slowest, reverse=True))
+        body.append(f"<h2>Test Terlambat</h2><table><tr><th>Test</th><th>Durasi (s)</th></tr>{rows}</table>")
+        return "\n".join(body)
+
+    def write_markdown(self, path):
+        """
+        Write the run summary in the format of the LAPORAN report
+
+        Args:
+            path (str): Markdown file to write
+        """
+        failed = self.counts.get('failed', 0) + self.counts.get('error', 0)
+        duration = self.summary['duration'] if self.summary else None
+        status = ("✅ SEMUA TESTING BERHASIL" if not failed and self.total
+                  else f"❌ {failed} TEST GAGAL")
+        lines = [
+            "# LAPORAN TESTING REGRESSION",
+            "## Website MathsTeam menggunakan Selenium WebDriver",
+            "", "---", "",
+            "### INFORMASI EKSEKUSI", "",
+            f"**Tanggal:** {self.session.get('started', '-')}  ",
+            f"**Website Target:** {self.session.get('base_url', '-')}  ",
+            f"**Browser:** {self.session.get('browser', '-')}  ",
+            f"**Durasi Testing:** {f'{duration / 60:.1f} menit' if duration is not None else 'run tidak selesai'}  ",
+            "", "---", "",
+            "## RINGKASAN EKSEKUTIF", "",
+            "### Hasil Testing:",
+            f"- **Total Test Cases:** {self.total - self.counts.get('rerun', 0)}",
+            f"- **Passed:** {self.counts.get('passed', 0)}",
+            f"- **Failed:** {failed}",
+            f"- **Skipped:** {self.counts.get('skipped', 0)}",
+            f"- **Success Rate:** {self.success_rate():.1f}%",
+            "", f"### Status: {status}",
+            "", "---", "",
+            "## HASIL PER MODUL", "",
+            "| Modul | Jumlah Tests | Passed | Failed | Status |",
+            "|-------|--------------|--------|--------|--------|",
+        ]
+        for module, stats in sorted(self.modules.items()):
+            module_failed = stats.get('failed', 0) + stats.get('error', 0)
+            lines.append(f"| {module} | {stats['tests']} | {stats.get('passed', 0)} | {module_failed} | "
+                         f"{OUTCOME_LABELS['failed'] if module_failed else OUTCOME_LABELS['passed']} |")
+
+        if self.failures:
+            lines += ["", "## TEST GAGAL", "",
+                      "| Test Case | Kategori | Actual Result | Status |",
+                      "|-----------|----------|---------------|--------|"]
+            for nodeid, outcome, category, message in self.failures:
+                message = message.replace('|', '\\|')
+                lines.append(f"| {nodeid} | {category or '-'} | {message} | {OUTCOME_LABELS[outcome]} |")
+            if failed > len(self.failures):
+                lines.append(f"\n_...dan {failed - len(self.failures)} test gagal lainnya "
+                             "(lihat failures.html)._")
+
+        lines += ["", "## TEST TERLAMBAT", "",
+                  "| Test Case | Durasi (s) |",
+                  "|-----------|------------|"]
+        lines += [f"| {nodeid} | {duration:.2f} |" for duration, _, nodeid in sorted(self.slowest, reverse=True)]
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def main():
+    """Build the static report from a results file"""
+    parser = argparse.ArgumentParser(description="Static HTML report from streamed JSONL results")
+    parser.add_argument('results', nargs='?', default=Config.RESULTS_JSONL_PATH,
+                        help="JSONL results file (default: RESULTS_JSONL_PATH)")
+    parser.add_argument('--out', default=Config.STATIC_REPORT_PATH, help="Output directory")
+    parser.add_argument('--page-size', type=int, default=Config.REPORT_PAGE_SIZE, help="Tests per page")
+    parser.add_argument('--markdown', default=None, help="Also write a Markdown summary to this file")
+    args = parser.parse_args()
+
+    builder = ReportBuilder(args.out, args.page_size)
+    index = builder.build(args.results, args.markdown)
+    print(f"{builder.total} tests on {builder.pages} pages: {index}")
+    if args.markdown:
+        print(f"Markdown summary: {args.markdown}")
+
+
+if __name__ == '__main__':
+    main()
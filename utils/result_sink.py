@@ -0,0 +1,145 @@
+"""
+Streaming JSONL result sink
+
+Writes one JSON line per finished test attempt (outcome, phases, timings,
+metrics, artifact paths) as soon as its teardown is reported, plus a session
+header and a summary line. Only tests still running are held in memory, so
+the file is complete up to the last finished test even if the run is killed,
+and ``utils/report_builder.py`` can turn it into a report in one pass.
+
+Record types:
+    session  - first line: run id, start time, target, browser, environment, command line
+    test     - one per attempt (reruns are separate attempts)
+    summary  - last line: outcome counts, duration, exit status
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from config.config import Config
+
+# Failure text kept per test; full tracebacks belong in the terminal output
+MAX_LONGREPR = 8000
+
+# Outcome of an attempt from its phases, most severe first
+OUTCOME_ORDER = ('failed', 'error', 'rerun', 'skipped', 'xfailed', 'xpassed', 'passed')
+
+
+def _phase_outcome(report):
+    if hasattr(report, 'wasxfail'):
+        return 'xfailed' if report.skipped else 'xpassed'
+    if report.failed and report.when != 'call':
+        return 'error'
+    return report.outcome
+
+
+class ResultSink:
+    """Appends test results to a JSONL file as they finish"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): JSONL file location, uses config default if None
+        """
+        self.path = path or Config.RESULTS_JSONL_PATH
+        self.counts = {}
+        self._pending = {}
+        self._file = None
+        self._started = None
+
+    def open(self, base_url=None):
+        """Start a new result file with the session header"""
+        import platform
+        import socket
+        import uuid
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Line buffered: every record is on disk once written
+        self._file = open(self.path, 'w', encoding='utf-8', buffering=1)
+        self._started = time.time()
+        self._write({
+            'type': 'session',
+            'run_id': uuid.uuid4().hex,
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'base_url': base_url or Config.BASE_URL,
+            'browser': Config.BROWSER,
+            'headless': Config.HEADLESS,
+            'args': sys.argv[1:],
+            'environment': {
+                'name': Config.RUN_ENVIRONMENT or None,
+                'host': socket.gethostname(),
+                'python': platform.python_version(),
+                'platform': platform.platform(terse=True),
+                'driver_backend': Config.DRIVER_BACKEND,
+                'ci': bool(os.getenv('CI')),
+            },
+        })
+        return self
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+
+    def add(self, report):
+        """
+        Record one phase report; the test's line is written at its teardown
+
+        Args:
+            report (TestReport): Report from pytest_runtest_logreport
+        """
+        if self._file is None:
+            return
+        record = self._pending.setdefault(report.nodeid, {
+            'type': 'test',
+            'nodeid': report.nodeid,
+            'phases': {},
+        })
+        outcome = _phase_outcome(report)
+        record['phases'][report.when] = {'outcome': outcome, 'duration': round(report.duration, 3)}
+        if report.failed or outcome == 'rerun':
+            record['longrepr'] = report.longreprtext[:MAX_LONGREPR]
+            record.setdefault('failure_category', getattr(report, 'failure_category', None))
+        if report.skipped and not hasattr(report, 'wasxfail') and isinstance(report.longrepr, tuple):
+            record['skip_reason'] = report.longrepr[2]
+
+        if report.when == 'call':
+            record['network_profile'] = getattr(report, 'network_profile', None)
+            record['benchmark'] = getattr(report, 'benchmark_stats', None)
+        if report.when == 'teardown':
+            self._finish(self._pending.pop(report.nodeid), report)
+
+    def _finish(self, record, report):
+        phases = record['phases']
+        outcomes = [phase['outcome'] for phase in phases.values()]
+        record['outcome'] = next((outcome for outcome in OUTCOME_ORDER if outcome in outcomes), 'passed')
+        record['duration'] = round(sum(phase['duration'] for phase in phases.values()), 3)
+        record['finished'] = datetime.now().isoformat(timespec='seconds')
+        record['markers'] = getattr(report, 'markers', None)
+        record['artifacts'] = getattr(report, 'artifacts', None)
+
+        commands = getattr(report, 'command_stats', None)
+        resources = getattr(report, 'network_resources', None)
+        metrics = {
+            'commands': commands and {key: commands[key] for key in ('commands', 'time', 'bytes')},
+            'memory': getattr(report, 'browser_memory', None),
+            'page_timing': getattr(report, 'page_timing', None),
+            'requests': resources and len(resources),
+            'transfer_bytes': resources and sum(resource['bytes'] for resource in resources),
+        }
+        record['metrics'] = {key: value for key, value in metrics.items() if value is not None} or None
+        self.counts[record['outcome']] = self.counts.get(record['outcome'], 0) + 1
+        self._write({key: value for key, value in record.items() if value is not None})
+
+    def close(self, exitstatus=None):
+        """Write the summary line and close the file"""
+        if self._file is None:
+            return
+        self._write({
+            'type': 'summary',
+            'finished': datetime.now().isoformat(timespec='seconds'),
+            'duration': round(time.time() - self._started, 3),
+            'counts': self.counts,
+            'exitstatus': int(exitstatus) if exitstatus is not None else None,
+        })
+        self._file.close()
+        self._file = None
@@ -0,0 +1,148 @@
+"""
+Retry helpers for transient Selenium errors
+
+Action-level retries run inside BasePage (re-locate and try again); failures
+that survive them are classified here so conftest can decide whether a test
+rerun on a warm driver is worthwhile.
+"""
+import time
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    TimeoutException,
+)
+from config.config import Config
+
+# Errors worth retrying the same action for: the element is there but the DOM
+# shifted under us (re-render, overlay, animation)
+ACTION_RETRY_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+# Failure categories, checked in order (subclasses before base classes)
+FAILURE_CATEGORIES = (
+    (StaleElementReferenceException, 'stale'),
+    (ElementClickInterceptedException, 'intercepted'),
+    (ElementNotInteractableException, 'not_interactable'),
+    (TimeoutException, 'timeout'),
+)
+
+# Categories worth a test rerun. A timeout is how a real locator or page
+# regression fails too, so rerunning it would only double the wait
+RERUN_CATEGORIES = ('stale', 'intercepted', 'not_interactable')
+
+# Per-locator action retry statistics for the current process
+LOCATOR_STATS = {}
+
+
+def classify_failure(exception):
+    """
+    Classify an exception as a transient Selenium failure
+
+    Args:
+        exception (BaseException): Exception raised by a test
+
+    Returns:
+        str: Failure category (stale, intercepted, not_interactable, timeout),
+            or None if the failure is not considered transient
+    """
+    for exception_type, category in FAILURE_CATEGORIES:
+        if isinstance(exception, exception_type):
+            return category
+    return None
+
+
+def rerun_exception_names():
+    """Exception class names passed to pytest-rerunfailures ``only_rerun``"""
+    return [exception_type.__name__ for exception_type, category in FAILURE_CATEGORIES
+            if category in RERUN_CATEGORIES]
+
+
+def locator_key(locator):
+    """Stable string key for a (By, value) locator tuple"""
+    return f"{locator[0]}={locator[1]}"
+
+
+def _record(locator, field):
+    stats = LOCATOR_STATS.setdefault(
+        locator_key(locator), {'retries': 0, 'recovered': 0, 'failed': 0}
+    )
+    stats[field] += 1
+
+
+def retry_action(action, locator, retries=None, delay=None):
+    """
+    Run an element action, retrying transient DOM errors
+
+    Args:
+        action (callable): Zero-argument callable that locates and acts on the element
+        locator (tuple): Locator used by the action, for statistics
+        retries (int): Extra attempts, uses config default if None
+        delay (float): Base delay between attempts in seconds (doubles each retry)
+
+    Returns:
+        Any: Result of the action
+    """
+    retries = Config.ACTION_RETRIES if retries is None else retries
+    delay = Config.ACTION_RETRY_DELAY if delay is None else delay
+
+    for attempt in range(retries + 1):
+        try:
+            result = action()
+        except ACTION_RETRY_EXCEPTIONS:
+            if attempt == retries:
+                _record(locator, 'failed')
+                raise
+            _record(locator, 'retries')
+            time.sleep(delay * (2 ** attempt))
+        else:
+            if attempt:
+                _record(locator, 'recovered')
+            return result
+
+
+async def async_retry_action(action, locator, retries=None, delay=None):
+    """
+    Async counterpart of ``retry_action`` for ``AsyncBasePage``
+
+    Args:
+        action (callable): Zero-argument coroutine function that locates and acts on the element
+        locator (tuple): Locator used by the action, for statistics
+        retries (int): Extra attempts, uses config default if None
+        delay (float): Base delay between attempts in seconds (doubles each retry)
+
+    Returns:
+        Any: Result of the action
+    """
+    retries = Config.ACTION_RETRIES if retries is None else retries
+    delay = Config.ACTION_RETRY_DELAY if delay is None else delay
+
+    for attempt in range(retries + 1):
+        try:
+            result = await action()
+        except ACTION_RETRY_EXCEPTIONS:
+            if attempt == retries:
+                _record(locator, 'failed')
+                raise
+            _record(locator, 'retries')
+            import asyncio
+            await asyncio.sleep(delay * (2 ** attempt))
+        else:
+            if attempt:
+                _record(locator, 'recovered')
+            return result
+
+
+def drain_locator_stats():
+    """
+    Return and reset collected locator statistics
+
+    Returns:
+        dict: Locator key -> retry counters
+    """
+    stats = dict(LOCATOR_STATS)
+    LOCATOR_STATS.clear()
+    return stats
@@ -0,0 +1,410 @@
+"""
+Run history database (SQLite) with a query CLI
+
+Each session's streamed results (``reports/results.jsonl``, see
+``utils/result_sink.py``) are ingested into ``reports/history.db`` at the end
+of the run: one row per run (start, duration, browser, base URL, environment,
+outcome counts) and one row per test attempt (outcome, phase durations,
+failure category and message), with the test's markers in their own table.
+Scheduling and quarantine features can query the same store through
+``RunHistory``.
+
+Usage:
+    python -m utils.run_history runs
+    python -m utils.run_history slowest --days 7 --limit 20
+    python -m utils.run_history flaky --days 30
+    python -m utils.run_history trend test_valid_login --factor 2
+    python -m utils.run_history failures --days 14
+    python -m utils.run_history ingest reports/results.jsonl
+"""
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from statistics import median
+from config.config import Config
+from utils.report_builder import failure_message, read_records
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    uid TEXT UNIQUE NOT NULL,
+    started TEXT NOT NULL,
+    finished TEXT,
+    duration REAL,
+    base_url TEXT,
+    browser TEXT,
+    headless INTEGER,
+    environment TEXT,
+    platform TEXT,
+    args TEXT,
+    exitstatus INTEGER,
+    total INTEGER,
+    passed INTEGER,
+    failed INTEGER,
+    skipped INTEGER,
+    reruns INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    test_name TEXT NOT NULL,
+    module TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL,
+    setup_duration REAL,
+    call_duration REAL,
+    teardown_duration REAL,
+    failure_category TEXT,
+    message TEXT,
+    network_profile TEXT,
+    finished TEXT
+);
+CREATE TABLE IF NOT EXISTS result_markers (
+    result_id INTEGER NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+    marker TEXT NOT NULL,
+    PRIMARY KEY (marker, result_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_results_nodeid ON results(nodeid, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_test_name ON results(test_name, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_outcome ON results(outcome, run_id);
+"""
+
+# Consecutive runs compared on each side of a duration change
+TREND_WINDOW = 3
+
+
+def function_name(nodeid):
+    """Test function name without class, module or parameters"""
+    return nodeid.split('::')[-1].split('[')[0]
+
+
+def since(days):
+    """ISO timestamp `days` ago, comparable with runs.started (local time)"""
+    return (datetime.now() - timedelta(days=days)).isoformat(timespec='seconds')
+
+
+class RunHistory:
+    """SQLite store of past runs and their test results"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Database file, uses config default if None
+        """
+        self.path = path or Config.RUN_HISTORY_PATH
+        self._db = None
+
+    @property
+    def db(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # Runs on several machines may share the file; wait for their writes
+            self._db = sqlite3.connect(self.path, timeout=30)
+            self._db.row_factory = sqlite3.Row
+            self._db.execute("PRAGMA foreign_keys = ON")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def ingest(self, results_path):
+        """
+        Store a run from its JSONL results (a run already stored is skipped)
+
+        Args:
+            results_path (str): JSONL file written by ResultSink
+
+        Returns:
+            int: Test attempts stored, 0 if the run was already in the database
+        """
+        records = read_records(results_path)
+        session = next(records, None)
+        if not session or session.get('type') != 'session':
+            raise ValueError(f"{results_path} does not start with a session record")
+        # Files from before runs carried an id are keyed by their start time
+        uid = session.get('run_id') or f"{session['started']}@{session.get('base_url')}"
+
+        with self.db:
+            if self.db.execute("SELECT 1 FROM runs WHERE uid = ?", (uid,)).fetchone():
+                return 0
+            environment = session.get('environment') or {}
+            run_id = self.db.execute(
+                "INSERT INTO runs (uid, started, base_url, browser, headless, environment, platform, args) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (uid, session['started'], session.get('base_url'), session.get('browser'),
+                 session.get('headless'), environment.get('name'), environment.get('platform'),
+                 json.dumps(session.get('args', []))),
+            ).lastrowid
+
+            attempts = {}
+            summary = None
+            for record in records:
+                if record.get('type') == 'summary':
+                    summary = record
+                elif record.get('type') == 'test':
+                    nodeid = record['nodeid']
+                    attempts[nodeid] = attempts.get(nodeid, 0) + 1
+                    self._insert_result(run_id, record, attempts[nodeid])
+
+            counts = self.db.execute(
+                "SELECT COUNT(DISTINCT nodeid) total, "
+                "SUM(outcome = 'passed') passed, SUM(outcome IN ('failed', 'error')) failed, "
+                "SUM(outcome = 'skipped') skipped, SUM(outcome = 'rerun') reruns "
+                "FROM results WHERE run_id = ?", (run_id,)).fetchone()
+            self.db.execute(
+                "UPDATE runs SET finished = ?, duration = ?, exitstatus = ?, "
+                "total = ?, passed = ?, failed = ?, skipped = ?, reruns = ? WHERE id = ?",
+                ((summary or {}).get('finished'), (summary or {}).get('duration'),
+                 (summary or {}).get('exitstatus'), counts['total'], counts['passed'] or 0,
+                 counts['failed'] or 0, counts['skipped'] or 0, counts['reruns'] or 0, run_id))
+        return sum(attempts.values())
+
+    def _insert_result(self, run_id, record, attempt):
+        phases = record.get('phases', {})
+        nodeid = record['nodeid']
+        result_id = self.db.execute(
+            "INSERT INTO results (run_id, nodeid, test_name, module, attempt, outcome, duration, "
+            "setup_duration, call_duration, teardown_duration, failure_category, message, "
+            "network_profile, finished) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run_id, nodeid, function_name(nodeid), nodeid.split('::')[0], attempt,
+             record.get('outcome', 'passed'), record.get('duration'),
+             *(phases.get(phase, {}).get('duration') for phase in ('setup', 'call', 'teardown')),
+             record.get('failure_category'),
+             failure_message(record.get('longrepr')) if record.get('longrepr') else None,
+             record.get('network_profile'), record.get('finished')),
+        ).lastrowid
+        self.db.executemany("INSERT OR IGNORE INTO result_markers (result_id, marker) VALUES (?, ?)",
+                            [(result_id, marker) for marker in record.get('markers') or []])
+
+    def runs(self, limit=10):
+        """Most recent runs, newest first"""
+        return self.db.execute(
+            "SELECT * FROM runs ORDER BY started DESC LIMIT ?", (limit,)).fetchall()
+
+    def slowest(self, days=7, limit=20, marker=None):
+        """
+        Tests with the slowest mean call duration over passed attempts
+
+        Args:
+            days (float): Look back this many days
+            limit (int): Number of tests returned
+            marker (str): Only tests with this marker (e.g. smoke)
+
+        Returns:
+            list: rows of nodeid, runs, mean, max (seconds)
+        """
+        marker_filter = ("AND r.id IN (SELECT result_id FROM result_markers WHERE marker = :marker)"
+                         if marker else "")
+        return self.db.execute(
+            "SELECT r.nodeid, COUNT(*) runs, AVG(r.call_duration) mean, MAX(r.call_duration) max "
+            "FROM results r JOIN runs ON runs.id = r.run_id "
+            f"WHERE runs.started >= :since AND r.outcome = 'passed' {marker_filter} "
+            "GROUP BY r.nodeid ORDER BY mean DESC LIMIT :limit",
+            {'since': since(days), 'limit': limit, 'marker': marker}).fetchall()
+
+    def flake_rates(self, days=30, min_runs=1, nodeid=None):
+        """
+        Per-test flakiness over runs
+
+        A run is flaky for a test when it failed at least once and then passed
+        on rerun; it failed when the test never passed in that run.
+
+        Returns:
+            list: rows of nodeid, runs, flaky, failed, flake_rate, fail_rate,
+            most flaky first
+        """
+        return self.db.execute(
+            "SELECT nodeid, COUNT(*) runs, SUM(retried AND passed) flaky, SUM(NOT passed AND failed) failed, "
+            "1.0 * SUM(retried AND passed) / COUNT(*) flake_rate, "
+            "1.0 * SUM(NOT passed AND failed) / COUNT(*) fail_rate "
+            "FROM (SELECT r.nodeid, MAX(r.outcome = 'rerun') retried, MAX(r.outcome = 'passed') passed, "
+            "      MAX(r.outcome IN ('failed', 'error', 'rerun')) failed "
+            "      FROM results r JOIN runs ON runs.id = r.run_id "
+            "      WHERE runs.started >= :since AND r.outcome != 'skipped' "
+            "      AND (:nodeid IS NULL OR r.nodeid = :nodeid) "
+            "      GROUP BY r.run_id, r.nodeid) "
+            # Sums spelled out: a bare "failed" here is the subquery's column, not the total
+            "GROUP BY nodeid HAVING COUNT(*) >= :min_runs "
+            "AND (SUM(retried AND passed) > 0 OR SUM(NOT passed AND failed) > 0) "
+            "ORDER BY flake_rate DESC, fail_rate DESC, runs DESC",
+            {'since': since(days), 'min_runs': min_runs, 'nodeid': nodeid}).fetchall()
+
+    def durations(self, test, days=90):
+        """
+        Passed call durations of a test per run, oldest first
+
+        Args:
+            test (str): Node id, or a test function name matching all its variants
+
+        Returns:
+            list: rows of started, run uid, base_url, browser, nodeid, call_duration
+        """
+        column = 'nodeid' if '::' in test else 'test_name'
+        return self.db.execute(
+            "SELECT runs.started, runs.uid, runs.base_url, runs.browser, r.nodeid, r.call_duration "
+            "FROM results r JOIN runs ON runs.id = r.run_id "
+            f"WHERE r.{column} = ? AND runs.started >= ? AND r.outcome = 'passed' "
+            "ORDER BY runs.started, r.nodeid",
+            (test, since(days))).fetchall()
+
+    def duration_change(self, test, factor=2.0, days=90, window=TREND_WINDOW):
+        """
+        First run from which a test got `factor` times slower (or faster) and stayed so
+
+        The median of `window` runs before each point is compared with the
+        median of `window` runs from it, per node id.
+
+        Returns:
+            list: dicts of nodeid, started, uid, before, after, ratio (one per
+            node id that changed)
+        """
+        series = {}
+        for row in self.durations(test, days):
+            if row['call_duration'] is not None:
+                series.setdefault(row['nodeid'], []).append(row)
+
+        changes = []
+        for nodeid, rows in series.items():
+            values = [row['call_duration'] for row in rows]
+            for index in range(window, len(values) - window + 1):
+                before = median(values[index - window:index])
+                after = median(values[index:index + window])
+                ratio = after / before if before else None
+                if ratio and (ratio >= factor or ratio <= 1 / factor):
+                    changes.append({'nodeid': nodeid, 'started': rows[index]['started'],
+                                    'uid': rows[index]['uid'], 'before': before,
+                                    'after': after, 'ratio': ratio})
+                    break
+        return changes
+
+    def failure_trend(self, days=14):
+        """
+        Failures per day and by failure category
+
+        Returns:
+            tuple: (rows of day, runs, tests, failed; rows of category, failures, tests)
+        """
+        by_day = self.db.execute(
+            "SELECT substr(runs.started, 1, 10) day, COUNT(DISTINCT runs.id) runs, "
+            "COUNT(DISTINCT r.run_id || ' ' || r.nodeid) tests, "
+            "COUNT(DISTINCT CASE WHEN r.outcome IN ('failed', 'error') THEN r.run_id || ' ' || r.nodeid END) failed "
+            "FROM results r JOIN runs ON runs.id = r.run_id WHERE runs.started >= ? "
+            "GROUP BY day ORDER BY day", (since(days),)).fetchall()
+        by_category = self.db.execute(
+            "SELECT COALESCE(r.failure_category, 'unclassified') category, COUNT(*) failures, "
+            "COUNT(DISTINCT r.nodeid) tests "
+            "FROM results r JOIN runs ON runs.id = r.run_id "
+            "WHERE runs.started >= ? AND r.outcome IN ('failed', 'error', 'rerun') "
+            "GROUP BY category ORDER BY failures DESC", (since(days),)).fetchall()
+        return by_day, by_category
+
+
+def _print_runs(history, args):
+    print(f"{'started':19}  {'browser':8} {'total':>5} {'pass':>5} {'fail':>5} {'skip':>5} "
+          f"{'rerun':>5} {'time (s)':>9}  environment / base url")
+    for run in history.runs(args.limit):
+        print(f"{run['started']:19}  {run['browser'] or '-':8} {run['total'] or 0:5d} {run['passed']:5d} "
+              f"{run['failed']:5d} {run['skipped']:5d} {run['reruns']:5d} "
+              f"{run['duration'] or 0:9.1f}  {run['environment'] or '-'} {run['base_url'] or ''}")
+
+
+def _print_slowest(history, args):
+    print(f"{'mean (s)':>9} {'max (s)':>9} {'runs':>5}  test")
+    for row in history.slowest(args.days, args.limit, args.marker):
+        print(f"{row['mean']:9.2f} {row['max']:9.2f} {row['runs']:5d}  {row['nodeid']}")
+
+
+def _print_flaky(history, args):
+    print(f"{'flake %':>8} {'fail %':>7} {'flaky':>6} {'failed':>6} {'runs':>5}  test")
+    for row in history.flake_rates(args.days, args.min_runs)[:args.limit]:
+        print(f"{row['flake_rate'] * 100:8.1f} {row['fail_rate'] * 100:7.1f} {row['flaky']:6d} "
+              f"{row['failed']:6d} {row['runs']:5d}  {row['nodeid']}")
+
+
+def _print_trend(history, args):
+    rows = history.durations(args.test, args.days)
+    if not rows:
+        print(f"No passed runs of {args.test} in the last {args.days:g} days")
+        return
+    for row in rows:
+        print(f"{row['started']:19}  {row['call_duration'] or 0:8.2f} s  {row['nodeid']}")
+    changes = history.duration_change(args.test, args.factor, args.days)
+    if not changes:
+        print(f"\nNo {args.factor:g}x change in duration")
+    for change in changes:
+        print(f"\n{change['nodeid']}: {change['ratio']:.2f}x since the run started {change['started']} "
+              f"(median {change['before']:.2f} s -> {change['after']:.2f} s)")
+
+
+def _print_failures(history, args):
+    by_day, by_category = history.failure_trend(args.days)
+    print(f"{'day':10}  {'runs':>5} {'tests':>6} {'failed':>6} {'fail %':>7}")
+    for row in by_day:
+        rate = 100.0 * row['failed'] / row['tests'] if row['tests'] else 0.0
+        print(f"{row['day']:10}  {row['runs']:5d} {row['tests']:6d} {row['failed']:6d} {rate:7.1f}")
+    print(f"\n{'category':20} {'failures':>8} {'tests':>6}")
+    for row in by_category:
+        print(f"{row['category']:20} {row['failures']:8d} {row['tests']:6d}")
+
+
+def _ingest(history, args):
+    for path in args.files:
+        stored = history.ingest(path)
+        print(f"{path}: {stored} test attempts stored" if stored else f"{path}: already stored")
+
+
+def main():
+    """Query the run history"""
+    parser = argparse.ArgumentParser(description="Query the test run history database")
+    parser.add_argument('--db', default=Config.RUN_HISTORY_PATH, help="History database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('runs', help="Recent runs")
+    command.add_argument('--limit', type=int, default=10)
+    command.set_defaults(handler=_print_runs)
+
+    command = commands.add_parser('slowest', help="Slowest tests by mean call duration")
+    command.add_argument('--days', type=float, default=7)
+    command.add_argument('--limit', type=int, default=20)
+    command.add_argument('--marker', default=None, help="Only tests with this marker (e.g. smoke)")
+    command.set_defaults(handler=_print_slowest)
+
+    command = commands.add_parser('flaky', help="Flake and failure rate by test")
+    command.add_argument('--days', type=float, default=30)
+    command.add_argument('--limit', type=int, default=20)
+    command.add_argument('--min-runs', type=int, default=Config.FLAKY_MIN_RUNS)
+    command.set_defaults(handler=_print_flaky)
+
+    command = commands.add_parser('trend', help="Duration of a test per run and when it changed")
+    command.add_argument('test', help="Node id or test function name (e.g. test_valid_login)")
+    command.add_argument('--days', type=float, default=90)
+    command.add_argument('--factor', type=float, default=2.0, help="Change reported at this ratio")
+    command.set_defaults(handler=_print_trend)
+
+    command = commands.add_parser('failures', help="Failures per day and by category")
+    command.add_argument('--days', type=float, default=14)
+    command.set_defaults(handler=_print_failures)
+
+    command = commands.add_parser('ingest', help="Store runs from JSONL result files")
+    command.add_argument('files', nargs='+')
+    command.set_defaults(handler=_ingest)
+
+    args = parser.parse_args()
+    history = RunHistory(args.db)
+    try:
+        args.handler(history, args)
+    finally:
+        history.close()
+
+
+if __name__ == '__main__':
+    main()
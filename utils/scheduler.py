@@ -0,0 +1,147 @@
+"""
+Duration-aware test scheduling for xdist workers and CI shards
+
+Tests are packed into units: a test on its own, or every test sharing a
+class/module-scoped fixture (``class_driver``, an authenticated session, ...)
+so that fixture is built once on one worker. Units are assigned longest
+processing time first (LPT) using historical durations, which keeps workers
+and shards finishing together. Shard assignment is deterministic, so N CI
+nodes running ``--shard i/N`` over the same durations file split the suite
+without overlap.
+"""
+import json
+import os
+from config.config import Config
+
+# Fixture scopes whose instances are shared between tests (and worth keeping together)
+SHARED_SCOPES = ('class', 'module', 'package')
+
+# Prefix of the xdist_group names given to fixture groups
+GROUP_PREFIX = 'fixture-group:'
+
+
+def parse_shard(value):
+    """
+    Parse a ``--shard`` value
+
+    Args:
+        value (str): Shard spec ``i/N`` with 1 <= i <= N
+
+    Returns:
+        tuple: (index, total), index 1-based
+    """
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N (e.g. 2/4)")
+    if not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {total}")
+    return index, total
+
+
+def shared_scope_node(item):
+    """
+    Node id of the narrowest class/module/package scope whose fixtures the test uses
+
+    Returns:
+        str: Scope node id (e.g. ``tests/test_x.py::TestX``), None if the test
+        only uses function- and session-scoped fixtures
+    """
+    # A class's readonly_session tests share one driver through a class-scoped fixture
+    if item.cls is not None and item.get_closest_marker('readonly_session'):
+        return item.nodeid.rsplit('::', 1)[0]
+
+    fixture_defs = getattr(item, '_fixtureinfo', None)
+    if fixture_defs is None:
+        return None
+
+    scopes = set()
+    for name in item.fixturenames:
+        for fixture_def in fixture_defs.name2fixturedefs.get(name, ()):
+            if fixture_def.scope in SHARED_SCOPES:
+                scopes.add(fixture_def.scope)
+
+    # Narrowest shared scope wins: a class fixture pins the class, not the module
+    module_id = item.nodeid.split('::', 1)[0]
+    if 'class' in scopes and item.cls is not None:
+        return item.nodeid.rsplit('::', 1)[0]
+    if scopes:
+        return module_id
+    return None
+
+
+def build_units(items, durations):
+    """
+    Group items into scheduling units
+
+    Args:
+        items (list): Collected pytest items
+        durations (DurationStore): Historical durations
+
+    Returns:
+        list: Units as dicts {key, items, seconds}, in first-seen order
+    """
+    units = {}
+    for item in items:
+        key = shared_scope_node(item) or item.nodeid
+        unit = units.setdefault(key, {'key': key, 'items': [], 'seconds': 0.0})
+        unit['items'].append(item)
+        # Incrementally skipped tests finish immediately
+        if not getattr(item, 'incremental_skip', False):
+            unit['seconds'] += durations.estimate(item.nodeid)
+    return list(units.values())
+
+
+def lpt_order(units):
+    """Units longest first (ties broken by key, so the order is deterministic)"""
+    return sorted(units, key=lambda unit: (-unit['seconds'], unit['key']))
+
+
+def assign_shards(units, total):
+    """
+    Assign units to shards, longest first, always to the least loaded shard
+
+    Args:
+        units (list): Scheduling units
+        total (int): Number of shards
+
+    Returns:
+        list: ``total`` shards as dicts {index, seconds, units}
+    """
+    shards = [{'index': index + 1, 'seconds': 0.0, 'units': []} for index in range(total)]
+    for unit in lpt_order(units):
+        target = min(shards, key=lambda shard: (shard['seconds'], shard['index']))
+        target['units'].append(unit)
+        target['seconds'] += unit['seconds']
+    return shards
+
+
+def group_name(key):
+    """xdist_group name for a fixture group"""
+    return GROUP_PREFIX + key.replace('::', '.')
+
+
+def write_manifest(shards, path=None):
+    """
+    Write the shard manifest (which tests each shard runs and its expected time)
+
+    Args:
+        shards (list): Shards from ``assign_shards``
+        path (str): JSON file location, uses config default if None
+
+    Returns:
+        str: Path of the written manifest
+    """
+    path = path or Config.SHARD_MANIFEST_PATH
+    manifest = {
+        'total': len(shards),
+        'shards': [{
+            'index': shard['index'],
+            'estimated_seconds': round(shard['seconds'], 1),
+            'tests': [item.nodeid for unit in shard['units'] for item in unit['items']],
+        } for shard in shards],
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return path
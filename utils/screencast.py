@@ -0,0 +1,249 @@
+"""
+Failure-only screencast of a test's last seconds
+
+Chrome/Edge push low-resolution JPEG frames (CDP ``Page.startScreencast``)
+over a separate DevTools websocket whenever the page repaints; they are kept
+in a ring buffer covering the last few seconds. Only when the test fails is
+the buffer encoded into a small animated GIF (needs Pillow; without it the
+frames are written as numbered JPEGs). Passing tests just drop the buffer, so
+the steady-state cost is a background thread and a few MB of memory.
+"""
+import base64
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from urllib.parse import urlsplit
+from config.config import Config
+
+# Capabilities carrying the DevTools address of a local Chromium browser
+DEBUGGER_CAPABILITIES = ('goog:chromeOptions', 'ms:edgeOptions')
+
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+# How long the last frame stays on screen in the GIF (ms)
+LAST_FRAME_MS = 1000
+
+
+class FrameBuffer:
+    """Ring buffer of (timestamp, jpeg bytes) frames covering the last seconds"""
+
+    def __init__(self, seconds, max_frames):
+        """
+        Args:
+            seconds (float): Time span kept, older frames are dropped
+            max_frames (int): Hard cap on buffered frames
+        """
+        self.seconds = seconds
+        self.frames = deque(maxlen=max_frames)
+        self._lock = threading.Lock()
+
+    def add(self, timestamp, data):
+        """Append a frame and drop the ones that fell out of the time window"""
+        with self._lock:
+            self.frames.append((timestamp, data))
+            while self.frames and self.frames[0][0] < timestamp - self.seconds:
+                self.frames.popleft()
+
+    def snapshot(self):
+        """Buffered frames, oldest first"""
+        with self._lock:
+            return list(self.frames)
+
+    def clear(self):
+        with self._lock:
+            self.frames.clear()
+
+
+def debugger_address(driver):
+    """
+    host:port of a local Chromium browser's DevTools endpoint
+
+    Returns:
+        str: Address, None for other browsers or remote sessions
+    """
+    capabilities = getattr(driver, 'capabilities', None) or {}
+    for key in DEBUGGER_CAPABILITIES:
+        address = (capabilities.get(key) or {}).get('debuggerAddress')
+        if address and urlsplit(f"//{address}").hostname in LOCAL_HOSTS:
+            return address
+    return None
+
+
+def page_websocket_url(address, target_id):
+    """
+    DevTools websocket URL of a page target
+
+    Args:
+        address (str): DevTools host:port
+        target_id (str): Target id (ChromeDriver window handles are target ids)
+
+    Returns:
+        str: Websocket URL, None if the target is not listed
+    """
+    from urllib.request import urlopen
+
+    with urlopen(f"http://{address}/json/list", timeout=5) as response:
+        targets = json.load(response)
+    for target in targets:
+        if target.get('id') == target_id:
+            return target.get('webSocketDebuggerUrl')
+    return None
+
+
+def encode_frames(frames, path):
+    """
+    Write frames as an animated GIF, or as numbered JPEGs without Pillow
+
+    Args:
+        frames (list): (timestamp, jpeg bytes) tuples, oldest first
+        path (str): File path without extension
+
+    Returns:
+        str: GIF path, or the directory holding the JPEG frames
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        os.makedirs(path, exist_ok=True)
+        for index, (_, data) in enumerate(frames):
+            with open(os.path.join(path, f"{index:04d}.jpg"), 'wb') as f:
+                f.write(data)
+        return path
+
+    import io
+    images = [Image.open(io.BytesIO(data)).convert('P', palette=Image.ADAPTIVE)
+              for _, data in frames]
+    # Frames arrive on repaint: show each until the next one came in
+    durations = [max(int((later[0] - earlier[0]) * 1000), 20)
+                 for earlier, later in zip(frames, frames[1:])] + [LAST_FRAME_MS]
+    gif_path = f"{path}.gif"
+    images[0].save(gif_path, save_all=True, append_images=images[1:],
+                   duration=durations, loop=0, optimize=True)
+    return gif_path
+
+
+class Screencast:
+    """Streams a page's screencast frames into a ring buffer on a background thread"""
+
+    def __init__(self, driver, seconds=None, max_size=None, quality=None, max_frames=None):
+        """
+        Args:
+            driver (WebDriver): Local Chrome/Edge driver, focused on the page to record
+            seconds (float): Seconds of history kept, uses config default if None
+            max_size (int): Longest frame side in pixels, uses config default if None
+            quality (int): JPEG quality 0-100, uses config default if None
+            max_frames (int): Buffered frame cap, uses config default if None
+        """
+        self.driver = driver
+        self.max_size = Config.SCREENCAST_MAX_SIZE if max_size is None else max_size
+        self.quality = Config.SCREENCAST_QUALITY if quality is None else quality
+        self.buffer = FrameBuffer(
+            Config.SCREENCAST_SECONDS if seconds is None else seconds,
+            Config.SCREENCAST_MAX_FRAMES if max_frames is None else max_frames)
+        self._socket = None
+        self._thread = None
+        self._running = False
+        # Message ids; sent from the test thread and the receiving thread
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    def supported(driver):
+        """True for local Chrome/Edge drivers exposing a DevTools address"""
+        return debugger_address(driver) is not None
+
+    def start(self):
+        """
+        Connect to the page's DevTools websocket and start the screencast
+
+        Returns:
+            Screencast: self
+
+        Raises:
+            RuntimeError: If the current window is not a listed DevTools target
+        """
+        import websocket
+
+        url = page_websocket_url(debugger_address(self.driver), self.driver.current_window_handle)
+        if url is None:
+            raise RuntimeError("current window is not a DevTools page target")
+
+        # No Origin header: Chrome rejects websocket origins it wasn't started with
+        self._socket = websocket.create_connection(url, timeout=5, suppress_origin=True)
+        self._socket.settimeout(1)
+        self._send('Page.startScreencast', {
+            'format': 'jpeg',
+            'quality': self.quality,
+            'maxWidth': self.max_size,
+            'maxHeight': self.max_size,
+        })
+        self._running = True
+        self._thread = threading.Thread(target=self._receive, name='screencast', daemon=True)
+        self._thread.start()
+        return self
+
+    def _send(self, method, params=None):
+        self._socket.send(json.dumps({'id': next(self._ids), 'method': method, 'params': params or {}}))
+
+    def _receive(self):
+        import websocket
+
+        while self._running:
+            try:
+                message = json.loads(self._socket.recv())
+            except websocket.WebSocketTimeoutException:
+                continue
+            except (websocket.WebSocketException, OSError, ValueError):
+                break
+            if message.get('method') != 'Page.screencastFrame':
+                continue
+
+            params = message['params']
+            self.buffer.add(params['metadata'].get('timestamp', time.time()), base64.b64decode(params['data']))
+            try:
+                # Chrome sends the next frame only after the previous one is acked
+                self._send('Page.screencastFrameAck', {'sessionId': params['sessionId']})
+            except (websocket.WebSocketException, OSError):
+                break
+
+    def stop(self):
+        """Stop the screencast and close the websocket, keeping the buffered frames"""
+        if self._socket is None:
+            return
+        self._running = False
+        try:
+            self._send('Page.stopScreencast')
+        except Exception:
+            pass
+        if self._thread:
+            self._thread.join(timeout=2)
+        try:
+            self._socket.close()
+        except Exception:
+            pass
+        self._socket = None
+        self._thread = None
+
+    def save(self, test_name="test"):
+        """
+        Encode the buffered frames into reports/screencasts
+
+        Args:
+            test_name (str): Name of the test for the filename
+
+        Returns:
+            str: Path written, None if no frame was captured
+        """
+        frames = self.buffer.snapshot()
+        if not frames:
+            return None
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(Config.SCREENCASTS_PATH, exist_ok=True)
+        return encode_frames(frames, os.path.join(Config.SCREENCASTS_PATH, f"{test_name}_{timestamp}"))
+
+    def discard(self):
+        """Drop the buffered frames"""
+        self.buffer.clear()
@@ -0,0 +1,119 @@
+"""
+One browser shared by a class's ``readonly_session`` tests
+
+Read-only tests (page checks, content assertions without logging in,
+resizing the window or timing a cold load) don't need a fresh browser each.
+The shared driver is reset between tests (cookies, storage, window size,
+about:blank); when a test leaves state the reset cannot
+undo - another origin's cookies, extra windows, a failure mid-flow - or the
+memory watchdog flags the browser as bloated, the driver is replaced before
+the next test.
+"""
+from urllib.parse import urlsplit
+from utils.driver_manager import DriverManager
+
+# URL schemes of blank pages that carry no site state
+BLANK_SCHEMES = ('about', 'data', 'chrome', 'edge')
+
+
+def origin_of(url):
+    """scheme://host[:port] of a URL (a leading www. is ignored)"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"{parts.scheme}://{host}".lower()
+
+
+class ReadonlySession:
+    """Hands out one shared driver and recycles it when a test dirties state"""
+
+    def __init__(self, driver_manager, base_url):
+        """
+        Args:
+            driver_manager (DriverManager): Manager creating and quitting drivers
+            base_url (str): Application URL; leaving its origin counts as a mutation
+        """
+        self.manager = driver_manager
+        self.origin = origin_of(base_url)
+        self.driver = None
+        self.window_size = None
+        self.reused = 0
+        self.recycled = []
+
+    def acquire(self):
+        """Return the shared driver, starting it on first use"""
+        if self.driver is None:
+            self.driver = self.manager.get_driver()
+            self.window_size = self.driver.get_window_size()
+        else:
+            self.reused += 1
+            # Screenshots on failure go through the manager's current driver
+            self.manager.driver = self.driver
+        return self.driver
+
+    def mutation(self):
+        """
+        Describe state the between-test reset cannot undo
+
+        Returns:
+            str: Reason the driver is dirty, None if it can be reused
+        """
+        if len(self.driver.window_handles) > 1:
+            return "test opened extra windows"
+
+        url = self.driver.current_url
+        if urlsplit(url).scheme not in BLANK_SCHEMES and origin_of(url) != self.origin:
+            # Cookies of other origins survive delete_all_cookies on ours
+            return f"test left {self.origin} for {origin_of(url)}"
+        return None
+
+    def release(self, nodeid, failed=False):
+        """
+        Reset the driver after a test, or quit it if the test dirtied state
+
+        Args:
+            nodeid (str): Test that just used the driver
+            failed (bool): Whether the test failed (state unknown, always recycled)
+
+        Returns:
+            str: Why the driver was recycled, None if it stays shared
+        """
+        if self.driver is None:
+            return None
+
+        try:
+            reason = "test failed" if failed else self.mutation()
+            if reason is None:
+                memory = self.manager.watchdog.verdict(self.driver)
+                reason = memory and f"memory: {memory}"
+            if reason is None:
+                self.driver.delete_all_cookies()
+                if self.driver.get_cookies():
+                    reason = "cookies survived the reset"
+                else:
+                    DriverManager.reset_state(self.driver)
+                    self._restore_window_size()
+        except Exception as e:
+            reason = f"reset failed: {e}"
+
+        if reason is None:
+            return None
+
+        self.recycled.append((nodeid, reason))
+        self.close()
+        return reason
+
+    def _restore_window_size(self):
+        """Put the window back to its size when the driver started"""
+        size = self.driver.get_window_size()
+        if (size['width'], size['height']) != (self.window_size['width'], self.window_size['height']):
+            self.driver.set_window_size(self.window_size['width'], self.window_size['height'])
+
+    def close(self):
+        """Quit the shared driver"""
+        if self.driver is None:
+            return
+        self.manager.driver = self.driver
+        self.manager.quit_driver()
+        self.driver = None
@@ -0,0 +1,285 @@
+"""
+Deterministic local stand-in for the MathsTeam site
+
+Serves a home page, a login form, a session-protected dashboard and logout
+with fixed per-route latencies and a fixed client-side render delay, so
+framework overhead (driver setup, waits, page objects) can be measured
+without the noise of the real site or the network.
+
+Usage:
+    python -m utils.stand_in_server --port 8765
+"""
+import argparse
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from config.config import Config
+
+# Server-side latency of each route in seconds
+ROUTE_LATENCIES = {
+    '/': 0.05,
+    '/login': 0.08,
+    '/dashboard': 0.12,
+    '/logout': 0.02,
+}
+
+SESSION_COOKIE = 'standin_session'
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<meta name="csrf-token" content="{token}">
+<title>{title} - MathsTeam</title>
+</head>
+<body>
+<nav class="navbar">
+  <a class="logo" href="/">MathsTeam</a>
+  <ul class="navbar-nav">{menu}</ul>
+</nav>
+<main class="main-content">
+{content}
+</main>
+<footer class="footer">&copy; MathsTeam stand-in</footer>
+</body>
+</html>
+"""
+
+HOME = """<h1 class="page-title">Belajar Matematika bersama MathsTeam</h1>
+<p class="welcome">Selamat datang</p>"""
+
+LOGIN = """<h1 class="page-title">Login</h1>
+{error}
+<form method="post" action="/login">
+  <input type="hidden" name="_token" value="{token}">
+  <input type="email" id="email" name="email" required>
+  <input type="password" id="password" name="password" required>
+  <button type="submit" class="btn-login">Login</button>
+</form>"""
+
+LOGIN_ERROR = '<div class="alert alert-danger">Email atau password salah</div>'
+
+DASHBOARD = """<h1 class="dashboard-title">Dashboard</h1>
+<div class="user-profile"><span class="user-name">{email}</span></div>
+<div id="cards"></div>
+<script>
+  // Client-side render after a fixed delay, like the real dashboard's widgets
+  setTimeout(function () {{
+    var cards = document.getElementById('cards');
+    for (var i = 1; i <= 4; i++) {{
+      var card = document.createElement('div');
+      card.className = 'card';
+      card.innerHTML = '<span class="stat">' + (i * 10) + '</span>';
+      cards.appendChild(card);
+    }}
+  }}, {render_delay_ms});
+</script>"""
+
+
+def _menu(logged_in):
+    items = ['<li class="nav-item"><a href="/">Beranda</a></li>']
+    if logged_in:
+        items.append('<li class="nav-item"><a href="/dashboard">Dashboard</a></li>')
+        items.append('<li class="nav-item"><a href="/logout">Logout</a></li>')
+    else:
+        items.append('<li class="nav-item"><a href="/login">Login</a></li>')
+    return ''.join(items)
+
+
+class StandInServer:
+    """Serves the stand-in site with fixed latencies in a background thread"""
+
+    def __init__(self, host='127.0.0.1', port=None, latencies=None, render_delay=0.2,
+                 email=None, password=None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to listen on (0 picks a free port), config default if None
+            latencies (dict): Route -> seconds, merged over ROUTE_LATENCIES
+            render_delay (float): Seconds before dashboard cards are rendered client-side
+            email (str): Accepted login email, uses config default if None
+            password (str): Accepted login password, uses config default if None
+        """
+        self.host = host
+        self.port = Config.STAND_IN_PORT if port is None else port
+        self.latencies = dict(ROUTE_LATENCIES, **(latencies or {}))
+        self.render_delay = render_delay
+        self.email = email or Config.LOGIN_EMAIL
+        self.password = password or Config.LOGIN_PASSWORD
+        self.sessions = {}
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL with trailing slash, usable as ``BASE_URL``"""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """Start serving in a background thread"""
+        server = self
+
+        class Handler(_StandInRequestHandler):
+            pass
+        Handler.server_state = server
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        # Pick up the real port when 0 was requested
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def login(self, email, password):
+        """Open a session for valid credentials, returns the session id or None"""
+        if email != self.email or password != self.password:
+            return None
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self.sessions[session_id] = email
+        return session_id
+
+    def logout(self, session_id):
+        """Close a session"""
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def user(self, session_id):
+        """Email of a session, None if not logged in"""
+        with self._lock:
+            return self.sessions.get(session_id)
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the stand-in site"""
+
+    server_state = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Keep test output clean
+        pass
+
+    def do_HEAD(self):
+        self._handle('HEAD')
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def _handle(self, method):
+        state = self.server_state
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip('/') or '/'
+        with state._lock:
+            state.requests += 1
+
+        latency = state.latencies.get(path)
+        if latency is None:
+            return self._respond(404, self._page('Not Found', '<h1>404</h1>', False), method)
+        time.sleep(latency)
+
+        session_id = self._session_id()
+        user = state.user(session_id)
+
+        if path == '/':
+            return self._respond(200, self._page('Beranda', HOME, user is not None), method)
+
+        if path == '/login' and method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            form = parse_qs(self.rfile.read(length).decode('utf-8'))
+            new_session = state.login(form.get('email', [''])[0], form.get('password', [''])[0])
+            if new_session is None:
+                return self._redirect('/login?error=1')
+            return self._redirect('/dashboard', cookie=f"{SESSION_COOKIE}={new_session}; Path=/")
+
+        if path == '/login':
+            if user is not None:
+                return self._redirect('/dashboard')
+            error = LOGIN_ERROR if 'error' in parse_qs(parts.query) else ''
+            content = LOGIN.format(error=error, token=secrets.token_hex(8))
+            return self._respond(200, self._page('Login', content, False), method)
+
+        if path == '/dashboard':
+            if user is None:
+                return self._redirect('/login')
+            content = DASHBOARD.format(email=user,
+                                       render_delay_ms=int(state.render_delay * 1000))
+            return self._respond(200, self._page('Dashboard', content, True), method)
+
+        if path == '/logout':
+            state.logout(session_id)
+            return self._redirect('/', cookie=f"{SESSION_COOKIE}=; Path=/; Max-Age=0")
+
+    def _session_id(self):
+        for part in (self.headers.get('Cookie') or '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    @staticmethod
+    def _page(title, content, logged_in):
+        return LAYOUT.format(title=title, content=content, menu=_menu(logged_in),
+                             token=secrets.token_hex(8))
+
+    def _respond(self, status, body, method='GET'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if method != 'HEAD':
+            self.wfile.write(data)
+
+    def _redirect(self, location, cookie=None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        if cookie:
+            self.send_header('Set-Cookie', cookie)
+        self.end_headers()
+
+
+def main():
+    """Run the stand-in site until interrupted"""
+    parser = argparse.ArgumentParser(description="Deterministic local stand-in for MathsTeam")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=Config.STAND_IN_PORT)
+    parser.add_argument('--render-delay', type=float, default=0.2,
+                        help="Seconds before dashboard widgets render")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port, render_delay=args.render_delay).start()
+    print(f"Stand-in site listening on {server.url} (login {server.email})")
+
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        print("Stopping stand-in site")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()